@@ -0,0 +1,54 @@
+"""Measures the cost of building creatures one at a time with make_creature in a fresh interpreter that never imports NumPy, as a process that only
+plays scalar battles does, and in one that imported NumPy first. Both should cost about the same. Run from the repository root with:
+
+    python benchmarks/creature_construction.py [n_creatures]
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CONSTRUCTION = """
+import sys
+from timeit import repeat
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+entry = CreatureDex(_CREATUREDEX_PATH).get('Bulbasaur')
+movelist = MoveList(_MOVE_LIST_PATH)
+moves = (movelist.get('Tackle'), movelist.get('Growl'), movelist.get('Vine Whip'), None)
+ivs, evs = IndividualValues.make_zero(), EffortValues.make_zero()
+def build():
+    # Different levels so the build cache does not hand out the same stats every time
+    return [entry.make_creature(1 + n % 100, ivs, evs, CreatureNatureEnum.BASHFUL, moves) for n in range({n_creatures})]
+seconds = min(repeat(build, number=1, repeat=3)) / {n_creatures}
+print(seconds * 1e6, 'numpy' in sys.modules)
+"""
+
+
+def construction_us(n_creatures: int, import_numpy: bool) -> tuple:
+    """Builds creatures in a fresh interpreter.
+
+    Returns:
+        tuple: Microseconds per creature, and whether NumPy was imported
+    """
+    code = ("import numpy\n" if import_numpy else "") + CONSTRUCTION.format(n_creatures=n_creatures)
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    microseconds, numpy_imported = result.stdout.split()
+    return float(microseconds), numpy_imported == "True"
+
+
+def main():
+    n_creatures = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    scalar, numpy_imported = construction_us(n_creatures, False)
+    with_numpy, _ = construction_us(n_creatures, True)
+    print(f"make_creature without NumPy: {scalar:.2f} us per creature (NumPy imported: {numpy_imported})")
+    print(f"make_creature with NumPy:    {with_numpy:.2f} us per creature ({scalar / with_numpy:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compares building random creatures one at a time with make_creature against building them in bulk with make_creatures. Run from the repository root
+with:
+
+    python benchmarks/creature_factory.py [n_creatures]
+"""
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from creature_combat.creature.creature_factory import make_creatures
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+
+
+def main():
+    n_creatures = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    entry = CreatureDex(_CREATUREDEX_PATH).get('Bulbasaur')
+    movelist = MoveList(_MOVE_LIST_PATH)
+    moves = (movelist.get('Tackle'), movelist.get('Growl'), movelist.get('Vine Whip'), None)
+    natures = list(CreatureNatureEnum)
+
+    def one_at_a_time():
+        return [entry.make_creature(50, IndividualValues.make_random(), EffortValues.make_random(), natures[n % len(natures)], moves)
+                for n in range(n_creatures)]
+
+    def bulk():
+        return make_creatures(entry, n_creatures, moves, rng=0)
+
+    single = min(repeat(one_at_a_time, number=1, repeat=3)) / n_creatures
+    batched = min(repeat(bulk, number=1, repeat=3)) / n_creatures
+    print(f"make_creature:  {single * 1e6:.2f} us per creature")
+    print(f"make_creatures: {batched * 1e6:.2f} us per creature ({single / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measures the memory held by each Creature and the time calculate_damage takes per call. Passing the path of another checkout of the repository, i.e.
+one made with git worktree add ../baseline <commit>, measures the bytes per creature of that checkout as well and reports the change between them. Run
+from the repository root with:
+
+    python benchmarks/creature_memory.py [n_creatures] [n_damage_calls] [other_checkout]
+"""
+import subprocess
+import sys
+from pathlib import Path
+from timeit import repeat
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.engine.combat_functions import calculate_damage
+from creature_combat.engine.participant import Participant
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from creature_combat.utils.rng import CombatRNG
+
+# Builds level 50 creatures with random IVs and EVs, cycling through the creatures of the dex, and traces the memory they still hold. Only uses APIs 
+# that older checkouts have as well, so their layouts can be measured the same way
+MEMORY = """
+import gc
+import tracemalloc
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+creaturedex, movelist = CreatureDex(_CREATUREDEX_PATH), MoveList(_MOVE_LIST_PATH)
+entries = [creaturedex.get(name) for name in sorted(creaturedex.available_creature)]
+moves = (movelist.get('Tackle'), movelist.get('Growl'), movelist.get('Scratch'), None)
+natures = list(CreatureNatureEnum)
+gc.collect()
+tracemalloc.start()
+before = tracemalloc.take_snapshot()
+creatures = [entries[n % len(entries)].make_creature(50, IndividualValues.make_random(), EffortValues.make_random(), natures[n % len(natures)], moves)
+             for n in range({n_creatures})]
+gc.collect()
+after = tracemalloc.take_snapshot()
+tracemalloc.stop()
+print(sum(stat.size_diff for stat in after.compare_to(before, 'filename')) / {n_creatures})
+"""
+
+
+def make_creatures(creaturedex: CreatureDex, movelist: MoveList, n_creatures: int) -> list:
+    """Builds n_creatures level 50 creatures with random IVs and EVs, cycling through the creatures of the dex.
+    """
+    entries = [creaturedex.get(name) for name in sorted(creaturedex.available_creature)]
+    moves = (movelist.get('Tackle'), movelist.get('Growl'), movelist.get('Scratch'), None)
+    natures = list(CreatureNatureEnum)
+    return [entries[n % len(entries)].make_creature(50, IndividualValues.make_random(), EffortValues.make_random(), natures[n % len(natures)], moves)
+            for n in range(n_creatures)]
+
+
+def bytes_per_creature(n_creatures: int, checkout: Path=ROOT) -> float:
+    """Traces the memory still allocated after building n_creatures creatures in a fresh interpreter running the code of the checkout.
+    """
+    result = subprocess.run([sys.executable, "-c", MEMORY.format(n_creatures=n_creatures)], cwd=checkout, capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def seconds_per_damage_call(creaturedex: CreatureDex, movelist: MoveList, n_calls: int) -> float:
+    """Times calculate_damage between two participants, taking the best of 5 runs.
+    """
+    attacker, defender = Participant(), Participant()
+    creatures = make_creatures(creaturedex, movelist, 2)
+    attacker.add_creature(creatures[0])
+    defender.add_creature(creatures[1])
+    tackle = movelist.get('Tackle')
+    rng = CombatRNG(0)
+    times = repeat(lambda: calculate_damage(tackle, attacker, defender, rng), number=n_calls, repeat=5)
+    return min(times) / n_calls
+
+
+def main():
+    n_creatures = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    n_calls = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    creaturedex = CreatureDex(_CREATUREDEX_PATH)
+    movelist = MoveList(_MOVE_LIST_PATH)
+    current = bytes_per_creature(n_creatures)
+    print(f"Bytes per creature: {current:,.0f}")
+    if len(sys.argv) > 3:
+        other = bytes_per_creature(n_creatures, Path(sys.argv[3]).resolve())
+        print(f"Bytes per creature in {sys.argv[3]}: {other:,.0f} ({current / other:.2f}x)")
+    print(f"calculate_damage: {seconds_per_damage_call(creaturedex, movelist, n_calls) * 1e6:.2f} us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measures the import time of the scalar engine with python -X importtime and checks that importing it, and playing a battle with it, does not import
+NumPy. Exits with a non zero status when NumPy is imported or the import takes longer than the budget, so it can run as a regression check. Run from the
+repository root with:
+
+    python benchmarks/import_time.py [budget_ms] [n_runs]
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules a scalar battle needs, none of them may import NumPy
+SCALAR_MODULES = ('creature_combat.engine.combat_manager', 'creature_combat.creature.creaturedex', 'creature_combat.moves.move_list',
+                  'creature_combat.creature.individual_values', 'creature_combat.creature.effort_values')
+
+# Plays a short seeded battle after the imports, so lazily imported modules are caught as well
+BATTLE = """
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from demos.demo_players import SuperEffectivePlayer
+dex, moves = CreatureDex(_CREATUREDEX_PATH), MoveList(_MOVE_LIST_PATH)
+def make(name, move):
+    return dex.get(name).make_creature(10, IndividualValues.make_random(), EffortValues.make_random(), CreatureNatureEnum.BASHFUL,
+                                       (moves.get(move), None, None, None))
+player_1, player_2 = SuperEffectivePlayer([make('Bulbasaur', 'Tackle')]), SuperEffectivePlayer([make('Charmander', 'Scratch')])
+manager = CombatManager(rng=0)
+manager.reset(player_1, player_2)
+while len(player_1.alive_creature()) > 0 and len(player_2.alive_creature()) > 0:
+    manager.step_round(player_1, player_2)
+"""
+
+
+def _import_times(code: str) -> dict:
+    """Runs code in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict: Cumulative import time in microseconds of every top level import, by module name, and the names of all imported modules under None
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {None: set()}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[None].add(name.strip())
+        # Top level imports are the ones without indentation, nested imports are already counted in their cumulative time
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def import_time_us(modules: tuple) -> tuple:
+    """Imports the modules in a fresh interpreter with -X importtime, leaving out the modules the interpreter imports on startup.
+
+    Returns:
+        tuple: Summed cumulative import time of the modules in microseconds, and whether NumPy was imported
+    """
+    startup = _import_times("pass")
+    times = _import_times(f"import {', '.join(modules)}")
+    total = sum(cumulative for name, cumulative in times.items() if name is not None and name not in startup)
+    return total, "numpy" in times[None]
+
+
+def battle_imports_numpy() -> bool:
+    """Plays a battle with the scalar engine in a fresh interpreter.
+
+    Returns:
+        bool: Whether NumPy was imported by the end of the battle
+    """
+    code = f"import sys\n{BATTLE}\nprint('numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.strip() == "True"
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 150.0
+    n_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    runs = [import_time_us(SCALAR_MODULES) for _ in range(n_runs)]
+    best_ms = min(total for total, _ in runs) / 1000
+    numpy_ms = min(import_time_us(("numpy",))[0] for _ in range(n_runs)) / 1000
+    numpy_imported = any(imported for _, imported in runs) or battle_imports_numpy()
+    print(f"Scalar engine import: {best_ms:.1f} ms (budget {budget_ms:.0f} ms), NumPy import alone: {numpy_ms:.1f} ms")
+    print(f"NumPy imported by the scalar engine: {numpy_imported}")
+    if numpy_imported or best_ms > budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+
+
+def _format_rate(count: int, elapsed: float) -> str:
+    return f"{count / elapsed:,.0f}" if elapsed > 0 else "-"
+
+
+def simulate(args: argparse.Namespace) -> int:
+    """Runs the simulate command: plays games_per_pairing headless games between every pair of teams of the team file with GreedyPlayers, writes one
+    JSON line per completed chunk of games to the output file as the chunks complete, and reports battles and rounds per second on stderr.
+
+    Args:
+        args (Namespace): Parsed arguments of the simulate command
+
+    Returns:
+        int: Exit code
+    """
+    # Imported here so that argument errors and --help do not load the data or the engine
+    from creature_combat.creature.creaturedex import CreatureDex
+    from creature_combat.creature.team_definitions import load_teams
+    from creature_combat.engine.greedy_player import GreedyPlayer
+    from creature_combat.engine.tournament import Tournament
+    from creature_combat.moves.move_list import MoveList
+
+    creature_dex = CreatureDex(args.creaturedex, lazy=True)
+    move_list = MoveList(args.move_data, lazy=True)
+    try:
+        teams = load_teams(args.teams, creature_dex, move_list)
+    except OSError as error:
+        print(f"creature-combat simulate: cannot read team file {args.teams}: {error.strerror or error}", file=sys.stderr)
+        return 2
+    except (AssertionError, KeyError, TypeError, ValueError) as error:
+        print(f"creature-combat simulate: invalid team file {args.teams}: {error}", file=sys.stderr)
+        return 2
+    if len(teams) < 2:
+        print(f"creature-combat simulate: the team file must define at least 2 teams, found {len(teams)}", file=sys.stderr)
+        return 2
+    team_names = list(teams)
+    tournament = Tournament(list(teams.values()), GreedyPlayer, args.games, args.max_rounds, args.workers, args.chunk_size, args.seed)
+    total_games = tournament.total_games
+    wins = {team_name: 0 for team_name in team_names}
+    games = rounds = 0
+    start = last_report = perf_counter()
+    with open(args.output, 'w') as outfile:
+        for i, j, team_1_wins, team_2_wins, draws, chunk_rounds in tournament.stream():
+            chunk_games = team_1_wins + team_2_wins + draws
+            outfile.write(json.dumps({"team_1": team_names[i], "team_2": team_names[j], "games": chunk_games, "team_1_wins": team_1_wins,
+                                      "team_2_wins": team_2_wins, "draws": draws, "rounds": chunk_rounds}) + "\n")
+            wins[team_names[i]] += team_1_wins
+            wins[team_names[j]] += team_2_wins
+            games += chunk_games
+            rounds += chunk_rounds
+            now = perf_counter()
+            if now - last_report >= args.report_interval and games < total_games:
+                outfile.flush()
+                elapsed = now - start
+                print(f"{games}/{total_games} battles, {_format_rate(games, elapsed)} battles/s, {_format_rate(rounds, elapsed)} rounds/s", file=sys.stderr)
+                last_report = now
+    elapsed = perf_counter() - start
+    print(f"{games} battles, {rounds} rounds in {elapsed:.2f}s, {_format_rate(games, elapsed)} battles/s, {_format_rate(rounds, elapsed)} rounds/s",
+          file=sys.stderr)
+    games_per_team = args.games * (len(teams) - 1)
+    for team_name in sorted(team_names, key=wins.get, reverse=True):
+        print(f"{team_name}: {wins[team_name]}/{games_per_team} wins ({wins[team_name] / games_per_team:.1%})")
+    return 0
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser of the creature-combat command.
+
+    Returns:
+        ArgumentParser: The parser, every command stores its handler as func
+    """
+    parser = argparse.ArgumentParser(prog="creature-combat", description="Open source creature combat engine.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    simulate_parser = commands.add_parser("simulate", help="Play headless battles between every pair of teams of a team file.",
+                                          description="Plays GAMES headless battles between every pair of teams of a team file, streaming the results to "
+                                                      "the output file as JSON lines and reporting battles and rounds per second on stderr.")
+    simulate_parser.add_argument("teams", type=Path, help="JSON object of creature definitions by team name, every definition has a species and "
+                                                          "moves, and optionally a level, nature, ivs and evs")
+    simulate_parser.add_argument("-n", "--games", type=int, default=100, help="Battles per pairing of teams. Defaults to 100.")
+    simulate_parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="Worker processes, 1 plays in process. "
+                                                                                                "Defaults to the number of CPUs.")
+    simulate_parser.add_argument("--chunk-size", type=int, default=None, help="Battles per task sent to a worker. Defaults to about 4 tasks per worker.")
+    simulate_parser.add_argument("--seed", type=int, default=None, help="Seed of the simulation, results only depend on the seed and chunk size.")
+    simulate_parser.add_argument("--max-rounds", type=int, default=1000, help="Rounds before a battle is called a draw. Defaults to 1000.")
+    simulate_parser.add_argument("-o", "--output", type=Path, default=Path("simulation_results.jsonl"),
+                                 help="File the results of every chunk are written to. Defaults to simulation_results.jsonl.")
+    simulate_parser.add_argument("--report-interval", type=float, default=1.0, help="Seconds between throughput reports. Defaults to 1.")
+    simulate_parser.add_argument("--creaturedex", type=Path, default=_CREATUREDEX_PATH, help="Creature data directory.")
+    simulate_parser.add_argument("--move-data", type=Path, default=_MOVE_LIST_PATH, help="Move data directory.")
+    simulate_parser.set_defaults(func=simulate)
+    return parser
+
+
+def main(argv: anno.Optional[anno.Sequence[str]]=None) -> int:
+    """Entry point of the creature-combat command.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): Arguments to parse. Defaults to the arguments of the process.
+
+    Returns:
+        int: Exit code
+    """
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if args.command == "simulate":
+        if args.games < 1:
+            parser.error(f"--games must be positive, provided {args.games}")
+        if args.workers < 1:
+            parser.error(f"--workers must be positive, provided {args.workers}")
+        if args.chunk_size is not None and args.chunk_size < 1:
+            parser.error(f"--chunk-size must be positive, provided {args.chunk_size}")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from collections import OrderedDict
+
+from creature_combat.creature.creature import Creature
+from creature_combat.utils import annotations as anno
+
+# Number of builds the shared cache keeps, enough for every set of a large tournament
+DEFAULT_BUILD_CACHE_SIZE = 4096
+
+
+class CreatureBuildCache:
+    """Bounded least recently used cache of computed creature stats, keyed by build: species, base stats, level, IVs, EVs and nature. Creatures made
+    through the cache share the cached CreatureStats, so rebuilding the same set only allocates its battle state. The hits and misses counters can be used
+    to size the cache.
+    """
+    def __init__(self, maxsize: int=DEFAULT_BUILD_CACHE_SIZE):
+        assert maxsize >= 0, f"Cache size can not be negative, provided {maxsize}"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._stats: OrderedDict[anno.Tuple, anno.CreatureStats] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def get(self, entry: anno.CreatureEntry, level: int, individual_values: anno.IndividualValues, effort_values: anno.EffortValues,
+            nature: anno.CreatureNatureEnum) -> anno.CreatureStats:
+        """Returns the stats of a build, computing and caching them on a miss. When the cache is full the least recently used build is evicted.
+
+        Args:
+            entry (CreatureEntry): Entry of the creature
+            level (int): Level of the creature
+            individual_values (IndividualValues): IVs of the creature
+            effort_values (EffortValues): EVs of the creature
+            nature (CreatureNatureEnum): Nature of the creature
+
+        Returns:
+            CreatureStats: The stats of the build
+        """
+        # Base stats are part of the key, so entries of the same name loaded from different data do not share stats
+        key = (entry.name, entry.base_stats, level, individual_values, effort_values, nature)
+        stats = self._stats.get(key, None)
+        if stats is not None:
+            self.hits += 1
+            self._stats.move_to_end(key)
+            return stats
+        self.misses += 1
+        stats = Creature.compute_stats(entry.base_stats, level, individual_values, effort_values, nature)
+        if self.maxsize > 0:
+            self._stats[key] = stats
+            if len(self._stats) > self.maxsize:
+                self._stats.popitem(last=False)
+        return stats
+
+    def clear(self) -> None:
+        """Removes every cached build and resets the counters."""
+        self._stats.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_DEFAULT_BUILD_CACHE = CreatureBuildCache()
+
+
+def get_build_cache() -> CreatureBuildCache:
+    """Returns the shared CreatureBuildCache used by CreatureEntry.make_creature when no cache is passed.
+
+    Returns:
+        CreatureBuildCache: The shared build cache
+    """
+    return _DEFAULT_BUILD_CACHE
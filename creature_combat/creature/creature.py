@@ -1,14 +1,38 @@
 from __future__ import annotations
-from numpy import array
-from numpy.random import randint
 
+from creature_combat.creature.creature_stats import CreatureStats
 from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+from creature_combat.statuses.status_handlers import NON_VOLATILE_ON_APPLY
 from creature_combat.utils import annotations as anno
 from creature_combat.utils.mappings import NATURE_MODIFIER
 from creature_combat.utils.math_utils import clip
+from creature_combat.utils.zobrist import new_salt, zobrist_keys
+
+# Status enum lookup for the status values stored in battle state snapshots
+_STATUS_BY_VALUE = {status.value: status for status in NonVolatileStatusEnum}
+
+# Number of ints a creature writes to a battle state: current hp, status, status duration, and the remaining pp of each move slot
+CREATURE_STATE_SIZE = 7
+
+
+def zobrist_key_count(max_hp: int, moves: anno.Moves) -> int:
+    """Number of Zobrist keys a creature with the given max hp and moves uses: one per hp value, 16 status keys, 16 duration keys, max_pp + 1 PP keys per
+    move slot, 1 for empty slots, and the active key.
+
+    Args:
+        max_hp (int): Maximum hp of the creature
+        moves (Moves): Moves of the creature
+
+    Returns:
+        int: Number of keys
+    """
+    return max_hp + 1 + 16 + 16 + sum(1 if move is None else move.max_pp + 1 for move in moves) + 1
 
 
 class Creature:
+    __slots__ = ('name', 'level', '_base_stats', '_individual_values', '_effort_values', '_nature', '_types', '_moves', '_stats', '_current_hp', '_status',
+                 '_status_duration', '_remaining_pp', '_hp_keys', '_status_keys', '_duration_keys', '_pp_keys', '_active_key', '_zobrist_hash', 'legal_move_mask')
+
     def __init__(self, name: str, level: int, base_stats: anno.CreatureBaseStats, individual_values: anno.IndividualValues, effort_values: anno.EffortValues, 
                  nature: anno.CreatureNatureEnum, types: anno.Tuple[anno.CreatureTypeEnum, anno.Optional[anno.CreatureTypeEnum]], 
                  moves: anno.Moves):
@@ -20,17 +44,181 @@ class Creature:
         self._nature:anno.CreatureNatureEnum = nature
         self._types:anno.Tuple[anno.CreatureTypeEnum, anno.Optional[anno.CreatureTypeEnum]] = types
         self._moves:anno.Moves = moves
-        self._compute_stats()
+        self._stats: CreatureStats = self.compute_stats(base_stats, level, individual_values, effort_values, nature)
+        self._current_hp: int = self._stats.health_points
+        self._init_battle_state()
+
+    @classmethod
+    def from_stats(cls, name: str, level: int, base_stats: anno.CreatureBaseStats, individual_values: anno.IndividualValues, 
+                   effort_values: anno.EffortValues, nature: anno.CreatureNatureEnum, types: anno.Tuple[anno.CreatureTypeEnum, anno.Optional[anno.CreatureTypeEnum]], 
+                   moves: anno.Moves, stats: CreatureStats) -> anno.Self:
+        """Makes a Creature from stats that were already computed, i.e. by make_creatures for many creatures at once or cached by a CreatureBuildCache, 
+        skipping compute_stats. The stats must be the ones compute_stats would compute for the other arguments, and are shared rather than copied.
+
+        Args:
+            name (str): Name of the creature
+            level (int): Level of the creature
+            base_stats (CreatureBaseStats): Base stats of the creature
+            individual_values (IndividualValues): IVs of the creature
+            effort_values (EffortValues): EVs of the creature
+            nature (CreatureNatureEnum): Nature of the creature
+            types (Tuple[CreatureTypeEnum, Optional[CreatureTypeEnum]]): Elements of the creature
+            moves (Moves): Moves of the creature
+            stats (CreatureStats): Computed stats of the creature
+
+        Returns:
+            Self: The Creature
+        """
+        creature = cls.__new__(cls)
+        creature.name = name
+        creature.level = level
+        creature._base_stats = base_stats
+        creature._individual_values = individual_values
+        creature._effort_values = effort_values
+        creature._nature = nature
+        creature._types = types
+        creature._moves = moves
+        creature._stats = stats
+        creature._current_hp = stats.health_points
+        creature._init_battle_state()
+        return creature
+
+    def _init_battle_state(self) -> None:
+        """Initializes the state that changes during a battle: full hp, no status and full PP.
+        """
         self._status: NonVolatileStatusEnum = NonVolatileStatusEnum.NONE
         self._status_duration: int = 0
-        self._remaining_pp = {move.name: move.max_pp for move in self._moves if move is not None}
-        self._move_map = {move.name: move for move in self._moves if move is not None}
+        # Remaining PP of each move slot, 0 for empty slots
+        self._remaining_pp: anno.List[int] = [0 if move is None else move.max_pp for move in self._moves]
+        # Bit n is set while move slot n holds a move with PP remaining, kept up to date by _set_pp
+        self.legal_move_mask: int = self._compute_legal_move_mask()
+        # Zobrist keys are generated on the first use of zobrist_hash or active_key, so creatures that are never hashed do not hold them. Until then 
+        # _hp_keys is None and changes skip updating the hash
+        self._hp_keys: anno.Optional[anno.Sequence[int]] = None
+
+    def _make_zobrist_keys(self) -> None:
+        """Generates the Zobrist keys of the Creature and computes its hash: one key per hp value, per status, per status duration, per remaining PP of 
+        each move slot, and one key XORed into a participant's hash while the Creature is active. Status and duration keys wrap every 16 values and PP 
+        keys every max_pp + 1 values, empty move slots get a single PP key.
+        """
+        pp_sizes = [1 if move is None else move.max_pp + 1 for move in self._moves]
+        keys = zobrist_keys(new_salt(), 0, zobrist_key_count(self._stats.health_points, self._moves))
+        max_hp = self._stats.health_points
+        self._hp_keys: anno.Sequence[int] = keys[:max_hp + 1]
+        offset = max_hp + 1
+        self._status_keys: anno.Sequence[int] = keys[offset:offset + 16]
+        self._duration_keys: anno.Sequence[int] = keys[offset + 16:offset + 32]
+        offset += 32
+        pp_keys = []
+        for size in pp_sizes:
+            pp_keys.append(keys[offset:offset + size])
+            offset += size
+        self._pp_keys: anno.Tuple[anno.Sequence[int], ...] = tuple(pp_keys)
+        self._active_key: int = keys[offset]
+        self._zobrist_hash: int = self._compute_zobrist_hash()
+
+    @property
+    def zobrist_hash(self) -> int:
+        """Zobrist hash of the hp, status, duration and remaining PP of the Creature. The keys are generated on first use, after which every change 
+        updates the hash incrementally.
+
+        Returns:
+            int: The hash
+        """
+        if self._hp_keys is None:
+            self._make_zobrist_keys()
+        return self._zobrist_hash
+
+    @property
+    def active_key(self) -> int:
+        """Key XORed into a participant's hash while the Creature is active, generated with the other keys on first use.
+
+        Returns:
+            int: The key
+        """
+        if self._hp_keys is None:
+            self._make_zobrist_keys()
+        return self._active_key
+
+    def _compute_zobrist_hash(self) -> int:
+        """Computes the Zobrist hash of the Creature from scratch. Every change to hp, status, duration and PP updates the hash incrementally instead.
+
+        Returns:
+            int: XOR of the keys of the current hp, status, duration and remaining PP
+        """
+        zobrist_hash = self._hp_keys[self._current_hp] ^ self._status_keys[(self._status.value + 1) & 15] ^ self._duration_keys[(self._status_duration + 1) & 15]
+        for pp_keys, remaining_pp in zip(self._pp_keys, self._remaining_pp):
+            zobrist_hash ^= pp_keys[remaining_pp % len(pp_keys)]
+        return zobrist_hash
+
+    def _set_hp(self, hp: int) -> None:
+        """Sets the current hp and updates the Zobrist hash.
+
+        Args:
+            hp (int): New current hp, must be on [0, max_hp]
+        """
+        hp_keys = self._hp_keys
+        if hp_keys is not None:
+            self._zobrist_hash ^= hp_keys[self._current_hp] ^ hp_keys[hp]
+        self._current_hp = hp
+
+    def _set_status(self, status: NonVolatileStatusEnum, duration: int) -> None:
+        """Sets the status and its duration and updates the Zobrist hash.
+
+        Args:
+            status (NonVolatileStatusEnum): New status
+            duration (int): New status duration
+        """
+        if self._hp_keys is not None:
+            status_keys = self._status_keys
+            duration_keys = self._duration_keys
+            self._zobrist_hash ^= (status_keys[(self._status.value + 1) & 15] ^ duration_keys[(self._status_duration + 1) & 15] 
+                                   ^ status_keys[(status.value + 1) & 15] ^ duration_keys[(duration + 1) & 15])
+        self._status = status
+        self._status_duration = duration
+
+    def _set_pp(self, slot: int, remaining_pp: int) -> None:
+        """Sets the remaining PP of a move slot and updates the Zobrist hash and legal move bitmask.
+
+        Args:
+            slot (int): Move slot, [0-3]
+            remaining_pp (int): New remaining PP of the move
+        """
+        if self._hp_keys is not None:
+            pp_keys = self._pp_keys[slot]
+            self._zobrist_hash ^= pp_keys[self._remaining_pp[slot] % len(pp_keys)] ^ pp_keys[remaining_pp % len(pp_keys)]
+        self._remaining_pp[slot] = remaining_pp
+        if remaining_pp > 0:
+            self.legal_move_mask |= 1 << slot
+        else:
+            self.legal_move_mask &= ~(1 << slot)
     
-    def _compute_hp(self) -> None:
+    def _compute_legal_move_mask(self) -> int:
+        """Computes the legal move bitmask from the remaining PP of every move slot.
+
+        Returns:
+            int: Bitmask with bit n set if move slot n has PP remaining
+        """
+        mask = 0
+        for slot, remaining_pp in enumerate(self._remaining_pp):
+            if remaining_pp > 0:
+                mask |= 1 << slot
+        return mask
+
+    @staticmethod
+    def _compute_hp(level: int, base: int, iv: int, ev: int) -> int:
         """Computes the creatures maximum health points based on the provided base stats, IV, EV, and level information. Equation is the GEN 3+ equation provided here: https://bulbapedia.bulbagarden.net/wiki/Stat
+
+        Args:
+            level (int): Level of the creature
+            base (int): Base health points of the creature
+            iv (int): Health point Individual Value
+            ev (int): Health point Effort Value
+
+        Returns:
+            int: Creature's maximum health points
         """
-        self._max_hp: int = int((2 * self._base_stats.health_points + self._individual_values.health_point + (self._effort_values.health_point / 4)) * (self.level / 100)) + self.level + 10
-        self._current_hp: int = self._max_hp
+        return int((2 * base + iv + (ev / 4)) * (level / 100)) + level + 10
     
     @staticmethod
     def _compute_stat(level: int, base: int, iv: int, ev: int) -> float:
@@ -48,24 +236,31 @@ class Creature:
         stat = (2 * base + iv + (ev / 4)) * (level / 100) + 5
         return stat
     
-    def _compute_stats(self) -> None:
-        """Initialization method to determine and set all of the relevant stats for the Creature instance
-        """
-        self._compute_hp()
-        p_atk = self._compute_stat(self.level, self._base_stats.physical_attack, self._individual_values.physical_attack, self._effort_values.physical_attack)
-        p_def = self._compute_stat(self.level, self._base_stats.physical_defense, self._individual_values.physical_defense, self._effort_values.physical_defense)
-        s_atk = self._compute_stat(self.level, self._base_stats.special_attack, self._individual_values.special_attack, self._effort_values.special_attack)
-        s_def = self._compute_stat(self.level, self._base_stats.special_defense, self._individual_values.special_defense, self._effort_values.special_defense)
-        spd = self._compute_stat(self.level, self._base_stats.speed, self._individual_values.speed, self._effort_values.speed)
-        stat_arr = array([p_atk, p_def, s_atk, s_def, spd])
+    @classmethod
+    def compute_stats(cls, base_stats: anno.CreatureBaseStats, level: int, individual_values: anno.IndividualValues, effort_values: anno.EffortValues, 
+                      nature: anno.CreatureNatureEnum) -> CreatureStats:
+        """Computes the maximum hp and stats of a creature build.
+
+        Args:
+            base_stats (CreatureBaseStats): Base stats of the creature
+            level (int): Level of the creature
+            individual_values (IndividualValues): IVs of the creature
+            effort_values (EffortValues): EVs of the creature
+            nature (CreatureNatureEnum): Nature of the creature
+
+        Returns:
+            CreatureStats: The computed stats
+        """
+        ivs, evs = individual_values, effort_values
+        p_atk = cls._compute_stat(level, base_stats.physical_attack, ivs.physical_attack, evs.physical_attack)
+        p_def = cls._compute_stat(level, base_stats.physical_defense, ivs.physical_defense, evs.physical_defense)
+        s_atk = cls._compute_stat(level, base_stats.special_attack, ivs.special_attack, evs.special_attack)
+        s_def = cls._compute_stat(level, base_stats.special_defense, ivs.special_defense, evs.special_defense)
+        spd = cls._compute_stat(level, base_stats.speed, ivs.speed, evs.speed)
         # Modifier needs to be 1.0 by default, NATURE_MODIFIER only contains the deltas
-        nature_mod = NATURE_MODIFIER[self._nature.value] + 1.0
-        stats = stat_arr * nature_mod
-        self._p_atk = int(stats[0])
-        self._p_def = int(stats[1])
-        self._s_atk = int(stats[2])
-        self._s_def = int(stats[3])
-        self._spd = int(stats[4])
+        atk_mod, def_mod, s_atk_mod, s_def_mod, spd_mod = NATURE_MODIFIER[nature.value]
+        return CreatureStats(cls._compute_hp(level, base_stats.health_points, ivs.health_point, evs.health_point), int(p_atk * (atk_mod + 1.0)), 
+                             int(p_def * (def_mod + 1.0)), int(s_atk * (s_atk_mod + 1.0)), int(s_def * (s_def_mod + 1.0)), int(spd * (spd_mod + 1.0)))
         
     @property
     def is_alive(self) -> bool:
@@ -76,53 +271,39 @@ class Creature:
         """
         return self._current_hp > 0
     
-    def set_status(self, status: NonVolatileStatusEnum) -> None:
-        """Sets the status of the Creature to the provided status value and the duration of that status effect. 
+    def set_status(self, status: NonVolatileStatusEnum, rng: anno.Optional[anno.CombatRNG]=None) -> None:
+        """Sets the status of the Creature to the provided status value and the duration returned by its on apply handler. Does nothing if the Creature
+        already has a status.
 
         Args:
             status (NonVolatileStatusEnum): What status is effecting the Creature.
+            rng (Optional[CombatRNG], optional): Random number source for the sleep duration. Defaults to the shared default RNG.
 
         Raises:
             ValueError: If a non-valid status is provided, no duration information can be established so the program should crash.
         """
-        if self._status.value == -1:    
-            self._status = NonVolatileStatusEnum(status.value)
-            match status:
-                case NonVolatileStatusEnum.BRN:
-                    duration = -1
-                case NonVolatileStatusEnum.FRZ:
-                    duration = -1
-                case NonVolatileStatusEnum.PAR:
-                    duration = -1
-                case NonVolatileStatusEnum.PSN:
-                    duration = -1
-                case NonVolatileStatusEnum.BPSN:
-                    duration = -1
-                case NonVolatileStatusEnum.SLP:
-                    duration = randint(1, 4)
-                case NonVolatileStatusEnum.NONE:
-                    duration = 0
-                case _:
-                    raise ValueError(f"Somehow NonVolatileStatusEnum had a non-expected value {status}")
-            self._status_duration = duration
+        if self._status is NonVolatileStatusEnum.NONE:
+            on_apply = NON_VOLATILE_ON_APPLY.get(status, None)
+            if on_apply is None:
+                raise ValueError(f"Somehow NonVolatileStatusEnum had a non-expected value {status}")
+            self._set_status(status, on_apply(rng))
     
     def _reset_status(self) -> None:
         """Resets the Creature's status to NONE.
         """
-        self._status = NonVolatileStatusEnum.NONE
-        self._status_duration = 0
+        self._set_status(NonVolatileStatusEnum.NONE, 0)
         
     def _reset_health(self) -> None:
         """Resets the Creature's current health back to its maximum health
         """
-        self._current_hp = self._max_hp
+        self._set_hp(self._stats.health_points)
         
     def _reset_pp(self) -> None:
         """Resets the PP value for all moves back to their maximum values
         """
-        for move in self._moves:
+        for slot, move in enumerate(self._moves):
             if move is not None:
-                self._remaining_pp[move.name] = move.max_pp
+                self._set_pp(slot, move.max_pp)
     
     def reset_all(self) -> None:
         """Resets all relevant modifiable attributes of the Creature back to their starting/default values.
@@ -131,13 +312,52 @@ class Creature:
         self._reset_health()
         self._reset_pp()
         
+    def write_state(self, data: anno.MutableSequence[int], offset: int) -> int:
+        """Writes the modifiable attributes of the Creature into a battle state buffer. Remaining PP is stored per move slot, with 0 for empty slots.
+
+        Args:
+            data (MutableSequence[int]): Buffer to write into
+            offset (int): Index of the first int to write
+
+        Returns:
+            int: Index after the last int written
+        """
+        data[offset] = self._current_hp
+        data[offset + 1] = self._status.value
+        data[offset + 2] = self._status_duration
+        remaining_pp = self._remaining_pp
+        for slot in range(4):
+            data[offset + 3 + slot] = remaining_pp[slot]
+        return offset + CREATURE_STATE_SIZE
+
+    def read_state(self, data: anno.Sequence[int], offset: int) -> int:
+        """Restores the modifiable attributes of the Creature from a battle state buffer written by write_state.
+
+        Args:
+            data (Sequence[int]): Buffer to read from
+            offset (int): Index of the first int to read
+
+        Returns:
+            int: Index after the last int read
+        """
+        self._current_hp = data[offset]
+        self._status = _STATUS_BY_VALUE[data[offset + 1]]
+        self._status_duration = data[offset + 2]
+        remaining_pp = self._remaining_pp
+        for slot in range(4):
+            remaining_pp[slot] = data[offset + 3 + slot]
+        self.legal_move_mask = self._compute_legal_move_mask()
+        if self._hp_keys is not None:
+            self._zobrist_hash = self._compute_zobrist_hash()
+        return offset + CREATURE_STATE_SIZE
+        
     def adjust_health(self, amount: int) -> None:
         """Adjusts the health of the Creature by the provided amount. Will clip the lower bound to 0 and the upper bound to the max hp.
 
         Args:
             amount (int): How much should the current HP change.
         """
-        self._current_hp = clip(self._current_hp + amount, 0, self._max_hp)
+        self._set_hp(clip(self._current_hp + amount, 0, self._stats.health_points))
         
     def move_at_index(self, index: int) -> anno.Optional[anno.Move]:
         """Returns the move from the move list at the specified index. If none exists None will be returned instead.
@@ -163,7 +383,7 @@ class Creature:
             Optional[int]: The index of the move in the move list for the provided name. If none is found None will be returned instead.
         """
         for idx, move in enumerate(self._moves):
-            if move.name == move_name:
+            if move is not None and move.name == move_name:
                 return idx
         else:
             return None
@@ -180,6 +400,17 @@ class Creature:
         """
         return move.element in self._types
     
+    def remaining_pp(self, slot: int) -> int:
+        """Returns the remaining PP of the move in the provided move slot.
+
+        Args:
+            slot (int): Move slot, [0-3]
+
+        Returns:
+            int: Remaining PP of the move, 0 for empty slots
+        """
+        return self._remaining_pp[slot]
+
     @property
     def current_hp(self) -> int:
         """Accessor attribute for the creature's current HP 
@@ -196,7 +427,7 @@ class Creature:
         Returns:
             int: Creature's maximum HP
         """
-        return self._max_hp
+        return self._stats.health_points
     
     @property
     def write_hp(self) -> str:
@@ -214,7 +445,7 @@ class Creature:
         Returns:
             int: Creature's Physical Attack
         """
-        return self._p_atk
+        return self._stats.physical_attack
     
     @property
     def p_def(self) -> int:
@@ -223,7 +454,7 @@ class Creature:
         Returns:
             int: Creature's Physical Defense
         """
-        return self._p_def
+        return self._stats.physical_defense
     
     @property
     def s_atk(self) -> int:
@@ -232,7 +463,7 @@ class Creature:
         Returns:
             int: Creature's Special Attack
         """
-        return self._s_atk
+        return self._stats.special_attack
     
     @property
     def s_def(self) -> int:
@@ -241,7 +472,7 @@ class Creature:
         Returns:
             int: Creature's Special Defense
         """
-        return self._s_def
+        return self._stats.special_defense
     
     @property
     def spd(self) -> int:
@@ -250,7 +481,7 @@ class Creature:
         Returns:
             int: Creature's Speed
         """
-        return self._spd
+        return self._stats.speed
     
     @property
     def status(self) -> NonVolatileStatusEnum:
@@ -1,22 +1,21 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from numpy import uint8
 
 from creature_combat.utils import annotations as anno
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreatureBaseStats:
-    health_points: uint8
-    physical_attack: uint8
-    physical_defense: uint8
-    special_attack: uint8
-    special_defense: uint8
-    speed: uint8
+    health_points: int
+    physical_attack: int
+    physical_defense: int
+    special_attack: int
+    special_defense: int
+    speed: int
     
     @classmethod
     def from_dict(cls, config: anno.Dict[str, int]) -> anno.Self:
-        """Method to create an instance of CreatureBaseStats with data contained within a python dictionary. Converts input values into uint8 values
+        """Method to create an instance of CreatureBaseStats with data contained within a python dictionary. Converts input values into plain ints
 
         Args:
             config (Dict[str, int]): Mapping of attribute names to the values for those attributes for this object instance.
@@ -24,18 +23,18 @@ class CreatureBaseStats:
         Returns:
             Self: An instance of CreatureBaseStats with the specified values.
         """
-        config['health_points'] = uint8(config['health_points'])
-        config['physical_attack'] = uint8(config['physical_attack'])
-        config['physical_defense'] = uint8(config['physical_defense'])
-        config['special_attack'] = uint8(config['special_attack'])
-        config['special_defense'] = uint8(config['special_defense'])
-        config['speed'] = uint8(config['speed'])
+        config['health_points'] = int(config['health_points'])
+        config['physical_attack'] = int(config['physical_attack'])
+        config['physical_defense'] = int(config['physical_defense'])
+        config['special_attack'] = int(config['special_attack'])
+        config['special_defense'] = int(config['special_defense'])
+        config['speed'] = int(config['speed'])
         return cls(**config)
         
     def __post_init__(self):
-        assert isinstance(self.health_points, uint8), f"Health points provided as {type(self.health_points)} expected uint8"
-        assert isinstance(self.physical_attack, uint8), f"Physical attack provided as {type(self.physical_attack)} expected uint8"
-        assert isinstance(self.physical_defense, uint8), f"Physical defense provided as {type(self.physical_defense)} expected uint8"
-        assert isinstance(self.special_attack, uint8), f"Special attack provided as {type(self.special_attack)} expected uint8"
-        assert isinstance(self.special_defense, uint8), f"Special defense provided as {type(self.special_defense)} expected uint8"
-        assert isinstance(self.speed, uint8), f"Speed provided as {type(self.speed)} expected uint8"
\ No newline at end of file
+        assert 0<=self.health_points<256, f"Health points must be between [0-255], provided {self.health_points}"
+        assert 0<=self.physical_attack<256, f"Physical attack must be between [0-255], provided {self.physical_attack}"
+        assert 0<=self.physical_defense<256, f"Physical defense must be between [0-255], provided {self.physical_defense}"
+        assert 0<=self.special_attack<256, f"Special attack must be between [0-255], provided {self.special_attack}"
+        assert 0<=self.special_defense<256, f"Special defense must be between [0-255], provided {self.special_defense}"
+        assert 0<=self.speed<256, f"Speed must be between [0-255], provided {self.speed}"
\ No newline at end of file
@@ -0,0 +1,113 @@
+from __future__ import annotations
+from dataclasses import fields
+
+from numpy import array, asarray, broadcast_to, float64, int64
+from numpy.random import default_rng
+
+from creature_combat.creature.creature import Creature
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.creature_stats import CreatureStats
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.mappings import NATURE_MODIFIER
+from creature_combat.utils.rng import CombatRNG
+
+_NATURE_BY_VALUE = {nature.value: nature for nature in CreatureNatureEnum}
+# Modifier needs to be 1.0 by default, NATURE_MODIFIER only contains the deltas
+_NATURE_MULTIPLIER = array(NATURE_MODIFIER, dtype=float64) + 1.0
+
+
+def _unchecked_constructor(cls: type) -> anno.Callable[..., anno.Any]:
+    """Builds a constructor for a slotted frozen dataclass that sets the fields through their slot descriptors, skipping __init__ and the __post_init__
+    asserts. Only use it for values that were already validated.
+
+    Args:
+        cls (type): The dataclass
+
+    Returns:
+        Callable[..., Any]: Function taking the field values in order and returning the instance
+    """
+    setters = [getattr(cls, field.name).__set__ for field in fields(cls)]
+    new = object.__new__
+
+    def construct(*values):
+        instance = new(cls)
+        for setter, value in zip(setters, values):
+            setter(instance, value)
+        return instance
+    return construct
+
+
+_make_individual_values = _unchecked_constructor(IndividualValues)
+_make_effort_values = _unchecked_constructor(EffortValues)
+_make_stats = _unchecked_constructor(CreatureStats)
+
+
+def _stat_array(values: anno.Optional[anno.ArrayLike], n: int, name: str) -> anno.ndarray:
+    """Broadcasts user provided IVs or EVs to one row of 6 stats per creature.
+
+    Args:
+        values (Optional[ArrayLike]): IVs or EVs, a single row of 6 or one row per creature
+        n (int): Number of creatures
+        name (str): Name of the values for error messages
+
+    Returns:
+        ndarray: (n, 6) int64 values
+    """
+    values = asarray(values, dtype=int64)
+    assert values.shape in ((6,), (n, 6)), f"{name} must be shaped (6,) or ({n}, 6), provided {values.shape}"
+    return broadcast_to(values, (n, 6))
+
+
+def make_creatures(entry: anno.CreatureEntry, n: int, moves: anno.Moves, levels: anno.Union[int, anno.ArrayLike]=50,
+                   natures: anno.Optional[anno.Union[CreatureNatureEnum, anno.ArrayLike]]=None, individual_values: anno.Optional[anno.ArrayLike]=None,
+                   effort_values: anno.Optional[anno.ArrayLike]=None, rng: anno.Optional[anno.Union[int, anno.Generator, CombatRNG]]=None) -> anno.List[Creature]:
+    """Makes many Creatures of one CreatureEntry at once. IVs, EVs and natures that are not provided are drawn as arrays with the same ranges as
+    IndividualValues.make_random and EffortValues.make_random, the hp and stats of every creature are computed in one vectorized pass with the same
+    formula and integer truncation as Creature.compute_stats, and the IVs and EVs are validated once as arrays instead of per instance. The created
+    Creatures are identical to the ones CreatureEntry.make_creature makes from the same values, apart from their Zobrist salts.
+
+    Args:
+        entry (CreatureEntry): Entry of the creatures to make
+        n (int): Number of creatures to make
+        moves (Moves): Moves of every creature
+        levels (Union[int, ArrayLike], optional): Level of every creature, or one level per creature. Defaults to 50.
+        natures (Optional[Union[CreatureNatureEnum, ArrayLike]], optional): Nature of every creature, or one CreatureNatureEnum value per creature.
+            Defaults to drawing them.
+        individual_values (Optional[ArrayLike], optional): IVs shaped (6,) or (n, 6), in the field order of IndividualValues. Defaults to drawing them.
+        effort_values (Optional[ArrayLike], optional): EVs shaped (6,) or (n, 6), in the field order of EffortValues. Defaults to drawing them.
+        rng (Optional[Union[int, Generator, CombatRNG]], optional): Seed, Generator or CombatRNG used to draw the values. Defaults to None.
+
+    Returns:
+        List[Creature]: The created creatures
+    """
+    assert n >= 0, f"Number of creatures must be positive, provided {n}"
+    generator = default_rng(rng.generator if isinstance(rng, CombatRNG) else rng)
+    ivs = generator.integers(0, 32, size=(n, 6)) if individual_values is None else _stat_array(individual_values, n, "IVs")
+    evs = generator.integers(0, 80, size=(n, 6)) if effort_values is None else _stat_array(effort_values, n, "EVs")
+    if natures is None:
+        natures = generator.integers(0, len(_NATURE_BY_VALUE), size=n)
+    elif isinstance(natures, CreatureNatureEnum):
+        natures = natures.value
+    natures = broadcast_to(asarray(natures, dtype=int64), (n,))
+    levels = broadcast_to(asarray(levels, dtype=int64), (n,))
+    assert ((ivs >= 0) & (ivs < 32)).all(), "IVs must be between [0-31]"
+    assert ((evs >= 0) & (evs < 252)).all(), "EVs must be between [0-252]"
+    assert (evs.sum(axis=1) <= 510).all(), "Total EVs must be less than 510. Please decrease EVs to a valid range"
+    assert ((natures >= 0) & (natures < len(_NATURE_BY_VALUE))).all(), "Natures must be CreatureNatureEnum values"
+
+    base_stats = entry.base_stats
+    base = array([base_stats.health_points, base_stats.physical_attack, base_stats.physical_defense, base_stats.special_attack,
+                  base_stats.special_defense, base_stats.speed], dtype=int64)
+    scale = levels / 100
+    # Same evaluation order as Creature._compute_hp and Creature._compute_stat, so the truncated results match exactly
+    raw = (2 * base + ivs + (evs / 4)) * scale[:, None]
+    hp = raw[:, 0].astype(int64) + levels + 10
+    stats = ((raw[:, 1:] + 5) * _NATURE_MULTIPLIER[natures]).astype(int64)
+
+    creatures = []
+    for level, nature, iv, ev, max_hp, stat in zip(levels.tolist(), natures.tolist(), ivs.tolist(), evs.tolist(), hp.tolist(), stats.tolist()):
+        creatures.append(Creature.from_stats(entry.name, level, base_stats, _make_individual_values(*iv), _make_effort_values(*ev), _NATURE_BY_VALUE[nature],
+                                             entry.elements, moves, _make_stats(max_hp, *stat)))
+    return creatures
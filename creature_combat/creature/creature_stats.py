@@ -0,0 +1,14 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CreatureStats:
+    """Computed stats of a creature build, i.e. its base stats combined with a level, IVs, EVs and nature. Immutable, so Creatures with the same build 
+    share one instance."""
+    health_points: int  # Maximum hp
+    physical_attack: int
+    physical_defense: int
+    special_attack: int
+    special_defense: int
+    speed: int
@@ -1,11 +1,14 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from json import load
-from os import listdir
+from json import load, loads
+
+from creature_combat.creature.build_cache import CreatureBuildCache, get_build_cache
 from creature_combat.creature.creature_base_stats import CreatureBaseStats
 from creature_combat.creature.creature_types import CreatureTypeEnum
 from creature_combat.creature.creature import Creature
 from creature_combat.utils import annotations as anno
+from creature_combat.utils.data_index import read_data_index
+from creature_combat.utils.parse_cache import load_cached
 
 
 @dataclass
@@ -48,8 +51,9 @@ class CreatureEntry:
         return cls.from_dict(config)
     
     def make_creature(self, level: int, individual_values: anno.IndividualValues, effort_values: anno.EffortValues, 
-                     nature: anno.CreatureNatureEnum, moves: anno.Moves) -> Creature:
-        """Makes a Creature object based on this CreatureEntry, as well as the mutable parameters of level, EVs, IVs, nature, and moves
+                     nature: anno.CreatureNatureEnum, moves: anno.Moves, build_cache: anno.Optional[CreatureBuildCache]=None) -> Creature:
+        """Makes a Creature object based on this CreatureEntry, as well as the mutable parameters of level, EVs, IVs, nature, and moves. The stats of the 
+        build are looked up in the build cache, so creatures of the same build share them.
 
         Args:
             level (int): What level of Creature to make
@@ -57,31 +61,89 @@ class CreatureEntry:
             effort_values (EffortValues): EVs for the Creature
             nature (CreatureNatureEnum): Nature of the Creature
             moves (Tuple[Move, Optional[Move], Optional[Move], Optional[Move]]): List of moves the Creature has
+            build_cache (Optional[CreatureBuildCache], optional): Cache of computed stats. Defaults to the shared build cache.
 
         Returns:
             Creature: Instance of a Creature object based on provided values
         """
-        return Creature(self.name, level, self.base_stats, individual_values, effort_values, nature, self.elements, moves)
+        build_cache = get_build_cache() if build_cache is None else build_cache
+        stats = build_cache.get(self, level, individual_values, effort_values, nature)
+        return Creature.from_stats(self.name, level, self.base_stats, individual_values, effort_values, nature, self.elements, moves, stats)
+
+    def make_creatures(self, n: int, moves: anno.Moves, levels: anno.Union[int, anno.ArrayLike]=50, 
+                       natures: anno.Optional[anno.Union[anno.CreatureNatureEnum, anno.ArrayLike]]=None, individual_values: anno.Optional[anno.ArrayLike]=None,
+                       effort_values: anno.Optional[anno.ArrayLike]=None, rng: anno.Optional[anno.Union[int, anno.Generator, anno.CombatRNG]]=None) -> anno.List[Creature]:
+        """Makes many Creatures based on this CreatureEntry at once, computing their stats in one vectorized pass. See creature_factory.make_creatures.
+
+        Args:
+            n (int): Number of creatures to make
+            moves (Moves): Moves of every creature
+            levels (Union[int, ArrayLike], optional): Level of every creature, or one level per creature. Defaults to 50.
+            natures (Optional[Union[CreatureNatureEnum, ArrayLike]], optional): Nature of every creature, or one value per creature. Defaults to drawing them.
+            individual_values (Optional[ArrayLike], optional): IVs shaped (6,) or (n, 6). Defaults to drawing them.
+            effort_values (Optional[ArrayLike], optional): EVs shaped (6,) or (n, 6). Defaults to drawing them.
+            rng (Optional[Union[int, Generator, CombatRNG]], optional): Seed, Generator or CombatRNG used to draw the values. Defaults to None.
+
+        Returns:
+            List[Creature]: The created creatures
+        """
+        # Imported here so that only the bulk factory imports NumPy
+        from creature_combat.creature.creature_factory import make_creatures
+        return make_creatures(self, n, moves, levels, natures, individual_values, effort_values, rng)
+
+
+@dataclass(frozen=True)
+class CreatureDexColumns:
+    """Columnar view of every creature in a CreatureDex, row n holds the creature with ID n"""
+    base_stats: anno.ndarray  # (N, 6) uint8 base stats, ordered hp, p_atk, p_def, s_atk, s_def, spd
+    elements: anno.ndarray  # (N, 2) int8 CreatureTypeEnum values of both elements, -1 when the creature has a single element
 
 
 class CreatureDex:
-    def __init__(self, data_path: anno.Path):
+    def __init__(self, data_path: anno.Path, lazy: bool=False, pack: anno.Optional[anno.DataPack]=None, cache_path: anno.Optional[anno.Path]=None):
+        """
+        Args:
+            data_path (Path): Path to the creature data directory
+            lazy (bool, optional): Only read the name to file index up front and parse every entry on its first get. Defaults to False, parsing every 
+                entry immediately.
+            pack (Optional[DataPack], optional): Data pack compiled from data_path to read entries from instead of the JSON files, i.e. from 
+                open_data_pack. Defaults to None.
+            cache_path (Optional[Path], optional): On-disk cache of the parsed entries to load through, see parse_cache.load_cached. Every entry is 
+                loaded up front when provided. Ignored when reading from a data pack. Defaults to None.
+        """
         assert data_path.exists(), f"Path to creature data {data_path} is invalid"
         self.data_path = data_path
-        available_creature = [f for f in listdir(str(data_path)) if f.split('.')[0] != 'example' and f.split('.')[-1] == 'json']
-        self._creature = {ap.split('.')[0]: CreatureEntry.from_json(self.data_path / ap) for ap in available_creature}
+        self.lazy = lazy
+        self._pack = pack
+        # Maps every creature name to its file name, or to its record in the data pack
+        self._index: anno.Dict[str, anno.Union[str, int]] = (read_data_index(data_path) if pack is None else 
+                                                             {key: record_id for record_id, key in enumerate(pack.creature_keys())})
+        self._creature: anno.Dict[str, CreatureEntry] = {}
+        if cache_path is not None and pack is None:
+            self._creature = load_cached(data_path, self._index, lambda content: CreatureEntry.from_dict(loads(content)), cache_path)
+        elif not lazy:
+            for creature_name in self._index:
+                self.get(creature_name)
+        # Dense IDs are assigned in sorted name order, so they are stable for the same data set regardless of the directory listing order
+        self.names: anno.Tuple[str, ...] = tuple(sorted(self._index))
+        self.name_to_id: anno.Dict[str, int] = {name: creature_id for creature_id, name in enumerate(self.names)}
+        self._columns: anno.Optional[CreatureDexColumns] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
     
     @property
     def available_creature(self) -> anno.Set[str]:
-        """Lists the Creatures that have been loaded into the CreatureDex currently
+        """Lists the Creatures available in the CreatureDex, including the ones a lazy CreatureDex has not parsed yet
 
         Returns:
             Set[str]: Set of the Creature Names available in the CreatureDex
         """
-        return set(self._creature.keys())
+        return set(self._index.keys())
     
     def get(self, creature_name: str) -> CreatureEntry:
         """Accessor method for the _creature dictionary stored in the CreatureDex. Primarily wraps the dictionary .get() method to return a more explicit error when it errors out.
+        Entries that have not been parsed yet are parsed from their file and memoized.
 
         Args:
             creature_name (str): Name of the creature to get the CreatureEntry for.
@@ -94,5 +156,59 @@ class CreatureDex:
         """
         stats = self._creature.get(creature_name, None)
         if stats is None:
-            raise ValueError(f"Can not get data for creature : {creature_name} as it is not in the creature dex.")
-        return stats
\ No newline at end of file
+            source = self._index.get(creature_name, None)
+            if source is None:
+                raise ValueError(f"Can not get data for creature : {creature_name} as it is not in the creature dex.")
+            stats = CreatureEntry.from_json(self.data_path / source) if self._pack is None else CreatureEntry.from_dict(self._pack.creature_config(source))
+            self._creature[creature_name] = stats
+        return stats
+
+    def id_of(self, creature_name: str) -> int:
+        """Looks up the dense integer ID of a creature.
+
+        Args:
+            creature_name (str): Name of the creature
+
+        Raises:
+            ValueError: If the creature_name isn't in the CreatureDex
+
+        Returns:
+            int: ID of the creature, [0, len(self))
+        """
+        creature_id = self.name_to_id.get(creature_name, None)
+        if creature_id is None:
+            raise ValueError(f"Can not get the ID of creature : {creature_name} as it is not in the creature dex.")
+        return creature_id
+
+    def get_by_id(self, creature_id: int) -> CreatureEntry:
+        """Accessor method for the CreatureEntry with the provided dense integer ID.
+
+        Args:
+            creature_id (int): ID of the creature, [0, len(self))
+
+        Returns:
+            CreatureEntry: CreatureEntry instance for the requested creature_id
+        """
+        return self.get(self.names[creature_id])
+
+    def columns(self) -> CreatureDexColumns:
+        """Builds the columnar arrays of every creature in the CreatureDex on the first call and returns the cached arrays after that. Row n of every 
+        array holds the creature with ID n.
+
+        Returns:
+            CreatureDexColumns: Base stats and elements of every creature
+        """
+        if self._columns is None and self._pack is not None:
+            # Pack records are stored in sorted name order, so the record fields are the columns
+            self._columns = CreatureDexColumns(self._pack.creatures['base_stats'], self._pack.creatures['elements'])
+        if self._columns is None:
+            # Imported here so that only callers of the vectorized columns import NumPy
+            from numpy import array, int8, uint8
+            entries = [self.get(name) for name in self.names]
+            base_stats = array([(entry.base_stats.health_points, entry.base_stats.physical_attack, entry.base_stats.physical_defense,
+                                 entry.base_stats.special_attack, entry.base_stats.special_defense, entry.base_stats.speed) for entry in entries], 
+                               dtype=uint8).reshape(len(entries), 6)
+            elements = array([[-1 if element is None else element.value for element in (entry.elements + (None,))[:2]] for entry in entries], 
+                             dtype=int8).reshape(len(entries), 2)
+            self._columns = CreatureDexColumns(base_stats, elements)
+        return self._columns
\ No newline at end of file
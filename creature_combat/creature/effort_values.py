@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from numpy.random import randint
+from random import randrange
 
 from creature_combat.utils import annotations as anno
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EffortValues:
     health_point: int
     physical_attack: int
@@ -40,4 +40,4 @@ class EffortValues:
         Returns:
             Self: Effort Values for the creature
         """
-        return cls(randint(0, 80), randint(0, 80), randint(0, 80), randint(0, 80), randint(0, 80), randint(0, 80))
\ No newline at end of file
+        return cls(randrange(0, 80), randrange(0, 80), randrange(0, 80), randrange(0, 80), randrange(0, 80), randrange(0, 80))
\ No newline at end of file
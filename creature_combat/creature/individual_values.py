@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from numpy.random import randint
+from random import randrange
 
 from creature_combat.utils import annotations as anno
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IndividualValues:
     health_point: int
     physical_attack: int
@@ -38,4 +38,4 @@ class IndividualValues:
         Returns:
             Self: Instance of IndividualValues for the creature
         """
-        return cls(randint(0, 32), randint(0, 32), randint(0, 32), randint(0, 32), randint(0, 32), randint(0, 32))
\ No newline at end of file
+        return cls(randrange(0, 32), randrange(0, 32), randrange(0, 32), randrange(0, 32), randrange(0, 32), randrange(0, 32))
\ No newline at end of file
@@ -0,0 +1,80 @@
+from __future__ import annotations
+from json import load
+
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.utils import annotations as anno
+
+# Values used for the fields a creature definition leaves out
+DEFAULT_LEVEL = 50
+DEFAULT_NATURE = CreatureNatureEnum.BASHFUL
+
+
+def _stat_values(cls: anno.Union[anno.Type[IndividualValues], anno.Type[EffortValues]],
+                 values: anno.Optional[anno.Union[anno.Sequence[int], anno.Dict[str, int]]]) -> anno.Union[IndividualValues, EffortValues]:
+    if values is None:
+        return cls.make_zero()
+    if isinstance(values, dict):
+        return cls(**values)
+    return cls(*values)
+
+
+def make_team_creature(definition: anno.Config, creature_dex: anno.CreatureDex, move_list: anno.MoveList) -> anno.Creature:
+    """Makes a creature from its definition. A definition is a dictionary with the species name and the names of 1 to 4 moves, and optionally the level,
+    the nature name, and the IVs and EVs either as a list in the field order of IndividualValues or as a dictionary of field names. Left out IVs and EVs
+    are 0 so definitions always make the same creature.
+
+    Args:
+        definition (Config): Definition of the creature, i.e. {"species": "Bulbasaur", "level": 12, "nature": "MILD", "moves": ["Tackle", "Vine Whip"]}
+        creature_dex (CreatureDex): CreatureDex the species is resolved through
+        move_list (MoveList): MoveList the moves are resolved through
+
+    Returns:
+        Creature: The created creature
+    """
+    move_names = definition['moves']
+    assert 1 <= len(move_names) <= 4, f"A creature must have 1 to 4 moves, {definition['species']} was provided {len(move_names)}"
+    moves = tuple(move_list.get(move_name) for move_name in move_names) + (None,) * (4 - len(move_names))
+    nature = CreatureNatureEnum.init_from_key_or_value(definition.get('nature', DEFAULT_NATURE.name))
+    return creature_dex.get(definition['species']).make_creature(definition.get('level', DEFAULT_LEVEL), _stat_values(IndividualValues, definition.get('ivs')),
+                                                                 _stat_values(EffortValues, definition.get('evs')), nature, moves)
+
+
+def make_teams(config: anno.Dict[str, anno.List[anno.Config]], creature_dex: anno.CreatureDex, move_list: anno.MoveList) -> anno.Dict[str, anno.Creatures]:
+    """Makes every team of a team config. Every creature is made separately, so teams never share Creature objects even when their definitions match.
+
+    Args:
+        config (Dict[str, List[Config]]): Creature definitions of every team by team name, see make_team_creature
+        creature_dex (CreatureDex): CreatureDex the species are resolved through
+        move_list (MoveList): MoveList the moves are resolved through
+
+    Returns:
+        Dict[str, Creatures]: Creatures of every team by team name
+    """
+    assert isinstance(config, dict), f"A team config must be an object of creature definitions by team name, provided {type(config).__name__}"
+    teams = {}
+    for team_name, definitions in config.items():
+        assert isinstance(definitions, list), f"Team {team_name} must be a list of creature definitions, provided {type(definitions).__name__}"
+        assert len(definitions) > 0, f"Team {team_name} has no creatures"
+        team = [make_team_creature(definition, creature_dex, move_list) for definition in definitions]
+        # Players key their team by creature name
+        assert len({creature.name for creature in team}) == len(team), f"Team {team_name} has the same species more than once"
+        teams[team_name] = team
+    return teams
+
+
+def load_teams(path: anno.Path, creature_dex: anno.CreatureDex, move_list: anno.MoveList) -> anno.Dict[str, anno.Creatures]:
+    """Makes every team of a JSON team file, a JSON object of creature definitions by team name. See make_teams.
+
+    Args:
+        path (Path): Path to the team file
+        creature_dex (CreatureDex): CreatureDex the species are resolved through
+        move_list (MoveList): MoveList the moves are resolved through
+
+    Returns:
+        Dict[str, Creatures]: Creatures of every team by team name
+    """
+    with open(path, 'r') as infile:
+        config = load(infile)
+    return make_teams(config, creature_dex, move_list)
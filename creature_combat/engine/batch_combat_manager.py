@@ -0,0 +1,436 @@
+from __future__ import annotations
+from numpy import arange, array, clip, errstate, full, int8, int16, int32, int64, float64, maximum, minimum, nonzero, ones, take_along_axis, where, zeros
+from numpy.random import default_rng
+
+from creature_combat.engine.combat_manager import DRAW, PLAYER_1_WIN, PLAYER_2_WIN
+from creature_combat.environment.environment_tables import ENVIRONMENT_CHIP_ARRAY, ENVIRONMENT_DAMAGE_ARRAY, ENVIRONMENT_DURATION, NO_ENVIRONMENT, TERRAIN_COUNT
+from creature_combat.moves.move_effects import (OP_STAT_STAGE, OP_STATUS, OP_HEAL_PERCENT, OP_HEAL_FLAT, OP_LIFESTEAL_PERCENT, OP_VOLATILE_STATUS, OP_WEATHER, 
+                                                OP_TERRAIN)
+from creature_combat.moves.move_types import MoveTypeEnum
+from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.mappings import STAGE_MULTIPLIERS, TYPE_PAIR_DAMAGE_ARRAY
+from creature_combat.utils.rng import CombatRNG
+
+
+# Stat stage indices, ordered the same as Participant.reset_stage
+_P_ATK, _P_DEF, _S_ATK, _S_DEF, _SPD, _ACC, _EVA, _CRIT = range(8)
+_STAGE_MIN = array([-6, -6, -6, -6, -6, -6, -6, 0])
+_STAGE_MAX = array([6, 6, 6, 6, 6, 6, 6, 6])
+# Padding opcode for moves with fewer effects than the widest effect program
+_OP_NONE = -1
+
+# Multipliers for stat stages [-6, 6], indexed by stage + 6
+_STAGE_MULTIPLIER = array(STAGE_MULTIPLIERS)
+# Multipliers for accuracy stages [-6, 6], indexed by stage + 6
+_ACCURACY_MULTIPLIER = array([(3 + stage) / 3 if stage >= 0 else 3 / (3 - stage) for stage in range(-6, 7)])
+# Chance to crit for crit stages [0, 3]
+_CRIT_CHANCE = array([1/16, 1/8, 1/2, 1.0])
+
+_NONE = NonVolatileStatusEnum.NONE.value
+_BRN = NonVolatileStatusEnum.BRN.value
+_FRZ = NonVolatileStatusEnum.FRZ.value
+_PAR = NonVolatileStatusEnum.PAR.value
+_PSN = NonVolatileStatusEnum.PSN.value
+_BPSN = NonVolatileStatusEnum.BPSN.value
+_SLP = NonVolatileStatusEnum.SLP.value
+
+# Result code stored in BatchCombatManager.winner while a battle is running, finished battles use the CombatManager result codes
+IN_PROGRESS = -1
+
+
+class _MoveTable:
+    """Struct-of-arrays view of every distinct move used in a batch of battles."""
+    def __init__(self, moves: anno.List[anno.Move]):
+        self.power = array([0 if move.power is None else move.power for move in moves], dtype=float64)
+        # Moves without an accuracy always hit, mark them with -1
+        self.accuracy = array([-1 if move.accuracy is None else move.accuracy for move in moves], dtype=int64)
+        self.move_type = array([move.move_type.value for move in moves], dtype=int8)
+        self.element = array([move.element.value for move in moves], dtype=int8)
+        self.high_crit = array([int(move.high_crit_flag) for move in moves], dtype=int8)
+        self.priority = array([move.priority for move in moves], dtype=int8)
+        self.is_attack = self.move_type != MoveTypeEnum.STATUS.value
+        self.is_physical = self.move_type == MoveTypeEnum.PHYSICAL.value
+        self.self_op, self.self_arg, self.self_amount = self._pad_programs([move.self_program for move in moves])
+        self.opp_op, self.opp_arg, self.opp_amount = self._pad_programs([move.opponent_program for move in moves])
+        self.lifesteal_op = array([_OP_NONE if move.lifesteal is None else move.lifesteal[0] for move in moves], dtype=int8)
+        self.lifesteal_amount = array([0 if move.lifesteal is None else move.lifesteal[2] for move in moves], dtype=int64)
+        self.env_op, self.env_arg, _ = self._pad_programs([move.environment_program for move in moves])
+
+    @staticmethod
+    def _pad_programs(programs: anno.List[anno.EffectProgram]) -> anno.Tuple[anno.ndarray, anno.ndarray, anno.ndarray]:
+        """Packs the compiled effect programs of every move into padded (moves, effects) opcode, argument and amount arrays.
+
+        Args:
+            programs (List[EffectProgram]): Compiled effect program of every move
+
+        Returns:
+            Tuple[ndarray, ndarray, ndarray]: Opcode, argument and amount arrays
+        """
+        width = max([len(program) for program in programs] + [0])
+        op = full((len(programs), width), _OP_NONE, dtype=int8)
+        arg = zeros((len(programs), width), dtype=int8)
+        amount = zeros((len(programs), width), dtype=int64)
+        for m, program in enumerate(programs):
+            for k, effect in enumerate(program):
+                assert effect[0] != OP_VOLATILE_STATUS, "Volatile statuses are not supported by the BatchCombatManager, use the CombatManager instead"
+                op[m, k], arg[m, k], amount[m, k] = effect
+        return op, arg, amount
+
+
+class BatchCombatManager:
+    """Steps N independent 1v1 battles in lockstep. The state of every battle is stored as NumPy struct-of-arrays indexed by [battle, side], where side 0 is
+    player 1 and side 1 is player 2. Every round resolves move order, hit and crit checks, damage, move effects and end turn effects for all of the live
+    battles at once, following the same rules as CombatManager.
+    """
+    def __init__(self, creatures_1: anno.Sequence[anno.Creature], creatures_2: anno.Sequence[anno.Creature], rng: anno.Optional[anno.Union[int, anno.Generator, CombatRNG]]=None):
+        assert len(creatures_1) == len(creatures_2), f"Both sides need the same number of battles, got {len(creatures_1)} and {len(creatures_2)}"
+        self.rng = default_rng(rng.generator if isinstance(rng, CombatRNG) else rng)
+        self.n_battles = len(creatures_1)
+        pairs = list(zip(creatures_1, creatures_2))
+        # Build the move table from every distinct move in the batch
+        move_index: anno.Dict[str, int] = {}
+        moves: anno.List[anno.Move] = []
+        for pair in pairs:
+            for creature in pair:
+                for move in creature._moves:
+                    if move is not None and move.name not in move_index:
+                        move_index[move.name] = len(moves)
+                        moves.append(move)
+        self.moves = _MoveTable(moves)
+        n = self.n_battles
+        self.level = zeros((n, 2), dtype=int64)
+        self.max_hp = zeros((n, 2), dtype=int64)
+        self.hp = zeros((n, 2), dtype=int64)
+        self.stats = zeros((n, 2, 5), dtype=int64)
+        self.types = full((n, 2, 2), -1, dtype=int8)
+        self.status = full((n, 2), _NONE, dtype=int8)
+        self.status_duration = zeros((n, 2), dtype=int16)
+        self.bpsn_counter = zeros((n, 2), dtype=int16)
+        self.stages = zeros((n, 2, 8), dtype=int8)
+        self.move_ids = full((n, 2, 4), -1, dtype=int32)
+        self.pp = zeros((n, 2, 4), dtype=int32)
+        for b, pair in enumerate(pairs):
+            for side, creature in enumerate(pair):
+                self.level[b, side] = creature.level
+                self.max_hp[b, side] = creature.max_hp
+                self.hp[b, side] = creature.current_hp
+                self.stats[b, side] = (creature.p_atk, creature.p_def, creature.s_atk, creature.s_def, creature.spd)
+                self.types[b, side] = [-1 if t is None else t.value for t in creature._types]
+                self.status[b, side] = creature.status.value
+                self.status_duration[b, side] = creature.status_duration
+                for slot, move in enumerate(creature._moves):
+                    if move is not None:
+                        self.move_ids[b, side, slot] = move_index[move.name]
+                        self.pp[b, side, slot] = creature._remaining_pp[slot]
+        self._compute_slot_modifiers()
+        # Environment index of every battle, see environment_index, and the turns left for its weather and terrain, -1 for no limit
+        self.environment = full(n, NO_ENVIRONMENT, dtype=int64)
+        self.weather_turns = zeros(n, dtype=int16)
+        self.terrain_turns = zeros(n, dtype=int16)
+        self.round_number = zeros(n, dtype=int32)
+        self.winner = full(n, IN_PROGRESS, dtype=int8)
+        self._update_winner(arange(n))
+
+    @classmethod
+    def from_matchup(cls, creature_1: anno.Creature, creature_2: anno.Creature, n_battles: int, rng: anno.Optional[anno.Union[int, anno.Generator, CombatRNG]]=None) -> anno.Self:
+        """Creates a batch of n_battles copies of the same 1v1 matchup.
+
+        Args:
+            creature_1 (Creature): Creature used by player 1 in every battle
+            creature_2 (Creature): Creature used by player 2 in every battle
+            n_battles (int): How many battles to simulate
+            rng (Optional[Union[int, Generator, CombatRNG]], optional): Seed, Generator or CombatRNG used for every random draw. Defaults to None.
+
+        Returns:
+            Self: BatchCombatManager holding n_battles copies of the matchup
+        """
+        return cls([creature_1] * n_battles, [creature_2] * n_battles, rng)
+
+    def _compute_slot_modifiers(self) -> None:
+        """Precomputes the STAB and type effectiveness modifiers for every move slot against the opposing creature, as neither changes during a 1v1 battle.
+        """
+        safe_ids = maximum(self.move_ids, 0)
+        element = self.moves.element[safe_ids]
+        stab = (element == self.types[:, :, 0:1]) | (element == self.types[:, :, 1:2])
+        self.stab = where(stab, 1.5, 1.0)
+        opponent_types = self.types[:, ::-1, :]
+        type_1 = opponent_types[:, :, 0:1]
+        type_2 = where(opponent_types[:, :, 1:2] >= 0, opponent_types[:, :, 1:2], type_1)
+        self.type_modifier = TYPE_PAIR_DAMAGE_ARRAY[element, type_1, type_2]
+
+    @property
+    def live(self) -> anno.ndarray:
+        """Mask of the battles that have not been decided yet.
+
+        Returns:
+            ndarray: Boolean mask of shape (N,)
+        """
+        return self.winner == IN_PROGRESS
+
+    @property
+    def legal_moves(self) -> anno.ndarray:
+        """Mask of the move slots that have a move with PP remaining.
+
+        Returns:
+            ndarray: Boolean mask of shape (N, 2, 4)
+        """
+        return (self.move_ids >= 0) & (self.pp > 0)
+
+    def random_moves(self) -> anno.ndarray:
+        """Picks a random legal move slot for both sides of every battle. Sides without any legal move fall back to slot 0.
+
+        Returns:
+            ndarray: Slot indices of shape (N, 2)
+        """
+        scores = self.rng.random(self.pp.shape)
+        scores = where(self.legal_moves, scores, -1.0)
+        return scores.argmax(axis=2)
+
+    def _effective_stat(self, rows: anno.ndarray, sides: anno.ndarray, stat: int) -> anno.ndarray:
+        """Effective value of a stat adjusted by its current stage, identical to Participant's cached effective stats.
+
+        Args:
+            rows (ndarray): Battle indices
+            sides (ndarray): Side indices
+            stat (int): Stat index, ordered [p_atk, p_def, s_atk, s_def, spd]
+
+        Returns:
+            ndarray: Effective stat values
+        """
+        stage = self.stages[rows, sides, stat]
+        return (self.stats[rows, sides, stat] * _STAGE_MULTIPLIER[stage + 6]).astype(int64)
+
+    def _apply_status(self, rows: anno.ndarray, sides: anno.ndarray, status: anno.ndarray) -> None:
+        """Applies non-volatile statuses, mirroring Participant.apply_status_non_volatile and Creature.set_status.
+
+        Args:
+            rows (ndarray): Battle indices
+            sides (ndarray): Side indices
+            status (ndarray): Status value for each row
+        """
+        unaffected = self.status[rows, sides] == _NONE
+        r, s, st = rows[unaffected], sides[unaffected], status[unaffected]
+        self.status[r, s] = st
+        duration = full(len(r), -1, dtype=int16)
+        sleeping = st == _SLP
+        duration[sleeping] = self.rng.integers(1, 4, size=int(sleeping.sum()))
+        duration[st == _NONE] = 0
+        self.status_duration[r, s] = duration
+        bpsn = status == _BPSN
+        self.bpsn_counter[rows[bpsn], sides[bpsn]] = 1
+
+    def _heal(self, rows: anno.ndarray, sides: anno.ndarray, amount: anno.ndarray) -> None:
+        """Heals the creatures by the absolute amount provided, clipping to their maximum HP.
+
+        Args:
+            rows (ndarray): Battle indices
+            sides (ndarray): Side indices
+            amount (ndarray): Amount of HP to restore
+        """
+        self.hp[rows, sides] = minimum(self.hp[rows, sides] + abs(amount), self.max_hp[rows, sides])
+
+    def _apply_effects(self, rows: anno.ndarray, sides: anno.ndarray, move_ids: anno.ndarray, op_table: anno.ndarray, arg_table: anno.ndarray, amount_table: anno.ndarray) -> None:
+        """Applies the compiled move effect programs in the order they are listed on the move.
+
+        Args:
+            rows (ndarray): Battle indices
+            sides (ndarray): Side indices of the effected creatures
+            move_ids (ndarray): Move used in each row
+            op_table (ndarray): Opcode table of the effect list being applied
+            arg_table (ndarray): Argument table of the effect list being applied
+            amount_table (ndarray): Amount table of the effect list being applied
+        """
+        for k in range(op_table.shape[1]):
+            op = op_table[move_ids, k]
+            arg = arg_table[move_ids, k].astype(int64)
+            amount = amount_table[move_ids, k]
+            stage = op == OP_STAT_STAGE
+            if stage.any():
+                r, s, stat = rows[stage], sides[stage], arg[stage]
+                self.stages[r, s, stat] = clip(self.stages[r, s, stat] + amount[stage], _STAGE_MIN[stat], _STAGE_MAX[stat])
+            status = op == OP_STATUS
+            if status.any():
+                self._apply_status(rows[status], sides[status], arg[status])
+            heal_percent = op == OP_HEAL_PERCENT
+            if heal_percent.any():
+                r, s = rows[heal_percent], sides[heal_percent]
+                self._heal(r, s, (self.max_hp[r, s] * amount[heal_percent] / 100).astype(int64))
+            heal_flat = op == OP_HEAL_FLAT
+            if heal_flat.any():
+                self._heal(rows[heal_flat], sides[heal_flat], amount[heal_flat])
+
+    def _apply_action(self, rows: anno.ndarray, attackers: anno.ndarray, slots: anno.ndarray) -> None:
+        """Applies the moves of the attackers onto the defenders for the provided battles, mirroring CombatManager._apply_action.
+
+        Args:
+            rows (ndarray): Battle indices
+            attackers (ndarray): Side index of the attacker in each battle
+            slots (ndarray): Move slot used by the attacker in each battle
+        """
+        defenders = 1 - attackers
+        move_ids = self.move_ids[rows, attackers, slots]
+        paralyzed = self.status[rows, attackers] == _PAR
+        can_move = ~paralyzed | (self.rng.random(len(rows)) < 0.25)
+        rows, attackers, defenders, slots, move_ids = rows[can_move], attackers[can_move], defenders[can_move], slots[can_move], move_ids[can_move]
+        moves = self.moves
+        attacking = moves.is_attack[move_ids]
+        r, a, d, slot, m = rows[attacking], attackers[attacking], defenders[attacking], slots[attacking], move_ids[attacking]
+        if len(r) > 0:
+            # does_hit
+            modifier = clip(self.stages[r, a, _ACC].astype(int64) - self.stages[r, d, _EVA], -6, 6)
+            accuracy = moves.accuracy[m]
+            threshold = (accuracy * _ACCURACY_MULTIPLIER[modifier + 6]).astype(int64)
+            hit = (accuracy < 0) | (self.rng.integers(0, 100, size=len(r)) <= threshold)
+            r, a, d, slot, m = r[hit], a[hit], d[hit], slot[hit], m[hit]
+        if len(r) > 0:
+            # calculate_damage
+            physical = moves.is_physical[m]
+            attack = where(physical, self._effective_stat(r, a, 0), self._effective_stat(r, a, 2))
+            defense = where(physical, self._effective_stat(r, d, 1), self._effective_stat(r, d, 3))
+            power = moves.power[m] * self.stab[r, a, slot]
+            with errstate(divide='ignore', invalid='ignore'):
+                base = ((2 * self.level[r, a]) / 5 + 2) * power * (attack / defense) / 50 + 2
+            crit_stage = clip(moves.high_crit[m].astype(int64) + self.stages[r, a, _CRIT], 0, 3)
+            crit = where(self.rng.random(len(r)) <= _CRIT_CHANCE[crit_stage], 1.5, 1.0)
+            roll = self.rng.integers(85, 101, size=len(r)) / 100
+            # The weather and terrain of every battle are one lookup into the precomputed environment table
+            modifier = self.type_modifier[r, a, slot] * ENVIRONMENT_DAMAGE_ARRAY[self.environment[r], moves.element[m]]
+            damage = (base * crit * roll * modifier).astype(int64)
+            damage = where((attack == 0) & (defense == 0), 0, damage)
+            self.hp[r, d] = maximum(self.hp[r, d] - damage, 0)
+            # Lifesteal
+            lifesteal = moves.lifesteal_op[m]
+            amount = moves.lifesteal_amount[m]
+            steal = lifesteal != _OP_NONE
+            if steal.any():
+                heal = where(lifesteal == OP_LIFESTEAL_PERCENT, (damage * amount / 100).astype(int64), amount)
+                self._heal(r[steal], a[steal], heal[steal])
+        self._apply_effects(rows, attackers, move_ids, moves.self_op, moves.self_arg, moves.self_amount)
+        self._apply_effects(rows, defenders, move_ids, moves.opp_op, moves.opp_arg, moves.opp_amount)
+        self._apply_environment_effects(rows, move_ids)
+
+    def _apply_environment_effects(self, rows: anno.ndarray, move_ids: anno.ndarray) -> None:
+        """Sets the weather and terrain of the compiled environment programs, mirroring CombatManager.set_weather and CombatManager.set_terrain.
+
+        Args:
+            rows (ndarray): Battle indices
+            move_ids (ndarray): Move used in each row
+        """
+        moves = self.moves
+        for k in range(moves.env_op.shape[1]):
+            op = moves.env_op[move_ids, k]
+            arg = moves.env_arg[move_ids, k].astype(int64)
+            weather = op == OP_WEATHER
+            if weather.any():
+                r = rows[weather]
+                self.environment[r] = (arg[weather] + 1) * TERRAIN_COUNT + self.environment[r] % TERRAIN_COUNT
+                self.weather_turns[r] = ENVIRONMENT_DURATION
+            terrain = op == OP_TERRAIN
+            if terrain.any():
+                r = rows[terrain]
+                self.environment[r] = self.environment[r] - self.environment[r] % TERRAIN_COUNT + arg[terrain] + 1
+                self.terrain_turns[r] = ENVIRONMENT_DURATION
+
+    def _apply_end_turn_effects(self, rows: anno.ndarray) -> None:
+        """Applies the end turn effects of both sides for the provided battles, mirroring Participant.apply_end_turn_effects.
+
+        Args:
+            rows (ndarray): Battle indices
+        """
+        status = self.status[rows]
+        max_hp = self.max_hp[rows]
+        chip = where((status == _BRN) | (status == _PSN), max_hp // 8, 0)
+        bpsn = status == _BPSN
+        chip = where(bpsn, (max_hp * self.bpsn_counter[rows]) // 16, chip)
+        self.hp[rows] = maximum(self.hp[rows] - chip, 0)
+        self.bpsn_counter[rows] += bpsn
+        thaws = (status == _FRZ) & (self.rng.random(status.shape) < 0.2)
+        status = where(thaws, _NONE, status)
+        duration = where(thaws, 0, self.status_duration[rows])
+        timed = duration != -1
+        duration = where(timed, maximum(duration - 1, 0), duration)
+        status = where(timed & (duration == 0), _NONE, status)
+        self.status[rows] = status
+        self.status_duration[rows] = duration
+        environment = self.environment[rows]
+        if environment.any():
+            # Environment chip, looked up by the typing of each creature in the environment of its battle
+            types = self.types[rows]
+            type_2 = where(types[:, :, 1] >= 0, types[:, :, 1], types[:, :, 0])
+            chip = (max_hp * ENVIRONMENT_CHIP_ARRAY[types[:, :, 0], type_2, environment[:, None]]).astype(int64)
+            hp = self.hp[rows]
+            self.hp[rows] = where(hp > 0, clip(hp - chip, 0, max_hp), hp)
+            weather_turns = self.weather_turns[rows]
+            timed = weather_turns > 0
+            weather_turns = where(timed, weather_turns - 1, weather_turns)
+            environment = where(timed & (weather_turns == 0), environment % TERRAIN_COUNT, environment)
+            terrain_turns = self.terrain_turns[rows]
+            timed = terrain_turns > 0
+            terrain_turns = where(timed, terrain_turns - 1, terrain_turns)
+            environment = where(timed & (terrain_turns == 0), environment - environment % TERRAIN_COUNT, environment)
+            self.weather_turns[rows] = weather_turns
+            self.terrain_turns[rows] = terrain_turns
+            self.environment[rows] = environment
+
+    def _update_winner(self, rows: anno.ndarray) -> None:
+        """Records the result for every battle in rows where at least one creature has fainted.
+
+        Args:
+            rows (ndarray): Battle indices
+        """
+        alive = self.hp[rows] > 0
+        result = where(alive[:, 0] & ~alive[:, 1], PLAYER_1_WIN, where(~alive[:, 0] & alive[:, 1], PLAYER_2_WIN, where(alive[:, 0], IN_PROGRESS, DRAW)))
+        self.winner[rows] = result
+
+    def step_round(self, moves: anno.Optional[anno.ndarray]=None) -> None:
+        """Simulates one round for every live battle.
+
+        First get the move slot used by each side, defaulting to a random legal move.
+        Second determine priority based on move chosen and speed.
+        Third apply the action of the faster creature onto the slower.
+        Forth apply the action of the slower creature if it is still alive.
+        Fifth apply the end round effects for both sides.
+        Sixth record the winner of every battle that has a fainted creature.
+
+        Args:
+            moves (Optional[ndarray], optional): Move slots of shape (N, 2) used by player 1 and player 2 in every battle. Defaults to None.
+        """
+        rows = nonzero(self.live)[0]
+        if len(rows) == 0:
+            return
+        if moves is None:
+            moves = self.random_moves()
+        slots = moves[rows].astype(int64)
+        self.round_number[rows] += 1
+        side_index = arange(2)[None, :]
+        # Player.make_move spends the PP when the move is selected
+        chosen = take_along_axis(self.pp[rows], slots[:, :, None], axis=2)[:, :, 0]
+        self.pp[rows[:, None], side_index, slots] = chosen - 1
+        move_ids = take_along_axis(self.move_ids[rows], slots[:, :, None], axis=2)[:, :, 0]
+        priority = self.moves.priority[move_ids]
+        spd_1 = self._effective_stat(rows, zeros(len(rows), dtype=int64), _SPD)
+        spd_2 = self._effective_stat(rows, ones(len(rows), dtype=int64), _SPD)
+        player_1_first = (priority[:, 0] > priority[:, 1]) | ((priority[:, 0] == priority[:, 1]) & (spd_1 >= spd_2))
+        first = where(player_1_first, 0, 1)
+        second = 1 - first
+        index = arange(len(rows))
+        self._apply_action(rows, first, slots[index, first])
+        second_alive = self.hp[rows, second] > 0
+        self._apply_action(rows[second_alive], second[second_alive], slots[index, second][second_alive])
+        self._apply_end_turn_effects(rows)
+        self._update_winner(rows)
+
+    def run(self, max_rounds: int=1000) -> anno.ndarray:
+        """Steps every battle with random legal moves until it is decided or max_rounds is reached. Battles still running at max_rounds are recorded as draws.
+
+        Args:
+            max_rounds (int, optional): Maximum number of rounds to simulate. Defaults to 1000.
+
+        Returns:
+            ndarray: Result of every battle, one of DRAW, PLAYER_1_WIN or PLAYER_2_WIN
+        """
+        while self.live.any() and self.round_number.max() < max_rounds:
+            self.step_round()
+        self.winner[self.live] = DRAW
+        return self.winner
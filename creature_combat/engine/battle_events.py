@@ -0,0 +1,202 @@
+from __future__ import annotations
+import sys
+from abc import ABC, abstractmethod
+
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.extended_enums import ExtendedEnum
+
+
+class BattleEventEnum(ExtendedEnum):
+    # (side, slot) of the attacker, value_1 is the defender slot and value_2 the damage dealt
+    DAMAGE:int=0
+    # (side, slot) of the attacker whose move missed
+    MISS:int=1
+    # (side, slot) of the creature that was fully paralyzed
+    PARALYZED:int=2
+    # (side, slot) of the creature, value_1 is the current hp and value_2 the max hp
+    HP:int=3
+    # (side, slot) of the creature that fainted
+    FAINTED:int=4
+    # (side, slot) of the creature sent into combat
+    SWITCH:int=5
+    # value_1 is the round number that completed
+    ROUND_END:int=6
+    # (side, slot) of the creature that flinched and could not move
+    FLINCHED:int=7
+    # (side, slot) of the creature that hurt itself in its confusion instead of moving
+    CONFUSED:int=8
+    # (side, slot) of the creature a move afflicted with a status, value_1 is the status value and value_2 is 1 for volatile statuses. Not displayed
+    STATUS:int=9
+
+
+# Plain int event types, so the engine emits ints instead of enum members
+EVENT_DAMAGE = BattleEventEnum.DAMAGE.value
+EVENT_MISS = BattleEventEnum.MISS.value
+EVENT_PARALYZED = BattleEventEnum.PARALYZED.value
+EVENT_HP = BattleEventEnum.HP.value
+EVENT_FAINTED = BattleEventEnum.FAINTED.value
+EVENT_SWITCH = BattleEventEnum.SWITCH.value
+EVENT_ROUND_END = BattleEventEnum.ROUND_END.value
+EVENT_FLINCHED = BattleEventEnum.FLINCHED.value
+EVENT_CONFUSED = BattleEventEnum.CONFUSED.value
+EVENT_STATUS = BattleEventEnum.STATUS.value
+
+# Number of ints stored per event: event type, side, slot, value_1, value_2
+EVENT_FIELDS = 5
+
+
+class EventSink(ABC):
+    """Receives the structured events emitted by a CombatManager. Every event is five ints: the event type, the side (0 for player 1, 1 for player 2)
+    and team slot of the creature it is about, and two event specific values described on BattleEventEnum. Creature names are only provided once per
+    battle through begin_battle, so sinks that never render text never touch a string.
+    """
+    def begin_battle(self, team_1_names: anno.Sequence[str], team_2_names: anno.Sequence[str]) -> None:
+        """Called when a battle is reset, before the first creatures are sent in.
+
+        Args:
+            team_1_names (Sequence[str]): Creature names of player 1 by team slot
+            team_2_names (Sequence[str]): Creature names of player 2 by team slot
+        """
+        pass
+
+    @abstractmethod
+    def emit(self, event: int, side: int, slot: int, value_1: int, value_2: int) -> None:
+        """Receives one event.
+
+        Args:
+            event (int): BattleEventEnum value of the event
+            side (int): 0 for player 1, 1 for player 2
+            slot (int): Team slot of the creature the event is about
+            value_1 (int): First event specific value
+            value_2 (int): Second event specific value
+        """
+        pass
+
+    def flush(self) -> None:
+        """Writes out anything the sink has buffered.
+        """
+        pass
+
+
+def render_event(event: int, side: int, slot: int, value_1: int, value_2: int, names: anno.Tuple[anno.Sequence[str], anno.Sequence[str]]) -> anno.Optional[str]:
+    """Renders a structured event into the message the engine displays for it.
+
+    Args:
+        event (int): BattleEventEnum value of the event
+        side (int): 0 for player 1, 1 for player 2
+        slot (int): Team slot of the creature the event is about
+        value_1 (int): First event specific value
+        value_2 (int): Second event specific value
+        names (Tuple[Sequence[str], Sequence[str]]): Creature names of each side by team slot
+
+    Returns:
+        Optional[str]: The message, or None if the event is not displayed
+    """
+    if event == EVENT_ROUND_END:
+        return f"Round: {value_1:02d} completed!"
+    name = names[side][slot]
+    if event == EVENT_DAMAGE:
+        return f"{name} dealt {value_2} to {names[1 - side][value_1]}!"
+    elif event == EVENT_MISS:
+        return f"{name}'s attacked missed!"
+    elif event == EVENT_PARALYZED:
+        return f"{name} was paralyzed and could not move."
+    elif event == EVENT_HP:
+        return f"{name} HP: [ {value_1:03} / {value_2:03} ]"
+    elif event == EVENT_FAINTED:
+        return f"{name} has fainted!"
+    elif event == EVENT_FLINCHED:
+        return f"{name} flinched and could not move."
+    elif event == EVENT_CONFUSED:
+        return f"{name} hurt itself in its confusion."
+    return None
+
+
+class EventLog(EventSink):
+    """Ring buffer of structured events. Events are stored as ints in one flat preallocated list, so emitting never allocates, and once capacity events
+    have been emitted the oldest events are overwritten. Text is only rendered when render is called.
+    """
+    def __init__(self, capacity: int=4096):
+        assert capacity > 0, f"Capacity must be positive, provided {capacity}"
+        self.capacity = capacity
+        self._buffer: anno.List[int] = [0] * (capacity * EVENT_FIELDS)
+        self._count = 0
+        self.names: anno.Tuple[anno.Sequence[str], anno.Sequence[str]] = ((), ())
+
+    def begin_battle(self, team_1_names: anno.Sequence[str], team_2_names: anno.Sequence[str]) -> None:
+        self.names = (tuple(team_1_names), tuple(team_2_names))
+        self._count = 0
+
+    def emit(self, event: int, side: int, slot: int, value_1: int, value_2: int) -> None:
+        buffer = self._buffer
+        index = (self._count % self.capacity) * EVENT_FIELDS
+        buffer[index] = event
+        buffer[index + 1] = side
+        buffer[index + 2] = slot
+        buffer[index + 3] = value_1
+        buffer[index + 4] = value_2
+        self._count += 1
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def clear(self) -> None:
+        """Removes every event from the log.
+        """
+        self._count = 0
+
+    def events(self) -> anno.List[anno.Tuple[int, int, int, int, int]]:
+        """Returns the events still in the buffer from oldest to newest.
+
+        Returns:
+            List[Tuple[int, int, int, int, int]]: (event, side, slot, value_1, value_2) for every event
+        """
+        start = max(0, self._count - self.capacity)
+        events = []
+        for n in range(start, self._count):
+            index = (n % self.capacity) * EVENT_FIELDS
+            events.append(tuple(self._buffer[index:index + EVENT_FIELDS]))
+        return events
+
+    def render(self) -> anno.List[str]:
+        """Renders the events still in the buffer into messages.
+
+        Returns:
+            List[str]: Message for every displayed event, from oldest to newest
+        """
+        messages = [render_event(*event, self.names) for event in self.events()]
+        return [message for message in messages if message is not None]
+
+
+class TextEventSink(EventSink):
+    """Renders events into the messages of the engine and writes them to a text stream. Messages are buffered for the whole round and written with a
+    single write call once the round ends.
+    """
+    def __init__(self, stream: anno.Optional[anno.TextIO]=None):
+        """
+        Args:
+            stream (Optional[TextIO], optional): Stream to write to. Defaults to sys.stdout at the time of writing.
+        """
+        self.stream = stream
+        self.names: anno.Tuple[anno.Sequence[str], anno.Sequence[str]] = ((), ())
+        self._lines: anno.List[str] = [""]
+
+    def begin_battle(self, team_1_names: anno.Sequence[str], team_2_names: anno.Sequence[str]) -> None:
+        self.names = (tuple(team_1_names), tuple(team_2_names))
+        self._lines = [""]
+
+    def emit(self, event: int, side: int, slot: int, value_1: int, value_2: int) -> None:
+        message = render_event(event, side, slot, value_1, value_2, self.names)
+        if message is not None:
+            self._lines.append(message)
+        if event == EVENT_ROUND_END:
+            self._lines.append("")
+            self.flush()
+
+    def flush(self) -> None:
+        if len(self._lines) == 1 and self._lines[0] == "":
+            return
+        stream = sys.stdout if self.stream is None else self.stream
+        stream.write("\n".join(self._lines) + "\n")
+        stream.flush()
+        self._lines = [""]
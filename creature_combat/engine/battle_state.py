@@ -0,0 +1,78 @@
+from __future__ import annotations
+from array import array
+
+from creature_combat.utils import annotations as anno
+
+# Number of ints CombatManager writes before the players: the round number, the environment index and the weather and terrain turns left
+BATTLE_STATE_HEADER_SIZE = 4
+
+
+class BattleState:
+    """Compact snapshot of everything that changes during a battle, stored as one flat array of machine ints. The layout is the round number and the environment followed by
+    each player's active team slot, participant stat stages, bad poison counter and volatile statuses, then the hp, status, status duration and per slot
+    PP of every creature in team order. Moves, base stats and every other immutable part of the battle are never stored, restoring writes the ints back
+    into the existing objects. The RNG is not part of the state, so rollouts from the same snapshot can play out differently.
+
+    clone is copy-on-write: the clone shares the array until either state is written to by CombatManager.snapshot. States sharing an array share a count 
+    of the states using it, so the last state left writes in place. States dropped without being written to still count, so their array is copied once 
+    by the next write.
+    """
+    def __init__(self, size: int):
+        self.data: array = array('l', [0]) * size
+        # Number of states using data, shared by every state that uses it
+        self._users: anno.List[int] = [1]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BattleState) and self.data == other.data
+
+    def clone(self) -> BattleState:
+        """Makes a copy-on-write copy of the state without copying the array.
+
+        Returns:
+            BattleState: State sharing the same array until one of them is written to
+        """
+        clone = BattleState.__new__(BattleState)
+        clone.data = self.data
+        clone._users = self._users
+        self._users[0] += 1
+        return clone
+
+    def writable(self) -> array:
+        """Returns the array to write a snapshot into, copying it first if it is shared with a clone.
+
+        Returns:
+            array: Array owned by this state
+        """
+        users = self._users
+        if users[0] > 1:
+            users[0] -= 1
+            self.data = self.data[:]
+            self._users = [1]
+        return self.data
+
+    def to_bytes(self) -> bytes:
+        """Serializes the state, i.e. to store it or send it to another process.
+
+        Returns:
+            bytes: Raw bytes of the array
+        """
+        return self.data.tobytes()
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> anno.Self:
+        """Loads a state serialized by to_bytes.
+
+        Args:
+            raw (bytes): Raw bytes of the array
+
+        Returns:
+            Self: The deserialized state
+        """
+        state = cls.__new__(cls)
+        state.data = array('l')
+        state.data.frombytes(raw)
+        state._users = [1]
+        return state
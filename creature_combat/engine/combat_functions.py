@@ -1,14 +1,17 @@
 from __future__ import annotations
-from numpy.random import randint, uniform
+
+from creature_combat.environment.environment_tables import ENVIRONMENT_CHIP, ENVIRONMENT_DAMAGE_MODIFIERS, NO_ENVIRONMENT
+from creature_combat.moves.move_effects import OP_STAT_STAGE, compile_effect
 from creature_combat.moves.move_types import MoveTypeEnum
 from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
 from creature_combat.utils import annotations as anno
 from creature_combat.utils.math_utils import clip
-from creature_combat.utils.mappings import DAMAGE_MAP
+from creature_combat.utils.mappings import DEFENSIVE_TYPE_MODIFIERS, STAGE_MULTIPLIERS
+from creature_combat.utils.rng import get_default_rng
 
 
-def does_hit(move: anno.Move, attacker: anno.Participant, defender: anno.Participant) -> bool:
-    """Determines if the move from the attacker will hit the defender.
+def accuracy_threshold(move: anno.Move, attacker: anno.Participant, defender: anno.Participant) -> int:
+    """Determines the highest accuracy roll on [0, 100) that still hits, based on the accuracy of the move and the accuracy and evasion stages.
 
     Args:
         move (Move): The move the attacker is using 
@@ -16,16 +19,48 @@ def does_hit(move: anno.Move, attacker: anno.Participant, defender: anno.Partici
         defender (Participant): The defender receiving the attack
 
     Returns:
-        bool: Does the Move hit or not 
+        int: Highest roll that hits the defender
     """
     modifier = clip(attacker.acc_stage - defender.eva_stage, -6, 6)
     # Factor moves on a scale of 9/3 when modifier is 6, to 3/9 when modifier is -6. 
     factor = (3 + modifier) / 3 if modifier >= 0 else 3 / (3 - modifier)
-    return randint(0, 100) <= int(move.accuracy * factor)
+    return int(move.accuracy * factor)
 
 
-def does_crit(move: anno.Move, attacker: anno.Participant) -> bool:
-    """Determines if the move will crit on the target or not.
+def does_hit(move: anno.Move, attacker: anno.Participant, defender: anno.Participant, rng: anno.Optional[anno.CombatRNG]=None) -> bool:
+    """Determines if the move from the attacker will hit the defender.
+
+    Args:
+        move (Move): The move the attacker is using 
+        attacker (Participant): The attacker making the attack
+        defender (Participant): The defender receiving the attack
+        rng (Optional[CombatRNG], optional): Random number source for the roll. Defaults to the shared default RNG.
+
+    Returns:
+        bool: Does the Move hit or not 
+    """
+    rng = get_default_rng() if rng is None else rng
+    return rng.randint(0, 100) <= accuracy_threshold(move, attacker, defender)
+
+
+def hit_chance(move: anno.Move, attacker: anno.Participant, defender: anno.Participant) -> float:
+    """Probability that does_hit returns True for the move. Moves without an accuracy always hit.
+
+    Args:
+        move (Move): The move the attacker is using 
+        attacker (Participant): The attacker making the attack
+        defender (Participant): The defender receiving the attack
+
+    Returns:
+        float: Chance for the move to hit on [0, 1]
+    """
+    if move.accuracy is None:
+        return 1.0
+    return clip(accuracy_threshold(move, attacker, defender) + 1, 0, 100) / 100
+
+
+def crit_chance(move: anno.Move, attacker: anno.Participant) -> float:
+    """Determines the chance for the move to crit, based on the high crit flag of the move and the crit stage of the attacker.
 
     Args:
         move (Move): The move being used by the attacker
@@ -35,7 +70,7 @@ def does_crit(move: anno.Move, attacker: anno.Participant) -> bool:
         ValueError: If the crit_stage of the attacker is beyond the expected range of [0-3] something critically has gone wrong and will error out.
 
     Returns:
-        bool: Does the move crit the target or not 
+        float: Chance for the move to crit on [0, 1]
     """
     modifier = clip(int(move.high_crit_flag) + attacker.crit_stage, 0, 3)
     match modifier:
@@ -49,16 +84,31 @@ def does_crit(move: anno.Move, attacker: anno.Participant) -> bool:
             target = 1.0
         case _:
             raise ValueError(f"Modifier went outside of allowable bounds [0-3] @ {modifier}. Plz fix.")
-    return uniform(0.0, 1.0) <= target
+    return target
+
+
+def does_crit(move: anno.Move, attacker: anno.Participant, rng: anno.Optional[anno.CombatRNG]=None) -> bool:
+    """Determines if the move will crit on the target or not.
+
+    Args:
+        move (Move): The move being used by the attacker
+        attacker (Participant): The attacker using the move
+        rng (Optional[CombatRNG], optional): Random number source for the roll. Defaults to the shared default RNG.
+
+    Returns:
+        bool: Does the move crit the target or not 
+    """
+    rng = get_default_rng() if rng is None else rng
+    return rng.uniform() <= crit_chance(move, attacker)
 
 
 def stat_stage_modifier(stage: int) -> float:
-    stage = clip(stage, -6, 6)
-    return (2 + stage) / 2 if stage >= 0 else 2 / (2 - stage)
+    return STAGE_MULTIPLIERS[clip(stage, -6, 6) + 6]
 
 
 def get_type_modifier(move: anno.Move, target: anno.Participant) -> float:
-    """Gets the damage modifier for the move against the target based on the typing of both the target and move.
+    """Gets the damage modifier for the move against the target based on the typing of both the target and move. Reads the target's modifiers that were
+    cached when its creature was added to the participant.
 
     Args:
         move (Move): Move being used against the target
@@ -67,15 +117,39 @@ def get_type_modifier(move: anno.Move, target: anno.Participant) -> float:
     Returns:
         float: How much the damage is modified based on the typing between the move and target
     """
-    mod = 1.0
-    for target_type in target.creature._types:
-        if target_type is not None:
-            mod *= DAMAGE_MAP[move.element.value, target_type.value]
-    return mod
+    return target.type_modifiers[move.element.value]
 
 
-def calculate_damage(move: anno.Move, attacker: anno.Participant, defender: anno.Participant) -> int:
-    """Determines how much damage is done by the move from the attacker to the defender. The function follows a simplified version of the GEN5+ damage calculation formula found here: https://bulbapedia.bulbagarden.net/wiki/Damage
+def get_defensive_type_modifiers(types: anno.Tuple[anno.CreatureTypeEnum, anno.Optional[anno.CreatureTypeEnum]]) -> anno.Tuple[float, ...]:
+    """Looks up the damage modifier of every attacking element against a creature with the provided typing.
+
+    Args:
+        types (Tuple[CreatureTypeEnum, Optional[CreatureTypeEnum]]): Typing of the defending creature
+
+    Returns:
+        Tuple[float, ...]: Damage modifier for each attacking element, indexed by CreatureTypeEnum value
+    """
+    type_1 = types[0].value
+    type_2 = type_1 if types[1] is None else types[1].value
+    return DEFENSIVE_TYPE_MODIFIERS[type_1][type_2]
+
+
+def get_environment_chip(types: anno.Tuple[anno.CreatureTypeEnum, anno.Optional[anno.CreatureTypeEnum]]) -> anno.Tuple[float, ...]:
+    """Looks up the fraction of the max hp a creature with the provided typing loses at the end of every turn in each environment.
+
+    Args:
+        types (Tuple[CreatureTypeEnum, Optional[CreatureTypeEnum]]): Typing of the creature
+
+    Returns:
+        Tuple[float, ...]: End turn chip for each environment index, negative values heal
+    """
+    type_1 = types[0].value
+    type_2 = type_1 if types[1] is None else types[1].value
+    return ENVIRONMENT_CHIP[type_1][type_2]
+
+
+def _attack_and_defense(move: anno.Move, attacker: anno.Participant, defender: anno.Participant) -> anno.Tuple[int, int]:
+    """Selects the effective attack and defense stats used by the move.
 
     Args:
         move (Move): The move being used by the attacker
@@ -83,26 +157,42 @@ def calculate_damage(move: anno.Move, attacker: anno.Participant, defender: anno
         defender (Participant): The defender receiving the attack
 
     Returns:
-        int: How much damage should be dealt to the defender 
+        Tuple[int, int]: Attack and defense stats, both 0 for status moves
     """
     match move.move_type:
         case MoveTypeEnum.PHYSICAL:
-            a = attacker.p_atk
-            d = defender.p_def
+            return attacker.p_atk, defender.p_def
         case MoveTypeEnum.SPECIAL:
-            a = attacker.s_atk
-            d = defender.s_def
+            return attacker.s_atk, defender.s_def
         case _:
-            a = 0
-            d = 0
+            return 0, 0
+
+
+def calculate_damage(move: anno.Move, attacker: anno.Participant, defender: anno.Participant, rng: anno.Optional[anno.CombatRNG]=None, 
+                     environment: int=NO_ENVIRONMENT) -> int:
+    """Determines how much damage is done by the move from the attacker to the defender. The function follows a simplified version of the GEN5+ damage calculation formula found here: https://bulbapedia.bulbagarden.net/wiki/Damage
+    The weather and terrain are applied together as one precomputed multiplier of the move's element.
+
+    Args:
+        move (Move): The move being used by the attacker
+        attacker (Participant): The attacker using the attack
+        defender (Participant): The defender receiving the attack
+        rng (Optional[CombatRNG], optional): Random number source for the crit and damage rolls. Defaults to the shared default RNG.
+        environment (int, optional): Environment index of the battle, see environment_index. Defaults to NO_ENVIRONMENT.
+
+    Returns:
+        int: How much damage should be dealt to the defender 
+    """
+    a, d = _attack_and_defense(move, attacker, defender)
     if a == 0 and d == 0:
         return 0
     stab = 1.5 if attacker.creature.is_stab(move) else 1.0
     power = move.power * stab
     base = ((2 * attacker.lvl) / 5 + 2) * power * (a / d) / 50 + 2
-    crit = 1.5 if does_crit(move, attacker) else 1.0
-    random = randint(85, 101) / 100
-    type_modifier = get_type_modifier(move, defender)
+    rng = get_default_rng() if rng is None else rng
+    crit = 1.5 if does_crit(move, attacker, rng) else 1.0
+    random = rng.randint(85, 101) / 100
+    type_modifier = get_type_modifier(move, defender) * ENVIRONMENT_DAMAGE_MODIFIERS[environment][move.element.value]
     return int(base * crit * random * type_modifier)
 
 
@@ -128,7 +218,8 @@ def participant_1_first(participant1: anno.Participant, move1: anno.Move, partic
 
 
 def adjust_stat_stage(effect_name: str, effected: anno.Participant) -> None:
-    """Parses the effect name and adjusts the effected participants stat stage based on the name.
+    """Parses the effect name and adjusts the effected participants stat stage based on the name. The engine runs compiled effect programs instead, 
+    this is kept for callers working with effect strings.
 
     Args:
         effect_name (str): Name of the effect effecting the participant
@@ -137,29 +228,25 @@ def adjust_stat_stage(effect_name: str, effected: anno.Participant) -> None:
     Raises:
         ValueError: If a non stat effect is passed in, it can not be parsed to adjust a specific stat and will error out.
     """
-    stat, amount  = effect_name.split(':')
-    amount = int(amount)
-    match stat:
-        case "P_ATK":
-            effected.adjust_p_atk_stage(amount)
-        case "P_DEF":
-            effected.adjust_p_def_stage(amount)
-        case "S_ATK":
-            effected.adjust_s_atk_stage(amount)
-        case "S_DEF":
-            effected.adjust_s_def_stage(amount)
-        case "SPD":
-            effected.adjust_spd_stage(amount)
-        case "ACC":
-            effected.adjust_acc_stage(amount)
-        case "EVA":
-            effected.adjust_eva_stage(amount)
-        case "CRIT":
-            effected.adjust_crit_stage(amount)
-        case _:
-            raise ValueError(f"Unable to parse stat change category {stat}, please provide a valid stat category.")
+    opcode, stat_index, amount = compile_effect(effect_name)
+    if opcode != OP_STAT_STAGE:
+        raise ValueError(f"Unable to parse stat change category {effect_name}, please provide a valid stat category.")
+    effected.adjust_stage(stat_index, amount)
 
 
-def apply_status_effect(effect_name: str, effected: anno.Participant) -> None:
+def apply_status_effect(effect_name: str, effected: anno.Participant, rng: anno.Optional[anno.CombatRNG]=None) -> None:
     status = NonVolatileStatusEnum[effect_name]
-    effected.apply_status_non_volatile(status)
+    effected.apply_status_non_volatile(status, rng)
+
+
+# The exact damage distributions are vectorized with NumPy, they live in creature_combat.engine.distributions and are forwarded on first access so that
+# importing the scalar combat functions does not import NumPy
+_DISTRIBUTION_NAMES = ('DamageDistribution', 'damage_distribution', 'damage_distribution_arrays', 'damage_distributions')
+
+
+def __getattr__(name: str):
+    """Imports the damage distribution functions from creature_combat.engine.distributions on first access."""
+    if name in _DISTRIBUTION_NAMES:
+        from creature_combat.engine import distributions
+        return getattr(distributions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
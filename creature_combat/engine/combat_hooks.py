@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from creature_combat.engine.battle_events import BattleEventEnum, EventSink, EVENT_DAMAGE, EVENT_FAINTED, EVENT_ROUND_END, EVENT_STATUS
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.extended_enums import ExtendedEnum
+
+
+class CombatHookEnum(ExtendedEnum):
+    # A move dealt damage, the record is about the attacker, value_1 is the defender slot and value_2 the damage dealt
+    ON_DAMAGE:int=0
+    # A creature fainted, the record is about the fainted creature
+    ON_FAINT:int=1
+    # A move afflicted a creature with a status, value_1 is the status value and value_2 is 1 for volatile statuses
+    ON_STATUS:int=2
+    # A round completed, value_1 is the round number
+    ON_ROUND_END:int=3
+
+
+# Event dispatched to each hook
+_HOOK_EVENTS = {
+    CombatHookEnum.ON_DAMAGE: EVENT_DAMAGE,
+    CombatHookEnum.ON_FAINT: EVENT_FAINTED,
+    CombatHookEnum.ON_STATUS: EVENT_STATUS,
+    CombatHookEnum.ON_ROUND_END: EVENT_ROUND_END,
+}
+
+
+class HookRecord:
+    """Event record passed to hook callbacks. Every dispatcher owns a single record that is overwritten before each callback, so dispatching an event
+    allocates nothing. Callbacks that need the values after they return must copy them out.
+    """
+    __slots__ = ('manager', 'event', 'side', 'slot', 'value_1', 'value_2')
+
+    def __init__(self, manager: anno.CombatManager):
+        self.manager = manager
+        self.event = 0
+        self.side = 0
+        self.slot = 0
+        self.value_1 = 0
+        self.value_2 = 0
+
+    @property
+    def participant(self) -> anno.Participant:
+        """Participant of the side the event is about
+
+        Returns:
+            Participant: The participant
+        """
+        return self.manager._players[self.side].participant
+
+    def as_tuple(self) -> anno.Tuple[int, int, int, int, int]:
+        """Copies the record out in the same layout as EventLog.events.
+
+        Returns:
+            Tuple[int, int, int, int, int]: (event, side, slot, value_1, value_2)
+        """
+        return (self.event, self.side, self.slot, self.value_1, self.value_2)
+
+
+class HookRegistry:
+    """Callbacks registered on a CombatManager by hook. The registry only stores them, the manager builds a HookDispatcher from it whenever a callback
+    is added or removed.
+    """
+    def __init__(self):
+        self._callbacks: anno.Dict[CombatHookEnum, anno.List[anno.HookCallback]] = {hook: [] for hook in CombatHookEnum}
+
+    def __len__(self) -> int:
+        return sum(len(callbacks) for callbacks in self._callbacks.values())
+
+    def add(self, hook: CombatHookEnum, callback: anno.HookCallback) -> None:
+        """Registers a callback, callbacks of the same hook are called in the order they were added.
+
+        Args:
+            hook (CombatHookEnum): Hook to subscribe to
+            callback (HookCallback): Called with the HookRecord of every event of the hook
+        """
+        self._callbacks[hook].append(callback)
+
+    def remove(self, hook: CombatHookEnum, callback: anno.HookCallback) -> None:
+        """Unregisters a callback.
+
+        Args:
+            hook (CombatHookEnum): Hook the callback was added to
+            callback (HookCallback): The callback to remove
+
+        Raises:
+            ValueError: If the callback is not registered on the hook
+        """
+        try:
+            self._callbacks[hook].remove(callback)
+        except ValueError:
+            raise ValueError(f"Callback {callback!r} is not registered on {hook.name}") from None
+
+    def dispatch_table(self) -> anno.Tuple[anno.Tuple[anno.HookCallback, ...], ...]:
+        """Lays out the callbacks by the event they are dispatched on.
+
+        Returns:
+            Tuple[Tuple[HookCallback, ...], ...]: Callbacks for every BattleEventEnum value, empty for events without subscribers
+        """
+        table: anno.List[anno.Tuple[anno.HookCallback, ...]] = [()] * len(BattleEventEnum)
+        for hook, event in _HOOK_EVENTS.items():
+            table[event] = tuple(self._callbacks[hook])
+        return tuple(table)
+
+
+class HookDispatcher(EventSink):
+    """Event sink the CombatManager attaches while hooks are registered. It forwards every event to the sink attached by the user, if any, and calls
+    the callbacks subscribed to the event with the preallocated record. The dispatch table is frozen when the dispatcher is built, so emitting only
+    indexes a tuple.
+    """
+    def __init__(self, manager: anno.CombatManager, registry: HookRegistry, sink: anno.Optional[EventSink]=None):
+        """
+        Args:
+            manager (CombatManager): Manager the hooks are registered on, exposed to callbacks through the record
+            registry (HookRegistry): Callbacks to dispatch to
+            sink (Optional[EventSink], optional): Sink to forward every event to. Defaults to None.
+        """
+        self.sink = sink
+        self.record = HookRecord(manager)
+        self._table = registry.dispatch_table()
+
+    def begin_battle(self, team_1_names: anno.Sequence[str], team_2_names: anno.Sequence[str]) -> None:
+        if self.sink is not None:
+            self.sink.begin_battle(team_1_names, team_2_names)
+
+    def emit(self, event: int, side: int, slot: int, value_1: int, value_2: int) -> None:
+        if self.sink is not None:
+            self.sink.emit(event, side, slot, value_1, value_2)
+        callbacks = self._table[event]
+        if callbacks:
+            record = self.record
+            for callback in callbacks:
+                record.event = event
+                record.side = side
+                record.slot = slot
+                record.value_1 = value_1
+                record.value_2 = value_2
+                callback(record)
+
+    def flush(self) -> None:
+        if self.sink is not None:
+            self.sink.flush()
@@ -1,18 +1,51 @@
 from __future__ import annotations
-from typing import List
-from numpy.random import uniform
-from creature_combat.engine.combat_functions import calculate_damage, participant_1_first, adjust_stat_stage, does_hit, apply_status_effect
+from creature_combat.engine.battle_events import EVENT_DAMAGE, EVENT_MISS, EVENT_HP, EVENT_FAINTED, EVENT_SWITCH, EVENT_ROUND_END, EVENT_STATUS, TextEventSink
+from creature_combat.engine.combat_hooks import HookDispatcher, HookRegistry
+from creature_combat.engine.battle_state import BattleState, BATTLE_STATE_HEADER_SIZE
+from creature_combat.engine.combat_functions import calculate_damage, participant_1_first, does_hit
+from creature_combat.environment.environment_tables import (ENVIRONMENT_COUNT, ENVIRONMENT_DURATION, NO_ENVIRONMENT, environment_index, environment_terrain, 
+                                                            environment_weather)
+from creature_combat.environment.environment_types import TerrainEnum, WeatherEnum
+from creature_combat.moves.move_effects import OP_STAT_STAGE, OP_STATUS, OP_HEAL_PERCENT, OP_HEAL_FLAT, OP_LIFESTEAL_PERCENT, OP_VOLATILE_STATUS, OP_WEATHER
 from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+from creature_combat.statuses.status_handlers import CAN_MOVE
+from creature_combat.statuses.volatile_statuses import VolatileStatusEnum
 from creature_combat.utils import annotations as anno
+from creature_combat.utils.rng import CombatRNG
+from creature_combat.utils.zobrist import new_salt, zobrist_keys
+
+# Status enum lookup for the status values stored in compiled effects
+_STATUS_BY_VALUE = {status.value: status for status in NonVolatileStatusEnum}
+_VOLATILE_STATUS_BY_VALUE = {status.value: status for status in VolatileStatusEnum}
+_WEATHER_BY_VALUE = {weather.value: weather for weather in WeatherEnum}
+_TERRAIN_BY_VALUE = {terrain.value: terrain for terrain in TerrainEnum}
+
+# Zobrist keys for every environment index, followed by 16 wrapping keys for each of the weather and terrain turn counters
+_ENVIRONMENT_KEYS = zobrist_keys(new_salt(), 0, ENVIRONMENT_COUNT + 32)
+
+# Battle results returned by CombatManager.run_battle
+DRAW = 0
+PLAYER_1_WIN = 1
+PLAYER_2_WIN = 2
 
 
 class CombatManager:
-    def __init__(self, display_messages: bool=False):
-        # TODO: Figure out how to handle the environment
-        self.environment = None
+    def __init__(self, display_messages: bool=False, rng: anno.Optional[anno.Union[int, CombatRNG]]=None, event_sink: anno.Optional[anno.EventSink]=None):
+        # Weather and terrain combined into one environment index, see environment_index, and the turns left for each, -1 for no limit
+        self.environment: int = NO_ENVIRONMENT
+        self.weather_turns: int = 0
+        self.terrain_turns: int = 0
         self.round_number = 0
-        self.message_queue: List[str] = [""]
         self.display_messages = display_messages
+        # Structured events are only emitted when a sink is attached, headless combat skips them with a single None check. The engine emits to _sink,
+        # which is the attached sink, or a HookDispatcher wrapping it while hooks are registered
+        self._event_sink: anno.Optional[anno.EventSink] = TextEventSink() if display_messages and event_sink is None else event_sink
+        self._hooks = HookRegistry()
+        self._sink: anno.Optional[anno.EventSink] = self._event_sink
+        self._players: anno.Tuple[anno.Optional[anno.Player], anno.Optional[anno.Player]] = (None, None)
+        self._team_slots: anno.Tuple[anno.Dict[int, int], ...] = ({}, {})
+        # Every random draw made during combat comes from this RNG, so a seeded manager replays the same battle
+        self.rng: CombatRNG = rng if isinstance(rng, CombatRNG) else CombatRNG(rng)
     
     def reset(self, player_1: anno.Player, player_2: anno.Player):
         """Resets the state of the environment and the players back to their default.
@@ -21,46 +54,155 @@ class CombatManager:
             player_1 (Player): Player 1 in the combat scenario
             player_2 (Player): Player 2 in the combat scenario
         """
+        self.bind(player_1, player_2)
+        player_1.begin_battle(player_2, True, self)
+        player_2.begin_battle(player_1, False, self)
+        if self._sink is not None:
+            self._index_team_slots()
+            self._sink.begin_battle(tuple(player_1.creature_team), tuple(player_2.creature_team))
         player_1.swap_creature(None)
         player_2.swap_creature(None)
         self.round_number = 0
-        self.environment = None
-        self.message_queue = [""]
+        self.environment = NO_ENVIRONMENT
+        self.weather_turns = 0
+        self.terrain_turns = 0
+        if self._sink is not None:
+            self._emit(EVENT_SWITCH, player_1.participant)
+            self._emit(EVENT_SWITCH, player_2.participant)
         
-    def _queue_message(self, message: str):
-        """If messages are to be displayed, adds the message to the message queue to be displayed at the end of the round.
+    def bind(self, player_1: anno.Player, player_2: anno.Player):
+        """Registers the players of the battle without resetting anything, so snapshot and restore can be used on a battle that is already in progress, 
+        i.e. by a manager that plays rollouts for a search player. reset binds the players it is given.
+
+        Args:
+            player_1 (Player): Player 1 in the combat scenario
+            player_2 (Player): Player 2 in the combat scenario
+        """
+        self._players = (player_1, player_2)
+
+    def _index_team_slots(self):
+        """Maps the creatures of both bound players to their team slots, which events identify creatures by.
+        """
+        self._team_slots = tuple({id(creature): slot for slot, creature in enumerate(player.creature_team.values())} for player in self._players)
+
+    @property
+    def event_sink(self) -> anno.Optional[anno.EventSink]:
+        """Sink receiving the structured events of the battle, None for headless combat
+
+        Returns:
+            Optional[EventSink]: The attached sink
+        """
+        return self._event_sink
+
+    @event_sink.setter
+    def event_sink(self, event_sink: anno.Optional[anno.EventSink]):
+        self._event_sink = event_sink
+        self._build_sink()
+
+    def add_hook(self, hook: anno.CombatHookEnum, callback: anno.HookCallback):
+        """Subscribes a callback to a hook of the battle. Callbacks are called with a HookRecord that is reused for every event, see HookRecord.
+
+        Args:
+            hook (CombatHookEnum): Hook to subscribe to
+            callback (HookCallback): Called with the record of every event of the hook
+        """
+        self._hooks.add(hook, callback)
+        self._build_sink()
+
+    def remove_hook(self, hook: anno.CombatHookEnum, callback: anno.HookCallback):
+        """Unsubscribes a callback added with add_hook. Once the last callback is removed the manager is back to emitting to the attached sink only.
+
+        Args:
+            hook (CombatHookEnum): Hook the callback was added to
+            callback (HookCallback): The callback to remove
+        """
+        self._hooks.remove(hook, callback)
+        self._build_sink()
+
+    def _build_sink(self):
+        """Rebuilds the sink the engine emits to after the attached sink or the hooks changed. Without hooks it is the attached sink itself, so a
+        manager without subscribers runs the same code as one that never had any, and headless combat still skips every event.
+        """
+        self._sink = self._event_sink if len(self._hooks) == 0 else HookDispatcher(self, self._hooks, self._event_sink)
+        if self._sink is not None and self._players[0] is not None:
+            self._index_team_slots()
+        
+    def set_weather(self, weather: WeatherEnum, turns: int=ENVIRONMENT_DURATION):
+        """Sets the weather of the battle, keeping the terrain.
+
+        Args:
+            weather (WeatherEnum): The new weather, NONE clears it
+            turns (int, optional): Number of turns the weather lasts, -1 for no limit. Defaults to ENVIRONMENT_DURATION.
+        """
+        self.environment = environment_index(weather.value, environment_terrain(self.environment))
+        self.weather_turns = 0 if weather is WeatherEnum.NONE else turns
+
+    def set_terrain(self, terrain: TerrainEnum, turns: int=ENVIRONMENT_DURATION):
+        """Sets the terrain of the battle, keeping the weather.
+
+        Args:
+            terrain (TerrainEnum): The new terrain, NONE clears it
+            turns (int, optional): Number of turns the terrain lasts, -1 for no limit. Defaults to ENVIRONMENT_DURATION.
+        """
+        self.environment = environment_index(environment_weather(self.environment), terrain.value)
+        self.terrain_turns = 0 if terrain is TerrainEnum.NONE else turns
+
+    @property
+    def weather(self) -> WeatherEnum:
+        """Current weather of the battle
+
+        Returns:
+            WeatherEnum: The weather
+        """
+        return _WEATHER_BY_VALUE[environment_weather(self.environment)]
+
+    @property
+    def terrain(self) -> TerrainEnum:
+        """Current terrain of the battle
+
+        Returns:
+            TerrainEnum: The terrain
+        """
+        return _TERRAIN_BY_VALUE[environment_terrain(self.environment)]
+
+    def _emit(self, event: int, participant: anno.Participant, value_1: int=0, value_2: int=0):
+        """Emits an event about the creature of the participant to the event sink. Callers check that a sink is attached first, so headless combat
+        never builds the event.
 
         Args:
-            message (str): The message to display
+            event (int): BattleEventEnum value of the event
+            participant (Participant): Participant whose creature the event is about
+            value_1 (int, optional): First event specific value. Defaults to 0.
+            value_2 (int, optional): Second event specific value. Defaults to 0.
         """
-        if self.display_messages:
-            self.message_queue.append(message)
+        side = 0 if participant is self._players[0].participant else 1
+        self._sink.emit(event, side, self._team_slots[side][id(participant.creature)], value_1, value_2)
             
-    def _apply_effects(self, effect: str, effected: anno.Participant):
-        """Applies the effect of the move on the effected participant. Checks for a ":" in the effect, if so either heals or adjusts the stat stage of the participant, 
-        otherwise applies the non-volatile status to the participant.
+    def _apply_effects(self, program: anno.EffectProgram, effected: anno.Participant):
+        """Runs the compiled effect program of a move on the effected participant. Effects either adjust a stat stage, apply a non-volatile or volatile 
+        status or heal the participant.
 
         Args:
-            effect (str): What effect needs to be applied
-            effected (Participant): Who the effect applies to
-
-        Raises:
-            ValueError: If a HEAL effect was provided, but it doesn't fit the format of % or FLAT then it can not be handled.
-        """
-        if ":" in effect:
-            effect_type, amount = effect.split(':')
-            amount = int(amount)
-            if "HEAL" in effect_type:
-                if "%" in effect_type:
-                    effected.heal(effected.creature.max_hp * amount / 100)
-                elif "FLAT" in effect_type:
-                    effected.heal(amount)
-                else:
-                    raise ValueError(f"Can not parse heal effect type {effect_type}")
-            else:
-                adjust_stat_stage(effect, effected)
-        else:
-            apply_status_effect(effect, effected)
+            program (EffectProgram): Compiled (opcode, argument, amount) effects to apply, in order
+            effected (Participant): Who the effects apply to
+        """
+        for opcode, argument, amount in program:
+            if opcode == OP_STAT_STAGE:
+                effected.adjust_stage(argument, amount)
+            elif opcode == OP_STATUS:
+                status = effected.creature.status
+                effected.apply_status_non_volatile(_STATUS_BY_VALUE[argument], self.rng)
+                if self._sink is not None and effected.creature.status is not status:
+                    self._emit(EVENT_STATUS, effected, argument, 0)
+            elif opcode == OP_HEAL_PERCENT:
+                effected.heal(effected.creature.max_hp * amount / 100)
+            elif opcode == OP_HEAL_FLAT:
+                effected.heal(amount)
+            elif opcode == OP_VOLATILE_STATUS:
+                volatile_statuses = effected.volatile_statuses
+                effected.apply_status_volatile(_VOLATILE_STATUS_BY_VALUE[argument], self.rng)
+                if self._sink is not None and effected.volatile_statuses != volatile_statuses:
+                    self._emit(EVENT_STATUS, effected, argument, 1)
     
     def _apply_action(self, attacker_move: anno.Move, attacker: anno.Participant, defender: anno.Participant):
         """Applies the effects of the attacker move onto both the attacker and defender. This includes damage calculation, applying status effects, and 
@@ -70,49 +212,54 @@ class CombatManager:
             attacker_move (Move): Move being used
             attacker (Participant): The attacker using the move
             defender (Participant): The defender receiving the move
-
-        Raises:
-            ValueError: If a LIFESTEAL effect was provided, but it doesn't fit the format of % or FLAT then it can not be handled.
         """
-        can_move = uniform(0.0, 1.0) < 0.25 if attacker.creature.status == NonVolatileStatusEnum.PAR else True
-        if can_move:
+        prevented_by = attacker.before_move(defender, self.rng)
+        if prevented_by == CAN_MOVE:
             if attacker_move.is_attack:
-                if does_hit(attacker_move, attacker, defender):
-                    damage = calculate_damage(attacker_move, attacker, defender)
-                    self._queue_message(f"{attacker.creature.name} dealt {damage} to {defender.creature.name}!")
+                if does_hit(attacker_move, attacker, defender, self.rng):
+                    damage = calculate_damage(attacker_move, attacker, defender, self.rng, self.environment)
+                    if self._sink is not None:
+                        defender_side = 0 if defender is self._players[0].participant else 1
+                        self._emit(EVENT_DAMAGE, attacker, self._team_slots[defender_side][id(defender.creature)], damage)
                     defender.damage(damage)
-                    lifesteal = [se for se in attacker_move.self_effect if "LIFESTEAL" in se]
-                    if len(lifesteal) > 0:
-                        lifesteal = lifesteal[0]
-                        heal_type, amount = lifesteal.split(':')
-                        amount = int(amount)
-                        if "%" in heal_type:
-                            attacker.heal(damage * amount/100)
-                        elif "FLAT" in heal_type:
-                            attacker.heal(amount)
-                        else:
-                            raise ValueError(f"Can not parse life-steal effect type {heal_type}")
+                    lifesteal = attacker_move.lifesteal
+                    if lifesteal is not None:
+                        opcode, _, amount = lifesteal
+                        attacker.heal(damage * amount / 100 if opcode == OP_LIFESTEAL_PERCENT else amount)
+                elif self._sink is not None:
+                    self._emit(EVENT_MISS, attacker)
+            self._apply_effects(attacker_move.self_program, attacker)
+            self._apply_effects(attacker_move.opponent_program, defender)
+            for opcode, argument, _ in attacker_move.environment_program:
+                if opcode == OP_WEATHER:
+                    self.set_weather(_WEATHER_BY_VALUE[argument])
                 else:
-                    self._queue_message(f"{attacker.creature.name}'s attacked missed!")
-            for self_effect in attacker_move.self_effect:
-                self._apply_effects(self_effect, attacker)
-            for opponent_effect in attacker_move.opponent_effect:
-                self._apply_effects(opponent_effect, defender)
-            # TODO: Add environmental factors to moves
-            for env_effect in attacker_move.environment_effect:
-                pass
-        else:
-            self._queue_message(f"{attacker.creature.name} was paralyzed and could not move.")
+                    self.set_terrain(_TERRAIN_BY_VALUE[argument])
+        elif self._sink is not None:
+            self._emit(prevented_by, attacker)
         
     def _apply_end_turn_effects(self, participant_1: anno.Participant, participant_2: anno.Participant):
-        """Applies the end turn effects for both participants.
+        """Applies the end turn effects for both participants, then the end turn chip of the environment and counts down the weather and terrain.
 
         Args:
             participant_1 (Participant): Participant 1 for the combat 
             participant_2 (Participant): Participant 2 for the combat
         """
-        participant_1.apply_end_turn_effects()
-        participant_2.apply_end_turn_effects()
+        participant_1.apply_end_turn_effects(self.rng, participant_2)
+        participant_2.apply_end_turn_effects(self.rng, participant_1)
+        environment = self.environment
+        if environment != NO_ENVIRONMENT:
+            participant_1.apply_environment_end_turn(environment)
+            participant_2.apply_environment_end_turn(environment)
+            # Only positive turn counts run out, -1 lasts until replaced
+            if self.weather_turns > 0:
+                self.weather_turns -= 1
+                if self.weather_turns == 0:
+                    self.set_weather(WeatherEnum.NONE)
+            if self.terrain_turns > 0:
+                self.terrain_turns -= 1
+                if self.terrain_turns == 0:
+                    self.set_terrain(TerrainEnum.NONE)
     
     def step_round(self, player_1: anno.Player, player_2: anno.Player):
         """Gets the moves used by player_1 and player_2, then simulates the results of those actions. 
@@ -121,9 +268,9 @@ class CombatManager:
         Second determine priority based on move chosen and speed.
         Third apply the effect of the faster creature onto the slower.
         Forth check if the slower creature is alive after the move gets applied. If so its move will be applied.
-        Fifth apply any end round effects for each player.
+        Fifth apply any end round effects for each player and the environment.
         Sixth will check if either player has an alive participant, and if not will ask for a new creature to be chosen.
-        Seventh if the environment is set to display messages, display messages.
+        Seventh if an event sink is attached, emit the events of the round to it.
 
         Args:
             player_1 (Player): First player in the combat 
@@ -137,25 +284,107 @@ class CombatManager:
             self._apply_action(player_1_move, player_1.participant, player_2.participant)
             if player_2.participant.is_alive:
                 self._apply_action(player_2_move, player_2.participant, player_1.participant)
-            self._queue_message(f"{player_1.participant.creature.name} HP: {player_1.participant.creature.write_hp}")
-            self._queue_message(f"{player_2.participant.creature.name} HP: {player_2.participant.creature.write_hp}")
+            first, second = player_1.participant, player_2.participant
         else:
             self._apply_action(player_2_move, player_2.participant, player_1.participant)
             if player_1.participant.is_alive:
                 self._apply_action(player_1_move, player_1.participant, player_2.participant)
-            self._queue_message(f"{player_2.participant.creature.name} HP: {player_2.participant.creature.write_hp}")
-            self._queue_message(f"{player_1.participant.creature.name} HP: {player_1.participant.creature.write_hp}")
+            first, second = player_2.participant, player_1.participant
+        sink = self._sink
+        if sink is not None:
+            self._emit(EVENT_HP, first, first.current_hp, first.max_hp)
+            self._emit(EVENT_HP, second, second.current_hp, second.max_hp)
         self._apply_end_turn_effects(player_1.participant, player_2.participant)
         if not player_1.participant.is_alive:
-            self._queue_message(f"{player_1.participant.creature.name} has fainted!")
+            if sink is not None:
+                self._emit(EVENT_FAINTED, player_1.participant)
             player_1.swap_creature(player_2.participant)
+            if sink is not None and player_1.participant.creature is not None:
+                self._emit(EVENT_SWITCH, player_1.participant)
         if not player_2.participant.is_alive:
-            self._queue_message(f"{player_2.participant.creature.name} has fainted!")
+            if sink is not None:
+                self._emit(EVENT_FAINTED, player_2.participant)
             player_2.swap_creature(player_1.participant)
-        self._queue_message(f"Round: {self.round_number:02d} completed!")
-        if self.display_messages:
-            self._queue_message("")
-            for message in self.message_queue:
-                print(message)
-        self.message_queue.clear()
-        self._queue_message("")
+            if sink is not None and player_2.participant.creature is not None:
+                self._emit(EVENT_SWITCH, player_2.participant)
+        if sink is not None:
+            sink.emit(EVENT_ROUND_END, 0, 0, self.round_number, 0)
+        
+    def run_battle(self, player_1: anno.Player, player_2: anno.Player, max_rounds: int=1000) -> int:
+        """Resets the combat and steps rounds until one of the players has no creatures left alive, or max_rounds have been played.
+
+        Args:
+            player_1 (Player): First player in the combat 
+            player_2 (Player): Second player in the combat
+            max_rounds (int, optional): Maximum number of rounds before the battle is called a draw. Defaults to 1000.
+
+        Returns:
+            int: PLAYER_1_WIN or PLAYER_2_WIN if only that player has creatures left alive, DRAW otherwise
+        """
+        self.reset(player_1, player_2)
+        while len(player_1.alive_creature()) > 0 and len(player_2.alive_creature()) > 0 and self.round_number < max_rounds:
+            self.step_round(player_1, player_2)
+        player_1_alive = len(player_1.alive_creature()) > 0
+        player_2_alive = len(player_2.alive_creature()) > 0
+        if player_1_alive and not player_2_alive:
+            return PLAYER_1_WIN
+        elif player_2_alive and not player_1_alive:
+            return PLAYER_2_WIN
+        return DRAW
+        
+    def state_size(self) -> int:
+        """Number of ints in a snapshot of the battle between the players passed to reset.
+
+        Returns:
+            int: Size of the battle state
+        """
+        player_1, player_2 = self._players
+        return BATTLE_STATE_HEADER_SIZE + player_1.state_size() + player_2.state_size()
+        
+    def state_hash(self) -> int:
+        """Zobrist hash of the battle between the players passed to reset. Covers the same state as snapshot except the round number, so positions
+        reached through different move orders hash the same. Every component is kept up to date in O(1) as the battle changes, so this only XORs one
+        hash per participant and creature, and the keys of the environment.
+
+        Returns:
+            int: 64 bit hash of the battle state
+        """
+        player_1, player_2 = self._players
+        environment_hash = (_ENVIRONMENT_KEYS[self.environment] ^ _ENVIRONMENT_KEYS[ENVIRONMENT_COUNT + (self.weather_turns & 15)] 
+                            ^ _ENVIRONMENT_KEYS[ENVIRONMENT_COUNT + 16 + (self.terrain_turns & 15)])
+        return player_1.zobrist_hash() ^ player_2.zobrist_hash() ^ environment_hash
+        
+    def snapshot(self, state: anno.Optional[BattleState]=None) -> BattleState:
+        """Captures the current battle between the players passed to reset. Passing a previously allocated state reuses its array, so taking repeated 
+        snapshots allocates nothing.
+
+        Args:
+            state (Optional[BattleState], optional): State to write into, must come from the same battle. Defaults to allocating a new state.
+
+        Returns:
+            BattleState: The captured state
+        """
+        player_1, player_2 = self._players
+        if state is None:
+            state = BattleState(self.state_size())
+        data = state.writable()
+        data[0] = self.round_number
+        data[1] = self.environment
+        data[2] = self.weather_turns
+        data[3] = self.terrain_turns
+        player_2.write_state(data, player_1.write_state(data, BATTLE_STATE_HEADER_SIZE))
+        return state
+    
+    def restore(self, state: BattleState):
+        """Puts the battle back into a state captured by snapshot. Creatures, participants, the round number and the environment are updated in place.
+
+        Args:
+            state (BattleState): State captured from this battle
+        """
+        player_1, player_2 = self._players
+        data = state.data
+        self.round_number = data[0]
+        self.environment = data[1]
+        self.weather_turns = data[2]
+        self.terrain_turns = data[3]
+        player_2.read_state(data, player_1.read_state(data, BATTLE_STATE_HEADER_SIZE))
@@ -0,0 +1,148 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from numpy import arange, array, asarray, bincount, broadcast_arrays, broadcast_to, concatenate, float64, full, int64, maximum, minimum, unique, where, zeros
+
+from creature_combat.engine.combat_functions import _attack_and_defense, crit_chance, get_type_modifier, hit_chance
+from creature_combat.environment.environment_tables import ENVIRONMENT_DAMAGE_MODIFIERS, NO_ENVIRONMENT
+from creature_combat.utils import annotations as anno
+
+
+# Outcome layout of a damage distribution: a miss, then the 16 damage rolls without a crit, then the 16 damage rolls with a crit
+_DAMAGE_ROLLS = arange(85, 101)
+_OUTCOME_ROLLS = concatenate([_DAMAGE_ROLLS, _DAMAGE_ROLLS]) / 100
+_OUTCOME_CRITS = concatenate([full(16, 1.0), full(16, 1.5)])
+
+
+def damage_distribution_arrays(level: anno.ArrayLike, power: anno.ArrayLike, attack: anno.ArrayLike, defense: anno.ArrayLike, type_modifier: anno.ArrayLike, 
+                               crit_probability: anno.ArrayLike, hit_probability: anno.ArrayLike) -> anno.Tuple[anno.ndarray, anno.ndarray]:
+    """Vectorized form of the calculate_damage formula that enumerates every outcome instead of sampling one. All inputs are broadcast against each other,
+    so the distribution of many attacker/defender pairs can be computed at once. The last axis of the outputs holds the 33 outcomes: a miss, the 16 damage 
+    rolls without a crit, and the 16 damage rolls with a crit.
+
+    Args:
+        level (ArrayLike): Level of the attacker
+        power (ArrayLike): Power of the move, including STAB
+        attack (ArrayLike): Effective attack stat used by the move
+        defense (ArrayLike): Effective defense stat used by the move
+        type_modifier (ArrayLike): Type effectiveness of the move against the defender
+        crit_probability (ArrayLike): Chance for the move to crit
+        hit_probability (ArrayLike): Chance for the move to hit
+
+    Returns:
+        Tuple[ndarray, ndarray]: Damage and probability of every outcome, shaped (..., 33)
+    """
+    level, power, attack, defense, type_modifier, crit_probability, hit_probability = broadcast_arrays(
+        *[asarray(value, dtype=float64) for value in (level, power, attack, defense, type_modifier, crit_probability, hit_probability)])
+    # Status moves have no attack or defense stat and deal no damage
+    no_damage = (attack == 0) & (defense == 0)
+    base = ((2 * level) / 5 + 2) * power * (attack / where(no_damage, 1.0, defense)) / 50 + 2
+    damage = (base[..., None] * _OUTCOME_CRITS * _OUTCOME_ROLLS * type_modifier[..., None]).astype(int64)
+    damage = where(no_damage[..., None], 0, damage)
+    damage = concatenate([zeros(damage.shape[:-1] + (1,), dtype=int64), damage], axis=-1)
+    hit = hit_probability[..., None]
+    crit = crit_probability[..., None]
+    probability = concatenate([1.0 - hit, broadcast_to(hit * (1.0 - crit) / 16, hit.shape[:-1] + (16,)), broadcast_to(hit * crit / 16, hit.shape[:-1] + (16,))], axis=-1)
+    return damage, probability
+
+
+@dataclass
+class DamageDistribution:
+    """Exact probability distribution of the damage dealt by a single use of a move, for one or many attacker/defender pairs. damages and probabilities are 
+    shaped (..., 33), see damage_distribution_arrays for the outcome layout, and defender_hp holds the HP of each defender."""
+    damages: anno.ndarray
+    probabilities: anno.ndarray
+    defender_hp: anno.ndarray
+
+    @property
+    def expected_damage(self) -> anno.ndarray:
+        """Expected damage of a single use of the move.
+
+        Returns:
+            ndarray: Expected damage for each attacker/defender pair
+        """
+        return (self.damages * self.probabilities).sum(axis=-1)
+
+    def pmf(self) -> anno.Tuple[anno.ndarray, anno.ndarray]:
+        """Collapses the outcomes of a single attacker/defender pair into a probability mass function over distinct damage values.
+
+        Returns:
+            Tuple[ndarray, ndarray]: Sorted distinct damage values and their probabilities
+        """
+        assert self.damages.ndim == 1, "pmf is only available for a single attacker/defender pair"
+        values, inverse = unique(self.damages, return_inverse=True)
+        return values, bincount(inverse, weights=self.probabilities, minlength=len(values))
+
+    def ko_probability(self, n_hits: int=1, hp: anno.Optional[anno.ArrayLike]=None) -> anno.ndarray:
+        """Probability that n_hits independent uses of the move deal at least hp damage. Assumes the stats of both sides do not change between hits and 
+        ignores end turn effects.
+
+        Args:
+            n_hits (int, optional): Number of times the move is used. Defaults to 1.
+            hp (Optional[ArrayLike], optional): HP to knock out. Defaults to the current HP of each defender.
+
+        Returns:
+            ndarray: KO probability for each attacker/defender pair
+        """
+        assert n_hits >= 0, f"Number of hits must be positive, provided {n_hits}"
+        hp = self.defender_hp if hp is None else asarray(hp)
+        batch_shape = self.damages.shape[:-1]
+        damages = self.damages.reshape(-1, self.damages.shape[-1])
+        probabilities = self.probabilities.reshape(-1, self.probabilities.shape[-1])
+        hp = maximum(broadcast_to(hp, batch_shape).reshape(-1).astype(int64), 0)
+        n_pairs = len(hp)
+        width = int(hp.max(initial=0)) + 1
+        # dist[pair, h] is the probability of having dealt h damage so far, with every total at or above the pair's HP stored at h = hp
+        dist = zeros((n_pairs, width))
+        dist[:, 0] = 1.0
+        offsets = (arange(n_pairs) * width)[:, None]
+        dealt = arange(width)[None, :]
+        for _ in range(n_hits):
+            new_dist = zeros(n_pairs * width)
+            for outcome in range(damages.shape[1]):
+                total = minimum(dealt + damages[:, outcome, None], hp[:, None])
+                new_dist += bincount((offsets + total).ravel(), weights=(dist * probabilities[:, outcome, None]).ravel(), minlength=n_pairs * width)
+            dist = new_dist.reshape(n_pairs, width)
+        return dist[arange(n_pairs), hp].reshape(batch_shape)
+
+
+def damage_distribution(move: anno.Move, attacker: anno.Participant, defender: anno.Participant, environment: int=NO_ENVIRONMENT) -> DamageDistribution:
+    """Computes the exact damage distribution of the move from the attacker to the defender, covering the hit chance, crit chance and all 16 damage rolls
+    used by does_hit and calculate_damage.
+
+    Args:
+        move (Move): The move being used by the attacker
+        attacker (Participant): The attacker using the attack
+        defender (Participant): The defender receiving the attack
+        environment (int, optional): Environment index of the battle. Defaults to NO_ENVIRONMENT.
+
+    Returns:
+        DamageDistribution: Distribution of the damage dealt by the move
+    """
+    distributions = damage_distributions([move], [attacker], [defender], environment)
+    return DamageDistribution(distributions.damages[0], distributions.probabilities[0], distributions.defender_hp[0])
+
+
+def damage_distributions(moves: anno.Sequence[anno.Move], attackers: anno.Sequence[anno.Participant], defenders: anno.Sequence[anno.Participant],
+                         environment: int=NO_ENVIRONMENT) -> DamageDistribution:
+    """Computes the exact damage distributions for many move/attacker/defender triples at once.
+
+    Args:
+        moves (Sequence[Move]): The move used in each triple
+        attackers (Sequence[Participant]): The attacker in each triple
+        defenders (Sequence[Participant]): The defender in each triple
+        environment (int, optional): Environment index of the battle. Defaults to NO_ENVIRONMENT.
+
+    Returns:
+        DamageDistribution: Distributions with a leading axis over the triples
+    """
+    assert len(moves) == len(attackers) == len(defenders), "Every move needs an attacker and a defender"
+    stats = [_attack_and_defense(move, attacker, defender) for move, attacker, defender in zip(moves, attackers, defenders)]
+    damages, probabilities = damage_distribution_arrays(
+        [attacker.lvl for attacker in attackers],
+        [0 if move.power is None else move.power * (1.5 if attacker.creature.is_stab(move) else 1.0) for move, attacker in zip(moves, attackers)],
+        [attack for attack, _ in stats],
+        [defense for _, defense in stats],
+        [get_type_modifier(move, defender) * ENVIRONMENT_DAMAGE_MODIFIERS[environment][move.element.value] for move, defender in zip(moves, defenders)],
+        [crit_chance(move, attacker) for move, attacker in zip(moves, attackers)],
+        [hit_chance(move, attacker, defender) for move, attacker, defender in zip(moves, attackers, defenders)])
+    return DamageDistribution(damages, probabilities, array([defender.current_hp for defender in defenders], dtype=int64))
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from creature_combat.engine.player import Player
+from creature_combat.utils import annotations as anno
+
+
+class GreedyPlayer(Player):
+    """Deterministic headless player for bulk simulation. Uses the legal move with the highest power times type modifier against the opponent, status
+    moves counting as 0 power, and sends in the first alive creature with a super effective move. Needs no RNG of its own, so a seeded CombatManager
+    replays the same battles, and it is defined at module level so process pools can pickle it as a player factory.
+    """
+    def select_move(self, opponent: anno.Participant) -> int:
+        moves = self.participant.creature._moves
+        mask = self.participant.creature.legal_move_mask
+        type_modifiers = opponent.type_modifiers
+        best_slot = -1
+        best_score = -1.0
+        for slot in range(4):
+            if (mask >> slot) & 1:
+                move = moves[slot]
+                score = 0.0 if move.power is None else move.power * type_modifiers[move.element.value]
+                if score > best_score:
+                    best_slot = slot
+                    best_score = score
+        # Without PP left slot 0 is used and its PP goes negative, the engine has no Struggle, like the rollout player of MCTSPlayer
+        return best_slot if best_slot != -1 else 0
+
+    def choose_next_creature(self, opponent: anno.Optional[anno.Participant]) -> anno.Creature:
+        available_creature = self.alive_creature()
+        if len(available_creature) == 0:
+            return None
+        if opponent is not None and opponent.creature is not None:
+            type_modifiers = opponent.type_modifiers
+            for creature in available_creature:
+                if any(type_modifiers[move.element.value] > 1.0 for move in creature._moves if move is not None and move.power is not None):
+                    return creature
+        return available_creature[0]
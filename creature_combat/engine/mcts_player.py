@@ -0,0 +1,398 @@
+from __future__ import annotations
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from math import log, sqrt
+from time import perf_counter
+
+from numpy.random import SeedSequence
+
+from creature_combat.engine.battle_state import BattleState
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.engine.player import Player
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.rng import CombatRNG
+
+# Search player of the running root parallel search. Set in the parent before the pool starts so forked workers inherit the player, its opponent and
+# both teams, after which every search only sends the battle state bytes over IPC.
+_SEARCH_PLAYER: anno.Optional[MCTSPlayer] = None
+
+
+def _search_worker(raw_state: bytes, iterations: int, time_limit: anno.Optional[float], seed: SeedSequence) -> anno.List[int]:
+    """Runs an independent search from the battle state in a worker process.
+
+    Args:
+        raw_state (bytes): Battle state serialized with BattleState.to_bytes
+        iterations (int): Maximum number of iterations
+        time_limit (Optional[float]): Maximum number of seconds to search for
+        seed (SeedSequence): Seed of the search
+
+    Returns:
+        List[int]: Visit counts of the root for each of the searching player's move slots
+    """
+    player = _SEARCH_PLAYER
+    player._set_rng(CombatRNG(seed))
+    root = player._search(BattleState.from_bytes(raw_state), None, iterations, time_limit)
+    return root.counts[0]
+
+
+class _Node:
+    """Open loop node of a decoupled UCT tree. Each side keeps its own visit count and value per move slot, and children are keyed by the joint move.
+    Side 0 is always the searching player.
+    """
+    __slots__ = ("visits", "counts", "values", "children")
+
+    def __init__(self):
+        self.visits = 0
+        self.counts: anno.List[anno.List[int]] = [[0, 0, 0, 0], [0, 0, 0, 0]]
+        self.values: anno.List[anno.List[float]] = [[0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0]]
+        self.children: anno.Dict[anno.Tuple[int, int], _Node] = {}
+
+
+# Move slots of every legal move bitmask, indexed by the bitmask
+_SLOTS_BY_MASK = tuple(tuple(slot for slot in range(4) if (mask >> slot) & 1) for mask in range(16))
+
+
+class _RolloutPlayer(Player):
+    """Stand in for a player during search. Shares the participant and team of the player it stands in for, so restoring a battle state updates it,
+    makes the move slot it is told to or a uniformly random legal move otherwise, and replaces fainted creatures with a random alive creature.
+    """
+    def __init__(self, player: Player, rng: CombatRNG):
+        self.participant = player.participant
+        self.creature_team = player.creature_team
+        self.rng = rng
+        self.forced_slot = -1
+
+    def select_move(self, opponent: anno.Participant) -> int:
+        slot = self.forced_slot
+        if slot == -1:
+            legal = legal_move_slots(self.participant.creature)
+            # The engine has no Struggle, so once no move has PP left slot 0 keeps being used and its PP goes negative. Rollouts that stop dealing
+            # damage are ended by max_rollout_rounds
+            slot = legal[self.rng.randint(0, len(legal))] if len(legal) > 0 else 0
+        return slot
+
+    def choose_next_creature(self, opponent: anno.Optional[anno.Participant]) -> anno.Creature:
+        available_creature = self.alive_creature()
+        if len(available_creature) == 0:
+            return None
+        return available_creature[self.rng.randint(0, len(available_creature))]
+
+
+def legal_move_slots(creature: anno.Creature) -> anno.Tuple[int, ...]:
+    """Finds the move slots of the creature that still have PP.
+
+    Args:
+        creature (Creature): Creature to check
+
+    Returns:
+        Tuple[int, ...]: Indices of the moves that can be used
+    """
+    return _SLOTS_BY_MASK[creature.legal_move_mask]
+
+
+class MCTSPlayer(Player):
+    """Player that searches for its move with decoupled UCT, treating each round as a simultaneous move by both players. The tree is open loop: every
+    iteration restores the battle from a BattleState snapshot and replays the joint moves down the tree, so the randomness of accuracy, damage and
+    statuses is averaged over instead of stored in the tree. Rollouts play uniformly random legal moves for both sides.
+
+    The subtree of the joint move that was actually played is kept for the next round when both active creatures are unchanged. With workers above 1,
+    every decision runs an independent search in each worker of a forked process pool and the root visit counts are summed. The pool is forked again 
+    when the opponent or side changes, and is only shut down by close, so players with workers should be closed after use or used as a context 
+    manager. play_games and Tournament close the players they make after every game.
+    """
+    def __init__(self, creature_team: anno.Creatures, iterations: int=200, time_limit: anno.Optional[float]=None, exploration: float=1.4,
+                 max_rollout_rounds: int=50, workers: int=1, rng: anno.Optional[anno.Union[int, CombatRNG]]=None):
+        """
+        Args:
+            creature_team (Creatures): Creatures of the player
+            iterations (int, optional): Maximum number of iterations per decision. Defaults to 200.
+            time_limit (Optional[float], optional): Maximum number of seconds per decision. Defaults to no limit.
+            exploration (float, optional): UCB1 exploration constant. Defaults to 1.4.
+            max_rollout_rounds (int, optional): Rounds after which a rollout is scored by remaining HP instead of played out. Defaults to 50.
+            workers (int, optional): Number of processes to search with. Defaults to 1.
+            rng (Optional[Union[int, CombatRNG]], optional): Seed or RNG for the search, separate from the RNG of the battle. Defaults to None.
+        """
+        super().__init__(creature_team)
+        assert iterations > 0, f"Iterations must be positive, provided {iterations}"
+        assert workers > 0, f"Workers must be positive, provided {workers}"
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.max_rollout_rounds = max_rollout_rounds
+        # Root parallel search needs forked workers to share the teams, other platforms search in process
+        self.workers = workers if "fork" in multiprocessing.get_all_start_methods() else 1
+        self.rng: CombatRNG = rng if isinstance(rng, CombatRNG) else CombatRNG(rng)
+        self._seed_sequence = SeedSequence(self.rng.randint(0, 2 ** 31))
+        self._rollout_manager = CombatManager(rng=self.rng)
+        self._proxies: anno.Tuple[_RolloutPlayer, _RolloutPlayer] = None
+        self._battle_order: anno.Tuple[_RolloutPlayer, _RolloutPlayer] = None
+        self._opponent: anno.Optional[Player] = None
+        self._manager: anno.Optional[CombatManager] = None
+        self._is_player_1 = True
+        self._state: anno.Optional[BattleState] = None
+        self._root: anno.Optional[_Node] = None
+        self._root_creatures: anno.Tuple[anno.Optional[anno.Creature], anno.Optional[anno.Creature]] = (None, None)
+        self._root_slot = -1
+        self._root_other_slot = -1
+        self._pool: anno.Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> anno.Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def begin_battle(self, opponent: Player, is_player_1: bool, manager: anno.Optional[CombatManager]=None) -> None:
+        if opponent is not self._opponent or is_player_1 != self._is_player_1:
+            # Forked workers hold the previous opponent and battle order, fork again on the next decision
+            self.close()
+        self._opponent = opponent
+        self._manager = manager
+        self._is_player_1 = is_player_1
+        me = _RolloutPlayer(self, self.rng)
+        other = _RolloutPlayer(opponent, self.rng)
+        self._proxies = (me, other)
+        # Proxies are bound in battle order so speed ties resolve the same way as in the real battle
+        self._battle_order = (me, other) if is_player_1 else (other, me)
+        self._rollout_manager.bind(*self._battle_order)
+        self._state = None
+        self._root = None
+
+    def _sync_environment(self) -> None:
+        """Copies the round number and the environment of the real battle into the rollout manager, so searches start from the actual weather, terrain
+        and turns left. Without a manager, i.e. when begin_battle was called directly, the rollout manager keeps its own environment.
+        """
+        manager = self._manager
+        if manager is not None:
+            rollout_manager = self._rollout_manager
+            rollout_manager.round_number = manager.round_number
+            rollout_manager.environment = manager.environment
+            rollout_manager.weather_turns = manager.weather_turns
+            rollout_manager.terrain_turns = manager.terrain_turns
+
+    def _set_rng(self, rng: CombatRNG) -> None:
+        """Replaces the RNG used by the search and its rollouts.
+
+        Args:
+            rng (CombatRNG): The new RNG
+        """
+        self.rng = rng
+        self._rollout_manager.rng = rng
+        for proxy in self._proxies:
+            proxy.rng = rng
+
+    def _outcome(self) -> anno.Optional[float]:
+        """Scores the battle for the searching player if it is over.
+
+        Returns:
+            Optional[float]: 1.0 for a win, 0.0 for a loss, 0.5 for a draw, None if the battle is still going
+        """
+        me_alive = len(self.alive_creature()) > 0
+        other_alive = len(self._opponent.alive_creature()) > 0
+        if me_alive and other_alive:
+            return None
+        return 1.0 if me_alive else 0.0 if other_alive else 0.5
+
+    def _score_hp(self) -> float:
+        """Scores an unfinished battle by the fraction of the team HP each player has left.
+
+        Returns:
+            float: Share of the remaining HP fractions belonging to the searching player
+        """
+        me = sum(creature.current_hp for creature in self.creature_team.values()) / sum(creature.max_hp for creature in self.creature_team.values())
+        team = self._opponent.creature_team.values()
+        other = sum(creature.current_hp for creature in team) / sum(creature.max_hp for creature in team)
+        return me / (me + other) if me + other > 0 else 0.5
+
+    def _select(self, node: _Node, side: int, legal: anno.List[int]) -> int:
+        """Picks the move slot of one side with UCB1 over that side's statistics at the node.
+
+        Args:
+            node (_Node): Node to select at
+            side (int): 0 for the searching player, 1 for the opponent
+            legal (List[int]): Move slots that can currently be used
+
+        Returns:
+            int: Selected move slot, 0 if no move has PP left
+        """
+        if len(legal) == 0:
+            return 0
+        counts = node.counts[side]
+        values = node.values[side]
+        log_visits = log(node.visits) if node.visits > 0 else 0.0
+        best_slot = legal[0]
+        best_score = -1.0
+        for slot in legal:
+            count = counts[slot]
+            if count == 0:
+                return slot
+            score = values[slot] / count + self.exploration * sqrt(log_visits / count)
+            if score > best_score:
+                best_slot = slot
+                best_score = score
+        return best_slot
+
+    def _ensure_active(self) -> None:
+        """Sends in a creature for any proxy whose active creature fainted, as happens at the end of a real round.
+        """
+        me, other = self._proxies
+        if not me.participant.is_alive and len(me.alive_creature()) > 0:
+            me.swap_creature(other.participant)
+        if not other.participant.is_alive and len(other.alive_creature()) > 0:
+            other.swap_creature(me.participant)
+
+    def _iterate(self, root: _Node, state: BattleState) -> None:
+        """Runs one iteration: restores the root state, walks down the tree with decoupled UCT, adds one node, plays a random rollout, and backs the
+        result up the visited path.
+
+        Args:
+            root (_Node): Root of the tree
+            state (BattleState): Battle state at the root
+        """
+        manager = self._rollout_manager
+        me, other = self._proxies
+        battle_order = self._battle_order
+        manager.restore(state)
+        self._ensure_active()
+        path = []
+        node = root
+        value = self._outcome()
+        while value is None:
+            my_slot = self._select(node, 0, legal_move_slots(me.participant.creature))
+            other_slot = self._select(node, 1, legal_move_slots(other.participant.creature))
+            me.forced_slot = my_slot
+            other.forced_slot = other_slot
+            manager.step_round(*battle_order)
+            path.append((node, my_slot, other_slot))
+            value = self._outcome()
+            child = node.children.get((my_slot, other_slot))
+            if child is None:
+                node.children[(my_slot, other_slot)] = _Node()
+                break
+            node = child
+        me.forced_slot = -1
+        other.forced_slot = -1
+        if value is None:
+            start = manager.round_number
+            while value is None and manager.round_number - start < self.max_rollout_rounds:
+                manager.step_round(*battle_order)
+                value = self._outcome()
+            if value is None:
+                value = self._score_hp()
+        for node, my_slot, other_slot in path:
+            node.visits += 1
+            node.counts[0][my_slot] += 1
+            node.values[0][my_slot] += value
+            node.counts[1][other_slot] += 1
+            node.values[1][other_slot] += 1.0 - value
+
+    def _search(self, state: BattleState, root: anno.Optional[_Node], iterations: int, time_limit: anno.Optional[float]) -> _Node:
+        """Runs iterations from the battle state until the iteration or time budget is used up, then restores the battle state. Rollouts make moves on
+        the real participants and the last move slots are not part of the battle state, so they are saved and put back as well, keeping them the moves
+        actually played for _reused_root.
+
+        Args:
+            state (BattleState): Battle state to search from
+            root (Optional[_Node]): Tree to keep growing, or None to start a new tree
+            iterations (int): Maximum number of iterations
+            time_limit (Optional[float]): Maximum number of seconds
+
+        Returns:
+            _Node: Root of the searched tree
+        """
+        me, other = self._proxies
+        last_move_slots = (me.participant.last_move_slot, other.participant.last_move_slot)
+        root = _Node() if root is None else root
+        deadline = None if time_limit is None else perf_counter() + time_limit
+        for _ in range(iterations):
+            self._iterate(root, state)
+            if deadline is not None and perf_counter() >= deadline:
+                break
+        self._rollout_manager.restore(state)
+        me.participant.last_move_slot, other.participant.last_move_slot = last_move_slots
+        return root
+
+    def _reused_root(self) -> anno.Optional[_Node]:
+        """Finds the subtree of the joint move played since the last decision, if the same creatures are still facing each other.
+
+        Returns:
+            Optional[_Node]: The subtree to keep searching, or None
+        """
+        if self._root is None or self._root_creatures != (self.participant.creature, self._opponent.participant.creature):
+            return None
+        if self.participant.last_move_slot != self._root_slot:
+            return None
+        # Player 2 decides after player 1 has made its move, so the opponent's move of the last round was recorded during the last decision
+        other_slot = self._opponent.participant.last_move_slot if self._is_player_1 else self._root_other_slot
+        return self._root.children.get((self._root_slot, other_slot))
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Starts the forked process pool for root parallel search on first use.
+
+        Returns:
+            ProcessPoolExecutor: The pool of this player
+        """
+        global _SEARCH_PLAYER
+        if self._pool is None:
+            _SEARCH_PLAYER = self
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("fork"))
+            # Start every worker now so they are forked while _SEARCH_PLAYER refers to this player
+            list(self._pool.map(int, range(self.workers)))
+        return self._pool
+
+    def close(self) -> None:
+        """Shuts down the process pool used for root parallel search, if it was started. The player stays usable, the next decision with workers above 1
+        forks a new pool.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def select_move(self, opponent: anno.Participant) -> int:
+        creature = self.participant.creature
+        legal = legal_move_slots(creature)
+        if len(legal) <= 1:
+            # Nothing was searched, so there is no tree to continue from next round
+            self._root = None
+            # Without PP left slot 0 is used, see _RolloutPlayer.select_move
+            return legal[0] if len(legal) == 1 else 0
+        self._sync_environment()
+        self._state = self._rollout_manager.snapshot(self._state)
+        if self.workers == 1:
+            root = self._search(self._state, self._reused_root(), self.iterations, self.time_limit)
+            counts = root.counts[0]
+        else:
+            root = None
+            raw_state = self._state.to_bytes()
+            seeds = self._seed_sequence.spawn(self.workers)
+            results = self._get_pool().map(_search_worker, [raw_state] * self.workers, [self.iterations] * self.workers,
+                                           [self.time_limit] * self.workers, seeds)
+            counts = [sum(slot_counts) for slot_counts in zip(*results)]
+        slot = max(legal, key=lambda idx: counts[idx])
+        self._root = root
+        self._root_creatures = (creature, self._opponent.participant.creature)
+        self._root_slot = slot
+        self._root_other_slot = self._opponent.participant.last_move_slot
+        return slot
+
+    def choose_next_creature(self, opponent: anno.Optional[anno.Participant]) -> anno.Creature:
+        available_creature = self.alive_creature()
+        if len(available_creature) <= 1 or opponent is None or self._proxies is None:
+            return available_creature[0] if len(available_creature) > 0 else None
+        # Flat Monte Carlo over the candidates, splitting the iteration budget between them
+        self._sync_environment()
+        state = self._rollout_manager.snapshot()
+        iterations = max(1, self.iterations // len(available_creature))
+        best_creature = available_creature[0]
+        best_value = -1.0
+        for creature in available_creature:
+            self.participant.add_creature(creature)
+            candidate_state = self._rollout_manager.snapshot()
+            root = self._search(candidate_state, None, iterations, None if self.time_limit is None else self.time_limit / len(available_creature))
+            value = sum(root.values[0]) / root.visits if root.visits > 0 else 0.0
+            if value > best_value:
+                best_creature = creature
+                best_value = value
+        self._rollout_manager.restore(state)
+        self._root = None
+        return best_creature
@@ -1,15 +1,48 @@
 from __future__ import annotations
-from numpy.random import uniform
 
+from creature_combat.engine.combat_functions import get_defensive_type_modifiers, get_environment_chip
+from creature_combat.environment.environment_tables import ENVIRONMENT_COUNT
 from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+from creature_combat.statuses.status_handlers import (CAN_MOVE, NON_VOLATILE_BEFORE_MOVE, NON_VOLATILE_END_TURN, VOLATILE_ON_APPLY, volatile_before_move, 
+                                                      volatile_end_turn)
+from creature_combat.statuses.volatile_statuses import VOLATILE_STATUS_COUNT
 from creature_combat.utils import annotations as anno
+from creature_combat.utils.mappings import STAGE_MULTIPLIERS
 from creature_combat.utils.math_utils import clip
+from creature_combat.utils.rng import get_default_rng
+from creature_combat.utils.zobrist import new_salt, zobrist_keys
+
+# Damage modifiers used while no creature is in battle
+_NEUTRAL_TYPE_MODIFIERS = (1.0,) * 18
+# End turn environment chip used while no creature is in battle
+_NO_ENVIRONMENT_CHIP = (0.0,) * ENVIRONMENT_COUNT
+
+_NO_STATUS = NonVolatileStatusEnum.NONE
+
+# Number of ints a participant writes to a battle state: the bad poison counter, the 8 stat stages, the volatile status bitmask and the turn counter of
+# every volatile status
+PARTICIPANT_STATE_SIZE = 10 + VOLATILE_STATUS_COUNT
+
 
 class Participant:
+    __slots__ = ('creature', 'type_modifiers', 'environment_chip', '_stage_keys', '_bpsn_keys', 'bpsn_counter', '_p_atk_stage', '_p_def_stage', '_s_atk_stage', '_s_def_stage',
+                 '_spd_stage', '_acc_stage', '_eva_stage', '_crit_stage', 'p_atk', 'p_def', 's_atk', 's_def', 'spd', '_zobrist_hash', 'last_move_slot', 
+                 'volatile_statuses', 'volatile_counters', '_volatile_keys', '_volatile_counter_keys')
+
     def __init__(self):
         self.creature: anno.Creature = None
-        self.reset_stage()
+        self.type_modifiers: anno.Tuple[float, ...] = _NEUTRAL_TYPE_MODIFIERS
+        self.environment_chip: anno.Tuple[float, ...] = _NO_ENVIRONMENT_CHIP
+        # Zobrist keys are generated on the first use of zobrist_hash, see _make_zobrist_keys. Until then _stage_keys is None and changes skip updating 
+        # the hash
+        self._stage_keys: anno.Optional[anno.Tuple[anno.Sequence[int], ...]] = None
         self.bpsn_counter:int = 0
+        # Bitmask of the volatile statuses, bit n is set while the VolatileStatusEnum of value n is active, and the turn counter of each status
+        self.volatile_statuses:int = 0
+        self.volatile_counters: anno.List[int] = [0] * VOLATILE_STATUS_COUNT
+        self.reset_stage()
+        # Move slot of the last move made, -1 before the first move
+        self.last_move_slot:int = -1
         
     def reset_stage(self) -> None:
         """Resets the stage for all of the stats back to the default of 0
@@ -22,6 +55,125 @@ class Participant:
         self._acc_stage:int = 0
         self._eva_stage:int = 0
         self._crit_stage:int = 0
+        self._refresh_stats()
+        if self._stage_keys is not None:
+            self._zobrist_hash = self._compute_zobrist_hash()
+
+    def _make_zobrist_keys(self) -> None:
+        """Generates the Zobrist keys of the participant and computes its hash: keys for each of the 13 values of the 8 stat stages, followed by 16 
+        wrapping keys for the bad poison counter, one key per volatile status and 16 wrapping keys for the turn counter of each volatile status.
+        """
+        keys = zobrist_keys(new_salt(), 0, 8 * 13 + 16 + VOLATILE_STATUS_COUNT * 17)
+        self._stage_keys = tuple(keys[idx * 13:(idx + 1) * 13] for idx in range(8))
+        self._bpsn_keys: anno.Sequence[int] = keys[8 * 13:8 * 13 + 16]
+        offset = 8 * 13 + 16
+        self._volatile_keys: anno.Sequence[int] = keys[offset:offset + VOLATILE_STATUS_COUNT]
+        offset += VOLATILE_STATUS_COUNT
+        self._volatile_counter_keys: anno.Tuple[anno.Sequence[int], ...] = tuple(keys[offset + idx * 16:offset + (idx + 1) * 16] 
+                                                                                 for idx in range(VOLATILE_STATUS_COUNT))
+        self._zobrist_hash: int = self._compute_zobrist_hash()
+
+    @property
+    def zobrist_hash(self) -> int:
+        """Zobrist hash of the stat stages, counters, volatile statuses and active creature of the participant. The keys are generated on first use, 
+        after which every change updates the hash incrementally.
+
+        Returns:
+            int: The hash
+        """
+        if self._stage_keys is None:
+            self._make_zobrist_keys()
+        return self._zobrist_hash
+
+    def _refresh_stats(self) -> None:
+        """Recomputes every cached effective stat from the active creature and the current stat stages. Single stage adjustments only recompute the 
+        stat they change, so this only runs when the creature or all of the stages change at once.
+        """
+        # Effective stats of the creature adjusted by the current stat stages, kept as plain attributes so damage and turn order read them directly
+        creature = self.creature
+        if creature is None:
+            self.p_atk = self.p_def = self.s_atk = self.s_def = self.spd = 0
+            return
+        self.p_atk:int = int(creature.p_atk * STAGE_MULTIPLIERS[self._p_atk_stage + 6])
+        self.p_def:int = int(creature.p_def * STAGE_MULTIPLIERS[self._p_def_stage + 6])
+        self.s_atk:int = int(creature.s_atk * STAGE_MULTIPLIERS[self._s_atk_stage + 6])
+        self.s_def:int = int(creature.s_def * STAGE_MULTIPLIERS[self._s_def_stage + 6])
+        self.spd:int = int(creature.spd * STAGE_MULTIPLIERS[self._spd_stage + 6])
+
+    def _compute_zobrist_hash(self) -> int:
+        """Computes the Zobrist hash of the participant from scratch: the stat stages, the bad poison counter, the volatile statuses and their counters, 
+        and the key of the active creature. The hash of the creature's own state is kept by the creature.
+
+        Returns:
+            int: XOR of the keys of the current stages, counters, volatile statuses and active creature
+        """
+        stages = (self._p_atk_stage, self._p_def_stage, self._s_atk_stage, self._s_def_stage, self._spd_stage, self._acc_stage, self._eva_stage, 
+                  self._crit_stage)
+        zobrist_hash = self._bpsn_keys[self.bpsn_counter & 15]
+        for keys, stage in zip(self._stage_keys, stages):
+            zobrist_hash ^= keys[stage + 6]
+        for index, (keys, counter) in enumerate(zip(self._volatile_counter_keys, self.volatile_counters)):
+            zobrist_hash ^= keys[counter & 15]
+            if (self.volatile_statuses >> index) & 1:
+                zobrist_hash ^= self._volatile_keys[index]
+        return zobrist_hash if self.creature is None else zobrist_hash ^ self.creature.active_key
+
+    def _rehash_stage(self, stat_index: int, old_stage: int, new_stage: int) -> None:
+        """Updates the Zobrist hash for a stat stage change.
+
+        Args:
+            stat_index (int): Index of the stat, in the order of reset_stage
+            old_stage (int): Stage before the change
+            new_stage (int): Stage after the change
+        """
+        if self._stage_keys is not None:
+            keys = self._stage_keys[stat_index]
+            self._zobrist_hash ^= keys[old_stage + 6] ^ keys[new_stage + 6]
+
+    def _set_bpsn_counter(self, counter: int) -> None:
+        """Sets the bad poison counter and updates the Zobrist hash.
+
+        Args:
+            counter (int): New value of the counter
+        """
+        if self._stage_keys is not None:
+            self._zobrist_hash ^= self._bpsn_keys[self.bpsn_counter & 15] ^ self._bpsn_keys[counter & 15]
+        self.bpsn_counter = counter
+
+    def _set_volatile_counter(self, index: int, counter: int) -> None:
+        """Sets the turn counter of a volatile status and updates the Zobrist hash.
+
+        Args:
+            index (int): Bit index of the volatile status
+            counter (int): New value of the counter
+        """
+        if self._stage_keys is not None:
+            keys = self._volatile_counter_keys[index]
+            self._zobrist_hash ^= keys[self.volatile_counters[index] & 15] ^ keys[counter & 15]
+        self.volatile_counters[index] = counter
+
+    def _add_volatile(self, index: int, counter: int) -> None:
+        """Sets the bit of a volatile status and its turn counter, and updates the Zobrist hash.
+
+        Args:
+            index (int): Bit index of the volatile status
+            counter (int): Initial value of the turn counter
+        """
+        self.volatile_statuses |= 1 << index
+        if self._stage_keys is not None:
+            self._zobrist_hash ^= self._volatile_keys[index]
+        self._set_volatile_counter(index, counter)
+
+    def _remove_volatile(self, index: int) -> None:
+        """Clears the bit of a volatile status and its turn counter, and updates the Zobrist hash.
+
+        Args:
+            index (int): Bit index of the volatile status
+        """
+        self.volatile_statuses &= ~(1 << index)
+        if self._stage_keys is not None:
+            self._zobrist_hash ^= self._volatile_keys[index]
+        self._set_volatile_counter(index, 0)
 
     def _adjust_hp(self, amount: int) -> None:
         """Adjusts the current HP of the owned Creature by the provided amount.
@@ -29,15 +181,15 @@ class Participant:
         Args:
             amount (int): How much to change the current health by
         """
-        self.creature._current_hp = clip(self.creature.current_hp+amount, 0, self.creature.max_hp)
+        self.creature._set_hp(clip(self.creature.current_hp+amount, 0, self.creature.max_hp))
     
     def heal(self, amount: int) -> None:
-        """Applies a positive HP adjustment to the creature.
+        """Applies a positive HP adjustment to the creature. Partial HP is truncated, as HP is tracked in whole numbers.
 
         Args:
             amount (int): How much to heal the creature by
         """
-        self._adjust_hp(abs(amount))
+        self._adjust_hp(int(abs(amount)))
         
     def damage(self, amount: int) -> None:
         """Applies a negative HP adjustment to the creature.
@@ -53,7 +205,10 @@ class Participant:
         Args:
             amount (int): How much to change the p-atk stage by 
         """
-        self._p_atk_stage = clip(self.p_atk_stage + amount, -6, 6)
+        stage = clip(self.p_atk_stage + amount, -6, 6)
+        self._rehash_stage(0, self._p_atk_stage, stage)
+        self._p_atk_stage = stage
+        self.p_atk = 0 if self.creature is None else int(self.creature.p_atk * STAGE_MULTIPLIERS[stage + 6])
         
     def adjust_p_def_stage(self, amount: int) -> None:
         """Adjusts the p-def stage by the amount provided, clipping to keep the value on the range of [-6, 6]
@@ -61,7 +216,10 @@ class Participant:
         Args:
             amount (int): How much to change the p-def stage by 
         """
-        self._p_def_stage = clip(self.p_def_stage + amount, -6, 6)
+        stage = clip(self.p_def_stage + amount, -6, 6)
+        self._rehash_stage(1, self._p_def_stage, stage)
+        self._p_def_stage = stage
+        self.p_def = 0 if self.creature is None else int(self.creature.p_def * STAGE_MULTIPLIERS[stage + 6])
         
     def adjust_s_atk_stage(self, amount: int) -> None:
         """Adjusts the s-atk stage by the amount provided, clipping to keep the value on the range of [-6, 6]
@@ -69,7 +227,10 @@ class Participant:
         Args:
             amount (int): How much to change the s-atk stage by 
         """
-        self._s_atk_stage = clip(self.s_atk_stage + amount, -6, 6)
+        stage = clip(self.s_atk_stage + amount, -6, 6)
+        self._rehash_stage(2, self._s_atk_stage, stage)
+        self._s_atk_stage = stage
+        self.s_atk = 0 if self.creature is None else int(self.creature.s_atk * STAGE_MULTIPLIERS[stage + 6])
         
     def adjust_s_def_stage(self, amount: int) -> None:
         """Adjusts the s-def stage by the amount provided, clipping to keep the value on the range of [-6, 6]
@@ -77,7 +238,10 @@ class Participant:
         Args:
             amount (int): How much to change the s-def stage by 
         """
-        self._s_def_stage = clip(self.s_def_stage + amount, -6, 6)
+        stage = clip(self.s_def_stage + amount, -6, 6)
+        self._rehash_stage(3, self._s_def_stage, stage)
+        self._s_def_stage = stage
+        self.s_def = 0 if self.creature is None else int(self.creature.s_def * STAGE_MULTIPLIERS[stage + 6])
         
     def adjust_spd_stage(self, amount: int) -> None:
         """Adjusts the speed stage by the amount provided, clipping to keep the value on the range of [-6, 6]
@@ -85,7 +249,10 @@ class Participant:
         Args:
             amount (int): How much to change the speed stage by 
         """
-        self._spd_stage = clip(self.spd_stage + amount, -6, 6)
+        stage = clip(self.spd_stage + amount, -6, 6)
+        self._rehash_stage(4, self._spd_stage, stage)
+        self._spd_stage = stage
+        self.spd = 0 if self.creature is None else int(self.creature.spd * STAGE_MULTIPLIERS[stage + 6])
         
     def adjust_acc_stage(self, amount: int) -> None:
         """Adjusts the accuracy stage by the amount provided, clipping to keep the value on the range of [-6, 6]
@@ -93,7 +260,9 @@ class Participant:
         Args:
             amount (int): How much to change the accuracy stage by 
         """
-        self._acc_stage = clip(self.acc_stage + amount, -6, 6)
+        stage = clip(self.acc_stage + amount, -6, 6)
+        self._rehash_stage(5, self._acc_stage, stage)
+        self._acc_stage = stage
         
     def adjust_eva_stage(self, amount: int) -> None:
         """Adjusts the evasion stage by the amount provided, clipping to keep the value on the range of [-6, 6]
@@ -101,7 +270,9 @@ class Participant:
         Args:
             amount (int): How much to change the evasion stage by 
         """
-        self._eva_stage = clip(self.eva_stage + amount, -6, 6)
+        stage = clip(self.eva_stage + amount, -6, 6)
+        self._rehash_stage(6, self._eva_stage, stage)
+        self._eva_stage = stage
         
     def adjust_crit_stage(self, amount: int) -> None:
         """Adjusts the critical stage by the amount provided, clipping to keep the value on the range of [-0, 6]
@@ -109,39 +280,183 @@ class Participant:
         Args:
             amount (int): How much to change the critical stage by 
         """
-        self._crit_stage = clip(self.crit_stage + amount, 0, 6)
+        stage = clip(self.crit_stage + amount, 0, 6)
+        self._rehash_stage(7, self._crit_stage, stage)
+        self._crit_stage = stage
+        
+    def adjust_stage(self, stat_index: int, amount: int) -> None:
+        """Adjusts the stage of the stat at stat_index by the amount provided. Stat indices follow the order of reset_stage: 
+        [p_atk, p_def, s_atk, s_def, spd, acc, eva, crit]
+
+        Args:
+            stat_index (int): Index of the stat to change the stage of
+            amount (int): How much to change the stage by
+        """
+        _STAGE_ADJUSTERS[stat_index](self, amount)
+        
+    def write_state(self, data: anno.MutableSequence[int], offset: int) -> int:
+        """Writes the bad poison counter, stat stages, volatile status bitmask and volatile status counters into a battle state buffer. Stages follow the
+        order of reset_stage.
+
+        Args:
+            data (MutableSequence[int]): Buffer to write into
+            offset (int): Index of the first int to write
+
+        Returns:
+            int: Index after the last int written
+        """
+        data[offset] = self.bpsn_counter
+        data[offset + 1] = self._p_atk_stage
+        data[offset + 2] = self._p_def_stage
+        data[offset + 3] = self._s_atk_stage
+        data[offset + 4] = self._s_def_stage
+        data[offset + 5] = self._spd_stage
+        data[offset + 6] = self._acc_stage
+        data[offset + 7] = self._eva_stage
+        data[offset + 8] = self._crit_stage
+        data[offset + 9] = self.volatile_statuses
+        for index, counter in enumerate(self.volatile_counters):
+            data[offset + 10 + index] = counter
+        return offset + PARTICIPANT_STATE_SIZE
+
+    def read_state(self, data: anno.Sequence[int], offset: int) -> int:
+        """Restores the bad poison counter, stat stages and volatile statuses from a battle state buffer written by write_state.
+
+        Args:
+            data (Sequence[int]): Buffer to read from
+            offset (int): Index of the first int to read
+
+        Returns:
+            int: Index after the last int read
+        """
+        self.bpsn_counter = data[offset]
+        self._p_atk_stage = data[offset + 1]
+        self._p_def_stage = data[offset + 2]
+        self._s_atk_stage = data[offset + 3]
+        self._s_def_stage = data[offset + 4]
+        self._spd_stage = data[offset + 5]
+        self._acc_stage = data[offset + 6]
+        self._eva_stage = data[offset + 7]
+        self._crit_stage = data[offset + 8]
+        self.volatile_statuses = data[offset + 9]
+        volatile_counters = self.volatile_counters
+        for index in range(VOLATILE_STATUS_COUNT):
+            volatile_counters[index] = data[offset + 10 + index]
+        self._refresh_stats()
+        if self._stage_keys is not None:
+            self._zobrist_hash = self._compute_zobrist_hash()
+        return offset + PARTICIPANT_STATE_SIZE
         
     def remove_creature(self) -> None:
-        """Removes the creature from the participant in the battle. Resets all stat stage changes to the creature.
+        """Removes the creature from the participant in the battle. Resets all stat stage changes and volatile statuses of the creature.
         """
+        self.volatile_statuses = 0
+        self.volatile_counters = [0] * VOLATILE_STATUS_COUNT
         self.creature = None
+        self.type_modifiers = _NEUTRAL_TYPE_MODIFIERS
+        self.environment_chip = _NO_ENVIRONMENT_CHIP
         self.reset_stage()
 
     def add_creature(self, creature: anno.Creature) -> None:
-        """Adds a creature to the participant in the battle.
+        """Adds a creature to the participant in the battle, and caches its effective stats, the damage modifier of every attacking element against 
+        the creature's typing and its end turn chip in every environment.
 
         Args:
             creature (Creature): The creature now in battle.
         """
+        hashed = self._stage_keys is not None
+        if hashed and self.creature is not None:
+            self._zobrist_hash ^= self.creature.active_key
         self.creature = creature
+        self.type_modifiers = _NEUTRAL_TYPE_MODIFIERS if creature is None else get_defensive_type_modifiers(creature._types)
+        self.environment_chip = _NO_ENVIRONMENT_CHIP if creature is None else get_environment_chip(creature._types)
+        if hashed and creature is not None:
+            self._zobrist_hash ^= creature.active_key
+        self._refresh_stats()
         
-    def apply_status_non_volatile(self, status: NonVolatileStatusEnum) -> None:
+    def apply_status_non_volatile(self, status: NonVolatileStatusEnum, rng: anno.Optional[anno.CombatRNG]=None) -> None:
         """Applies the non-volatile status to the owned Creature.
 
         Args:
             status (NonVolatileStatusEnum): The status afflicting the Creature
+            rng (Optional[CombatRNG], optional): Random number source for the status duration. Defaults to the shared default RNG.
         """
-        self.creature.set_status(status)
+        self.creature.set_status(status, rng)
         if status == NonVolatileStatusEnum.BPSN:
-            self.bpsn_counter = 1
+            self._set_bpsn_counter(1)
 
     def remove_status_non_volatile(self) -> None:
         """Removes the non-volatile status from the owned Creature
         """
         self.creature._reset_status()
+
+    def apply_status_volatile(self, status: anno.VolatileStatusEnum, rng: anno.Optional[anno.CombatRNG]=None) -> None:
+        """Applies the volatile status to the participant, starting its turn counter from its on apply handler. Does nothing if the status is already
+        active. Volatile statuses are cleared when the creature leaves battle.
+
+        Args:
+            status (VolatileStatusEnum): The volatile status afflicting the participant
+            rng (Optional[CombatRNG], optional): Random number source for the status duration. Defaults to the shared default RNG.
+        """
+        index = status.value
+        if not (self.volatile_statuses >> index) & 1:
+            self._add_volatile(index, VOLATILE_ON_APPLY[index](self, get_default_rng() if rng is None else rng))
+
+    def remove_status_volatile(self, status: anno.VolatileStatusEnum) -> None:
+        """Removes the volatile status from the participant if it is active.
+
+        Args:
+            status (VolatileStatusEnum): The volatile status to remove
+        """
+        if (self.volatile_statuses >> status.value) & 1:
+            self._remove_volatile(status.value)
+
+    def has_status_volatile(self, status: anno.VolatileStatusEnum) -> bool:
+        """Checks if the volatile status is active on the participant.
+
+        Args:
+            status (VolatileStatusEnum): The volatile status to check
+
+        Returns:
+            bool: Is the status active or not
+        """
+        return (self.volatile_statuses >> status.value) & 1 == 1
+
+    def before_move(self, opponent: anno.Optional[Participant]=None, rng: anno.Optional[anno.CombatRNG]=None) -> int:
+        """Runs the before move handlers of the non-volatile status and then the volatile statuses, stopping at the first status that prevents the 
+        move. A participant without statuses only pays for two checks.
+
+        Args:
+            opponent (Optional[Participant], optional): Participant being battled. Defaults to None.
+            rng (Optional[CombatRNG], optional): Random number source for the status checks. Defaults to the shared default RNG.
+
+        Returns:
+            int: CAN_MOVE, or the BattleEventEnum value of the status that prevented the move
+        """
+        status = self.creature._status
+        if status is not _NO_STATUS:
+            handler = NON_VOLATILE_BEFORE_MOVE.get(status, None)
+            if handler is not None:
+                event = handler(self, opponent, get_default_rng() if rng is None else rng)
+                if event != CAN_MOVE:
+                    return event
+        if self.volatile_statuses:
+            return volatile_before_move(self, opponent, get_default_rng() if rng is None else rng)
+        return CAN_MOVE
         
+    def can_make_move_at(self, slot: int) -> bool:
+        """Checks if the move in the move slot still has pp uses remaining. If so the move is useable.
+
+        Args:
+            slot (int): Move slot to determine usability for, [0-3]
+
+        Returns:
+            bool: Can the move be used or not 
+        """
+        return (self.creature.legal_move_mask >> slot) & 1 == 1
+
     def can_make_move(self, move_name: str) -> bool:
-        """Checks if the move_name move still has pp uses remaining. If so the move is useable.
+        """Checks if the move_name move still has pp uses remaining. If so the move is useable. Wraps can_make_move_at.
 
         Args:
             move_name (str): Name of the move to determine usability for
@@ -149,11 +464,25 @@ class Participant:
         Returns:
             bool: Can the move be used or not 
         """
-        remaining_pp = self.creature._remaining_pp.get(move_name, None)
-        return remaining_pp is not None and remaining_pp > 0
+        slot = self.creature.index_of_move(move_name)
+        return slot is not None and self.can_make_move_at(slot)
+
+    def make_move_at(self, slot: int) -> anno.Move:
+        """Makes the move in the move slot for the round in combat. Will also decrement 1 PP usage and record the slot of the move.
+
+        Args:
+            slot (int): Move slot of the move to use, [0-3]
+
+        Returns:
+            Move: Move used by the participant this round 
+        """
+        creature = self.creature
+        creature._set_pp(slot, creature._remaining_pp[slot] - 1)
+        self.last_move_slot = slot
+        return creature._moves[slot]
     
     def make_move(self, move_name: str) -> anno.Move:
-        """Makes the move provided by the move_name for the round in combat. Will also decrement 1 PP usage. 
+        """Makes the move provided by the move_name for the round in combat. Wraps make_move_at.
 
         Args:
             move_name (str): Name of the move to use
@@ -161,34 +490,41 @@ class Participant:
         Returns:
             Move: Move used by the participant this round 
         """
-        self.creature._remaining_pp[move_name] -= 1
-        move = [pm for pm in self.creature._moves if pm is not None and pm.name == move_name][0]
-        return move
+        return self.make_move_at(self.creature.index_of_move(move_name))
     
-    def apply_end_turn_effects(self):
+    def apply_end_turn_effects(self, rng: anno.Optional[anno.CombatRNG]=None, opponent: anno.Optional[Participant]=None):
         #TODO: Include other effects that trigger at round end to this method
-        """Applies the end turn effect of the Creatures status. 
-        """
-        match self.creature.status:
-            case NonVolatileStatusEnum.BRN:
-                damage = int(self.creature.max_hp * 1/8)
-                self.damage(damage)
-            case NonVolatileStatusEnum.FRZ:
-                thaws = uniform(0.0, 1.0) < 0.2
-                if thaws:
+        """Applies the end turn handler of the Creature's status, counts down its duration, and then applies the end turn handlers of the volatile 
+        statuses.
+
+        Args:
+            rng (Optional[CombatRNG], optional): Random number source for the thaw check. Defaults to the shared default RNG.
+            opponent (Optional[Participant], optional): Participant being battled, healed by leech seed. Defaults to None.
+        """
+        creature = self.creature
+        status = creature._status
+        if status is not _NO_STATUS:
+            handler = NON_VOLATILE_END_TURN.get(status, None)
+            if handler is not None:
+                handler(self, opponent, get_default_rng() if rng is None else rng)
+            # Statuses with a duration of -1 last until removed, so only positive durations count down
+            if creature._status_duration > 0:
+                creature._set_status(creature._status, creature._status_duration - 1)
+                if creature._status_duration == 0:
                     self.remove_status_non_volatile()
-            case NonVolatileStatusEnum.PSN:
-                damage = int(self.creature.max_hp * 1/8)
-                self.damage(damage)
-            case NonVolatileStatusEnum.BPSN:
-                damage = int(self.creature.max_hp * self.bpsn_counter / 16)
-                self.damage(damage)
-                self.bpsn_counter += 1
-        if self.creature.status_duration != -1:
-            self.creature._status_duration = max(self.creature.status_duration - 1, 0)
-            if self.creature.status_duration == 0:
-                self.remove_status_non_volatile()
+        if self.volatile_statuses:
+            volatile_end_turn(self, opponent, get_default_rng() if rng is None else rng)
     
+    def apply_environment_end_turn(self, environment: int) -> None:
+        """Applies the end turn chip damage, or healing, of the environment to the creature if it is still alive.
+
+        Args:
+            environment (int): Environment index of the battle
+        """
+        chip = self.environment_chip[environment]
+        if chip != 0.0 and self.is_alive:
+            self._adjust_hp(-int(self.creature.max_hp * chip))
+
     @staticmethod
     def _stat_stage_modifier(stage: int) -> float:
         """How much does the current stat stage effect the base stat of the creature. Follows the equation for GEN2+: max(2, 2+stage)/max(2,2-stage) 
@@ -200,7 +536,7 @@ class Participant:
         Returns:
             float: Modifier for the base stat of the creature
         """
-        return (2 + stage) / 2 if stage >= 0 else 2 / (2 - stage)
+        return STAGE_MULTIPLIERS[stage + 6]
     
     @property
     def is_alive(self) -> bool:
@@ -211,6 +547,15 @@ class Participant:
         """
         return False if self.creature is None else self.creature.is_alive
     
+    @property
+    def legal_move_mask(self) -> int:
+        """Wrapper accessor method of the Creature's legal_move_mask attribute
+
+        Returns:
+            int: Bitmask with bit n set if move slot n of the active creature has PP remaining
+        """
+        return 0 if self.creature is None else self.creature.legal_move_mask
+    
     @property
     def lvl(self) -> int:
         """Wrapper accessor method of the Creature's level attribute 
@@ -247,15 +592,6 @@ class Participant:
         """
         return 0 if self.creature is None else self._p_atk_stage 
     
-    @property
-    def p_atk(self) -> int:
-        """Effective physical attack for the participant, adjusted by the current physical attack stage
-
-        Returns:
-            int: Effective physical attack of the creature
-        """
-        return 0 if self.creature is None else int(self.creature.p_atk * self._stat_stage_modifier(self.p_atk_stage))
-
     @property
     def p_def_stage(self) -> int:
         """Accessor method for the physical defense stage of the current participant 
@@ -265,15 +601,6 @@ class Participant:
         """
         return 0 if self.creature is None else self._p_def_stage
     
-    @property
-    def p_def(self) -> int:
-        """Effective physical defense for the participant, adjusted by the current physical defense stage
-
-        Returns:
-            int: Effective physical defense of the creature
-        """
-        return 0 if self.creature is None else int(self.creature.p_def * self._stat_stage_modifier(self.p_def_stage))
-    
     @property
     def s_atk_stage(self) -> int:
         """Accessor method for the special attack stage of the current participant 
@@ -283,15 +610,6 @@ class Participant:
         """
         return 0 if self.creature is None else self._s_atk_stage
     
-    @property
-    def s_atk(self) -> int:
-        """Effective special attack for the participant, adjusted by the current special attack stage
-
-        Returns:
-            int: Effective special attack of the creature
-        """
-        return 0 if self.creature is None else int(self.creature.s_atk * self._stat_stage_modifier(self.s_atk_stage))
-    
     @property
     def s_def_stage(self) -> int:
         """Accessor method for the special defense stage of the current participant 
@@ -301,15 +619,6 @@ class Participant:
         """
         return 0 if self.creature is None else self._s_def_stage
     
-    @property
-    def s_def(self) -> int:
-        """Effective special defense for the participant, adjusted by the current special defense stage
-
-        Returns:
-            int: Effective special defense of the creature
-        """
-        return 0 if self.creature is None else int(self.creature.s_def * self._stat_stage_modifier(self.s_def_stage))
-    
     @property
     def spd_stage(self) -> int:
         """Accessor method for the speed stage of the current participant 
@@ -319,15 +628,6 @@ class Participant:
         """
         return 0 if self.creature is None else self._spd_stage
     
-    @property
-    def spd(self) -> int:
-        """Effective speed for the participant, adjusted by the current speed stage
-
-        Returns:
-            int: Effective physical defense of the creature
-        """
-        return 0 if self.creature is None else int(self.creature.spd * self._stat_stage_modifier(self.spd_stage))
-    
     @property
     def acc_stage(self) -> int:
         """Accessor method for the accuracy stage of the current participant 
@@ -354,4 +654,8 @@ class Participant:
             int: Current critical stage of the participant
         """
         return 0 if self.creature is None else self._crit_stage
-    
\ No newline at end of file
+
+
+# Stage adjusters indexed by stat index, used to run compiled stat stage effects without string parsing
+_STAGE_ADJUSTERS = (Participant.adjust_p_atk_stage, Participant.adjust_p_def_stage, Participant.adjust_s_atk_stage, Participant.adjust_s_def_stage,
+                    Participant.adjust_spd_stage, Participant.adjust_acc_stage, Participant.adjust_eva_stage, Participant.adjust_crit_stage)
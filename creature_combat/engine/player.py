@@ -1,7 +1,8 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 
-from creature_combat.engine.participant import Participant
+from creature_combat.creature.creature import CREATURE_STATE_SIZE
+from creature_combat.engine.participant import Participant, PARTICIPANT_STATE_SIZE
 from creature_combat.utils import annotations as anno
 
 
@@ -10,15 +11,33 @@ class Player(ABC):
         self.participant = Participant()
         self.creature_team: anno.Team = {creature.name: creature for creature in creature_team}
         
+    def begin_battle(self, opponent: Player, is_player_1: bool, manager: anno.Optional[anno.CombatManager]=None) -> None:
+        """Called by CombatManager.reset before the first creatures are chosen, so players that need to know their opponent or the battle can keep a 
+        reference to them.
+
+        Args:
+            opponent (Player): The player this player is going against
+            is_player_1 (bool): Whether this player is player 1 in the combat, and so wins speed ties
+            manager (Optional[CombatManager], optional): The manager running the battle, whose environment changes as the battle goes on. Defaults to None.
+        """
+        pass
+
+    def close(self) -> None:
+        """Releases resources the player holds across battles, i.e. worker processes. Called by the tournament code after every game with the players 
+        it made, players without resources do nothing.
+        """
+        pass
+        
     @abstractmethod
-    def select_move(self, opponent: Participant) -> str:
-        """Selects what move of the available moves to use for this round of combat.
+    def select_move(self, opponent: Participant) -> anno.Union[int, str]:
+        """Selects what move of the available moves to use for this round of combat. Returning the move slot skips looking the move up by name, the 
+        legal slots are the set bits of participant.legal_move_mask.
 
         Args:
             opponent (Participant): The opponent this player is going against.
 
         Returns:
-            str: Name of the move to use 
+            Union[int, str]: Move slot, [0-3], or name of the move to use 
         """
         pass
         
@@ -31,8 +50,10 @@ class Player(ABC):
         Returns:
             Move: What move is used by this player this round.
         """
-        move_name = self.select_move(opponent)
-        return self.participant.make_move(move_name)
+        choice = self.select_move(opponent)
+        if isinstance(choice, str):
+            return self.participant.make_move(choice)
+        return self.participant.make_move_at(choice)
     
     @abstractmethod
     def choose_next_creature(self, opponent: anno.Optional[Participant]) -> anno.Creature:
@@ -62,4 +83,68 @@ class Player(ABC):
         Returns:
             List[Creature]: List of available creatures if they are alive
         """
-        return [creature for creature in self.creature_team.values() if creature.is_alive]
\ No newline at end of file
+        return [creature for creature in self.creature_team.values() if creature.is_alive]
+    
+    def zobrist_hash(self) -> int:
+        """Combines the incrementally maintained Zobrist hashes of the participant and every creature of the team.
+
+        Returns:
+            int: 64 bit hash of everything the player writes to a battle state
+        """
+        zobrist_hash = self.participant.zobrist_hash
+        for creature in self.creature_team.values():
+            zobrist_hash ^= creature.zobrist_hash
+        return zobrist_hash
+
+    def state_size(self) -> int:
+        """Number of ints the player writes to a battle state.
+
+        Returns:
+            int: Size of the player's region of a battle state
+        """
+        return 1 + PARTICIPANT_STATE_SIZE + CREATURE_STATE_SIZE * len(self.creature_team)
+
+    def write_state(self, data: anno.MutableSequence[int], offset: int) -> int:
+        """Writes the team slot of the active creature, the participant and every creature of the team into a battle state buffer. The active slot is -1
+        when no creature is in battle.
+
+        Args:
+            data (MutableSequence[int]): Buffer to write into
+            offset (int): Index of the first int to write
+
+        Returns:
+            int: Index after the last int written
+        """
+        active = self.participant.creature
+        active_slot = -1
+        for slot, creature in enumerate(self.creature_team.values()):
+            if creature is active:
+                active_slot = slot
+                break
+        data[offset] = active_slot
+        offset = self.participant.write_state(data, offset + 1)
+        for creature in self.creature_team.values():
+            offset = creature.write_state(data, offset)
+        return offset
+
+    def read_state(self, data: anno.Sequence[int], offset: int) -> int:
+        """Restores the active creature, the participant and every creature of the team from a battle state buffer written by write_state. Creatures are
+        placed back into the participant directly, so no swap logic runs and stat stages are kept.
+
+        Args:
+            data (Sequence[int]): Buffer to read from
+            offset (int): Index of the first int to read
+
+        Returns:
+            int: Index after the last int read
+        """
+        active_slot = data[offset]
+        offset = self.participant.read_state(data, offset + 1)
+        active = None
+        for slot, creature in enumerate(self.creature_team.values()):
+            if slot == active_slot:
+                active = creature
+            offset = creature.read_state(data, offset)
+        if active is not self.participant.creature:
+            self.participant.add_creature(active)
+        return offset
@@ -0,0 +1,257 @@
+from __future__ import annotations
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from math import ceil
+
+from numpy import ndarray, zeros, int64
+from numpy.random import SeedSequence
+
+from creature_combat.engine.combat_manager import CombatManager, PLAYER_1_WIN, PLAYER_2_WIN
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.rng import CombatRNG
+
+# Teams, player factory and max rounds of the running tournament. Set in the parent before the pool starts so forked workers inherit the already loaded
+# creatures and moves copy-on-write instead of unpickling or re-parsing them. Start methods without fork fill it through _init_worker instead.
+_WORKER_STATE: anno.Optional[anno.Tuple[anno.Sequence[anno.Creatures], anno.Callable[[anno.Creatures], anno.Player], int]] = None
+
+
+def _init_worker(teams: anno.Sequence[anno.Creatures], player_factory: anno.Callable[[anno.Creatures], anno.Player], max_rounds: int) -> None:
+    """Stores the tournament state in a worker process that was not forked from the parent.
+
+    Args:
+        teams (Sequence[Creatures]): Teams competing in the tournament
+        player_factory (Callable[[Creatures], Player]): Builds a player for a team
+        max_rounds (int): Maximum number of rounds before a game is called a draw
+    """
+    global _WORKER_STATE
+    _WORKER_STATE = (teams, player_factory, max_rounds)
+
+
+def play_games(team_1: anno.Creatures, team_2: anno.Creatures, player_factory: anno.Callable[[anno.Creatures], anno.Player], n_games: int,
+               rng: anno.Optional[anno.Union[int, CombatRNG]]=None, max_rounds: int=1000, first_game: int=0) -> anno.Tuple[int, int, int]:
+    """Plays n_games between two teams, swapping which team is player 1 every game so neither team keeps the speed tie advantage. Every creature is
+    reset before each game and one CombatManager is reused for all of the games. Both players are made for each game and closed after it.
+
+    Args:
+        team_1 (Creatures): First team
+        team_2 (Creatures): Second team
+        player_factory (Callable[[Creatures], Player]): Builds a player for a team, i.e. a Player subclass
+        n_games (int): Number of games to play
+        rng (Optional[Union[int, CombatRNG]], optional): Seed or RNG used for every game. Defaults to None.
+        max_rounds (int, optional): Maximum number of rounds before a game is called a draw. Defaults to 1000.
+        first_game (int, optional): Index of the first game, used to keep the side alternation consistent across chunks. Defaults to 0.
+
+    Returns:
+        Tuple[int, int, int]: Games won by team 1, games won by team 2, and games drawn
+    """
+    return _play_games(team_1, team_2, player_factory, n_games, rng, max_rounds, first_game)[:3]
+
+
+def _play_games(team_1: anno.Creatures, team_2: anno.Creatures, player_factory: anno.Callable[[anno.Creatures], anno.Player], n_games: int,
+                rng: anno.Optional[anno.Union[int, CombatRNG]], max_rounds: int, first_game: int) -> anno.Tuple[int, int, int, int]:
+    """Plays the games of play_games, also counting the rounds played so throughput can be reported in rounds. See play_games for the arguments.
+
+    Returns:
+        Tuple[int, int, int, int]: Games won by team 1, games won by team 2, games drawn, and rounds played
+    """
+    manager = CombatManager(rng=rng)
+    creatures = list(team_1) + list(team_2)
+    team_1_wins = 0
+    team_2_wins = 0
+    draws = 0
+    rounds = 0
+    for game in range(first_game, first_game + n_games):
+        for creature in creatures:
+            creature.reset_all()
+        team_1_first = game % 2 == 0
+        player_1 = player_factory(team_1 if team_1_first else team_2)
+        player_2 = player_factory(team_2 if team_1_first else team_1)
+        try:
+            result = manager.run_battle(player_1, player_2, max_rounds)
+        finally:
+            player_1.close()
+            player_2.close()
+        rounds += manager.round_number
+        if result == PLAYER_1_WIN:
+            team_1_wins += team_1_first
+            team_2_wins += not team_1_first
+        elif result == PLAYER_2_WIN:
+            team_1_wins += not team_1_first
+            team_2_wins += team_1_first
+        else:
+            draws += 1
+    return team_1_wins, team_2_wins, draws, rounds
+
+
+def play_chunk(team_1_index: int, team_2_index: int, first_game: int, n_games: int, seed: SeedSequence) -> anno.Tuple[int, int, int, int, int, int]:
+    """Plays one chunk of a pairing using the teams registered by worker_pool in the current process.
+
+    Args:
+        team_1_index (int): Index of the first team
+        team_2_index (int): Index of the second team
+        first_game (int): Index of the first game in the chunk
+        n_games (int): Number of games in the chunk
+        seed (SeedSequence): Seed for the chunk
+
+    Returns:
+        Tuple[int, int, int, int, int, int]: Team indices followed by the team 1 wins, team 2 wins, draws and rounds played of the chunk
+    """
+    teams, player_factory, max_rounds = _WORKER_STATE
+    results = _play_games(teams[team_1_index], teams[team_2_index], player_factory, n_games, CombatRNG(seed), max_rounds, first_game)
+    return (team_1_index, team_2_index) + results
+
+
+@contextmanager
+def worker_pool(teams: anno.Sequence[anno.Creatures], player_factory: anno.Callable[[anno.Creatures], anno.Player], max_rounds: int,
+                workers: int) -> anno.Iterator[anno.Optional[ProcessPoolExecutor]]:
+    """Makes the teams available to play_chunk in this process and, when more than one worker is requested, starts a process pool that shares them.
+    Forked workers inherit the teams copy-on-write, other start methods receive them once per worker through _init_worker.
+
+    Args:
+        teams (Sequence[Creatures]): Teams that chunks can refer to by index
+        player_factory (Callable[[Creatures], Player]): Builds a player for a team
+        max_rounds (int): Maximum number of rounds before a game is called a draw
+        workers (int): Number of worker processes, 1 plays chunks in process
+
+    Yields:
+        Optional[ProcessPoolExecutor]: The pool to submit play_chunk to, or None when chunks should be played in process
+    """
+    global _WORKER_STATE
+    state = (teams, player_factory, max_rounds)
+    previous_state = _WORKER_STATE
+    _WORKER_STATE = state
+    try:
+        if workers == 1:
+            yield None
+        else:
+            if "fork" in multiprocessing.get_all_start_methods():
+                executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+            else:
+                executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=state)
+            with executor:
+                yield executor
+    finally:
+        _WORKER_STATE = previous_state
+
+
+@dataclass
+class TournamentResult:
+    """Aggregated results of a round robin tournament. wins[i, j] is the number of games team i won against team j, and draws[i, j] the number of games
+    between them that were drawn, so draws is symmetric.
+    """
+    wins: ndarray
+    draws: ndarray
+
+    @property
+    def games(self) -> ndarray:
+        """Number of games played between each pair of teams.
+
+        Returns:
+            ndarray: (n_teams, n_teams) matrix of games played
+        """
+        return self.wins + self.wins.T + self.draws
+
+    @property
+    def losses(self) -> ndarray:
+        """Number of games each team lost against each other team.
+
+        Returns:
+            ndarray: (n_teams, n_teams) matrix where losses[i, j] is the number of games team i lost against team j
+        """
+        return self.wins.T
+
+    def win_rates(self) -> ndarray:
+        """Fraction of all of its games each team won.
+
+        Returns:
+            ndarray: Win rate of each team
+        """
+        return self.wins.sum(axis=1) / self.games.sum(axis=1)
+
+
+class Tournament:
+    """Round robin tournament runner. Every pair of teams plays games_per_pairing games, split into chunks that are spread over a ProcessPoolExecutor.
+    Workers are forked where the platform supports it so they share the teams built in the parent, and every chunk only sends four ints and a seed over IPC.
+    Each chunk has its own seed spawned from the tournament seed, so results only depend on the seed and chunk size, not on the number of workers.
+    """
+    def __init__(self, teams: anno.Sequence[anno.Creatures], player_factory: anno.Callable[[anno.Creatures], anno.Player], games_per_pairing: int,
+                 max_rounds: int=1000, workers: anno.Optional[int]=None, chunk_size: anno.Optional[int]=None, seed: anno.Optional[int]=None):
+        """
+        Args:
+            teams (Sequence[Creatures]): Teams competing, i.e. built from a CreatureDex and MoveList. Teams must not share Creature objects.
+            player_factory (Callable[[Creatures], Player]): Builds a player for a team. Must be picklable when fork is not available.
+            games_per_pairing (int): Number of games each pair of teams plays
+            max_rounds (int, optional): Maximum number of rounds before a game is called a draw. Defaults to 1000.
+            workers (Optional[int], optional): Number of worker processes, 1 runs in process. Defaults to the number of CPUs.
+            chunk_size (Optional[int], optional): Number of games per task. Defaults to splitting the games into about 4 tasks per worker.
+            seed (Optional[int], optional): Seed of the tournament. Defaults to None.
+        """
+        assert len(teams) >= 2, f"A tournament needs at least 2 teams, provided {len(teams)}"
+        assert games_per_pairing > 0, f"Games per pairing must be positive, provided {games_per_pairing}"
+        creature_ids = [id(creature) for team in teams for creature in team]
+        assert len(creature_ids) == len(set(creature_ids)), "Teams must not share Creature objects, make a new creature for every team"
+        self.teams = teams
+        self.player_factory = player_factory
+        self.games_per_pairing = games_per_pairing
+        self.max_rounds = max_rounds
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.pairings = [(i, j) for i in range(len(teams)) for j in range(i + 1, len(teams))]
+        if chunk_size is None:
+            chunk_size = ceil(len(self.pairings) * games_per_pairing / (4 * self.workers))
+        self.chunk_size = max(1, min(chunk_size, games_per_pairing))
+        self.seed = seed
+
+    def _chunks(self) -> anno.List[anno.Tuple[int, int, int, int, SeedSequence]]:
+        """Splits every pairing into chunks of at most chunk_size games, each with its own seed.
+
+        Returns:
+            List[Tuple[int, int, int, int, SeedSequence]]: Arguments of play_chunk for every chunk
+        """
+        chunks = [(i, j, first_game, min(self.chunk_size, self.games_per_pairing - first_game))
+                  for i, j in self.pairings for first_game in range(0, self.games_per_pairing, self.chunk_size)]
+        seeds = SeedSequence(self.seed).spawn(len(chunks))
+        return [chunk + (seed,) for chunk, seed in zip(chunks, seeds)]
+
+    def stream(self) -> anno.Iterator[anno.Tuple[int, int, int, int, int, int]]:
+        """Plays every pairing, yielding the result of every chunk as soon as it completes so callers can report progress or write results out while
+        the tournament runs. Chunks complete in any order when played by a pool, but every chunk is seeded on its own so the results do not change.
+
+        Yields:
+            Tuple[int, int, int, int, int, int]: Team indices followed by the team 1 wins, team 2 wins, draws and rounds played of the chunk
+        """
+        chunks = self._chunks()
+        with worker_pool(self.teams, self.player_factory, self.max_rounds, self.workers) as executor:
+            if executor is None:
+                for chunk in chunks:
+                    yield play_chunk(*chunk)
+            else:
+                for future in as_completed([executor.submit(play_chunk, *chunk) for chunk in chunks]):
+                    yield future.result()
+
+    @property
+    def total_games(self) -> int:
+        """Number of games the tournament plays over every pairing.
+
+        Returns:
+            int: Total number of games
+        """
+        return len(self.pairings) * self.games_per_pairing
+
+    def run(self) -> TournamentResult:
+        """Plays every pairing and aggregates the results.
+
+        Returns:
+            TournamentResult: Win and draw matrices of the tournament
+        """
+        n_teams = len(self.teams)
+        wins = zeros((n_teams, n_teams), dtype=int64)
+        draws = zeros((n_teams, n_teams), dtype=int64)
+        for i, j, team_1_wins, team_2_wins, chunk_draws, _ in self.stream():
+            wins[i, j] += team_1_wins
+            wins[j, i] += team_2_wins
+            draws[i, j] += chunk_draws
+            draws[j, i] += chunk_draws
+        return TournamentResult(wins, draws)
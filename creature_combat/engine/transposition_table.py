@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from creature_combat.utils import annotations as anno
+
+
+class TranspositionTable:
+    """Fixed size hash table from battle state hashes to search results, i.e. values or visit statistics, so searches can reuse the results of states
+    reached through different move orders. Each hash maps to one slot chosen by its low bits. On a collision the stored entry is kept only if it was
+    searched deeper than the new one, so the table never grows and stale shallow entries are replaced.
+    """
+    def __init__(self, size_log2: int=16):
+        """
+        Args:
+            size_log2 (int, optional): Log base 2 of the number of slots. Defaults to 16.
+        """
+        assert 0 < size_log2 <= 30, f"Table size must be on the range [1, 30] as a power of 2, provided {size_log2}"
+        self.size = 1 << size_log2
+        self._mask = self.size - 1
+        self._keys: anno.List[anno.Optional[int]] = [None] * self.size
+        self._values: anno.List[anno.Any] = [None] * self.size
+        self._depths: anno.List[int] = [0] * self.size
+        self._filled = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return self._filled
+
+    def __contains__(self, key: int) -> bool:
+        return self._keys[key & self._mask] == key
+
+    def get(self, key: int, default: anno.Any=None) -> anno.Any:
+        """Looks up the value stored for a hash.
+
+        Args:
+            key (int): Hash of the state
+            default (Any, optional): Returned when the hash is not stored. Defaults to None.
+
+        Returns:
+            Any: The stored value or default
+        """
+        slot = key & self._mask
+        if self._keys[slot] == key:
+            self.hits += 1
+            return self._values[slot]
+        self.misses += 1
+        return default
+
+    def store(self, key: int, value: anno.Any, depth: int=0) -> bool:
+        """Stores a value for a hash. Replaces the entry in the slot unless it holds another hash that was searched deeper.
+
+        Args:
+            key (int): Hash of the state
+            value (Any): Value to store
+            depth (int, optional): How deep the value was searched, deeper entries are kept over shallower ones. Defaults to 0.
+
+        Returns:
+            bool: Whether the value was stored
+        """
+        slot = key & self._mask
+        stored_key = self._keys[slot]
+        if stored_key is not None and stored_key != key and self._depths[slot] > depth:
+            return False
+        if stored_key is None:
+            self._filled += 1
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._depths[slot] = depth
+        return True
+
+    def clear(self) -> None:
+        """Removes every entry and resets the hit and miss counters.
+        """
+        self._keys = [None] * self.size
+        self._values = [None] * self.size
+        self._depths = [0] * self.size
+        self._filled = 0
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+from numpy.random import SeedSequence
+
+from creature_combat.engine.tournament import play_chunk, worker_pool
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.extended_enums import ExtendedEnum
+from creature_combat.utils.math_utils import beta_interval, wilson_interval
+
+
+class IntervalMethodEnum(ExtendedEnum):
+    WILSON:int=0
+    BETA:int=1
+
+
+@dataclass
+class WinProbabilityEstimate:
+    """Result of estimate_win_probability. Draws count as games team 1 did not win, so probability is P(team 1 beats team 2)."""
+    wins: int
+    losses: int
+    draws: int
+    lower: float
+    upper: float
+    confidence: float
+    converged: bool
+
+    @property
+    def games(self) -> int:
+        """Number of games simulated.
+
+        Returns:
+            int: Total number of games
+        """
+        return self.wins + self.losses + self.draws
+
+    @property
+    def probability(self) -> float:
+        """Point estimate of the probability team 1 beats team 2.
+
+        Returns:
+            float: Fraction of games won by team 1
+        """
+        return self.wins / self.games if self.games > 0 else 0.0
+
+    @property
+    def half_width(self) -> float:
+        """Half of the width of the interval.
+
+        Returns:
+            float: Half of upper - lower
+        """
+        return 0.5 * (self.upper - self.lower)
+
+
+def win_probability_interval(wins: int, games: int, confidence: float=0.95,
+                             method: anno.Union[str, int, IntervalMethodEnum]=IntervalMethodEnum.WILSON) -> anno.Tuple[float, float]:
+    """Computes the interval of the win probability with the requested method.
+
+    Args:
+        wins (int): Number of games won
+        games (int): Number of games played
+        confidence (float, optional): Confidence level of the interval. Defaults to 0.95.
+        method (Union[str, int, IntervalMethodEnum], optional): WILSON for the Wilson score interval, BETA for a Beta(1, 1) credible interval.
+            Defaults to IntervalMethodEnum.WILSON.
+
+    Returns:
+        Tuple[float, float]: Lower and upper bound of the interval
+    """
+    if not isinstance(method, IntervalMethodEnum):
+        method = IntervalMethodEnum.init_from_key_or_value(method)
+    match method:
+        case IntervalMethodEnum.WILSON:
+            return wilson_interval(wins, games, confidence)
+        case IntervalMethodEnum.BETA:
+            return beta_interval(wins, games, confidence)
+
+
+def estimate_win_probability(team_1: anno.Creatures, team_2: anno.Creatures, player_factory: anno.Callable[[anno.Creatures], anno.Player],
+                             half_width: float=0.02, confidence: float=0.95, method: anno.Union[str, int, IntervalMethodEnum]=IntervalMethodEnum.WILSON,
+                             batch_size: int=100, min_games: int=100, max_games: int=100_000, workers: int=1, max_rounds: int=1000,
+                             seed: anno.Optional[int]=None) -> WinProbabilityEstimate:
+    """Estimates the probability team 1 beats team 2 by simulating batches of games until the interval is narrow enough. Lopsided matchups stop after
+    a few hundred games while close matchups keep sampling, up to max_games. With more than one worker, each step plays one batch per worker in a
+    forked process pool, so the games played are rounded up to a multiple of workers * batch_size. Teams swap sides every game.
+
+    Args:
+        team_1 (Creatures): Team whose win probability is estimated
+        team_2 (Creatures): Opposing team, must not share Creature objects with team_1
+        player_factory (Callable[[Creatures], Player]): Builds a player for a team, i.e. a Player subclass
+        half_width (float, optional): Stop once half of the interval width is at most this value. Defaults to 0.02.
+        confidence (float, optional): Confidence level of the interval. Defaults to 0.95.
+        method (Union[str, int, IntervalMethodEnum], optional): Interval used for the stopping rule. Defaults to IntervalMethodEnum.WILSON.
+        batch_size (int, optional): Number of games per batch. Defaults to 100.
+        min_games (int, optional): Minimum number of games before the stopping rule is checked. Defaults to 100.
+        max_games (int, optional): Stop after this many games even if the interval is still too wide. Defaults to 100_000.
+        workers (int, optional): Number of worker processes, 1 plays batches in process. Defaults to 1.
+        max_rounds (int, optional): Maximum number of rounds before a game is called a draw. Defaults to 1000.
+        seed (Optional[int], optional): Seed of the estimate. Defaults to None.
+
+    Returns:
+        WinProbabilityEstimate: Game counts and interval once the stopping rule was met or max_games were played
+    """
+    assert 0.0 < half_width < 0.5, f"Half width must be on the interval (0, 0.5), provided {half_width}"
+    assert 0.0 < confidence < 1.0, f"Confidence must be on the interval (0, 1), provided {confidence}"
+    assert batch_size > 0, f"Batch size must be positive, provided {batch_size}"
+    assert workers > 0, f"Workers must be positive, provided {workers}"
+    creature_ids = [id(creature) for creature in list(team_1) + list(team_2)]
+    assert len(creature_ids) == len(set(creature_ids)), "Teams must not share Creature objects, make a new creature for every team"
+    seed_sequence = SeedSequence(seed)
+    wins = losses = draws = 0
+    lower, upper = 0.0, 1.0
+    with worker_pool((team_1, team_2), player_factory, max_rounds, workers) as executor:
+        while wins + losses + draws < max_games:
+            games = wins + losses + draws
+            n_batches = min(workers, -(-(max_games - games) // batch_size))
+            batches = [(0, 1, games + n * batch_size, min(batch_size, max_games - games - n * batch_size)) for n in range(n_batches)]
+            seeds = seed_sequence.spawn(n_batches)
+            if executor is None:
+                results = [play_chunk(*batch, batch_seed) for batch, batch_seed in zip(batches, seeds)]
+            else:
+                results = executor.map(play_chunk, *zip(*batches), seeds)
+            for _, _, batch_wins, batch_losses, batch_draws, _ in results:
+                wins += batch_wins
+                losses += batch_losses
+                draws += batch_draws
+            lower, upper = win_probability_interval(wins, wins + losses + draws, confidence, method)
+            if wins + losses + draws >= min_games and 0.5 * (upper - lower) <= half_width:
+                return WinProbabilityEstimate(wins, losses, draws, lower, upper, confidence, True)
+    return WinProbabilityEstimate(wins, losses, draws, lower, upper, confidence, False)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from creature_combat.creature.creature_types import CreatureTypeEnum
+from creature_combat.environment.environment_types import TerrainEnum, WeatherEnum
+from creature_combat.utils import annotations as anno
+
+# The environment of a battle is a single int combining the weather and the terrain, every table below is indexed by it. NO_ENVIRONMENT is the index
+# of no weather and no terrain, and uses neutral rows so battles without an environment compute exactly the same damage as before
+WEATHER_COUNT = len(WeatherEnum)
+TERRAIN_COUNT = len(TerrainEnum)
+ENVIRONMENT_COUNT = WEATHER_COUNT * TERRAIN_COUNT
+NO_ENVIRONMENT = 0
+
+# Number of turns a weather or terrain lasts once a move sets it
+ENVIRONMENT_DURATION = 5
+
+
+def environment_index(weather: int, terrain: int) -> int:
+    """Combines a weather and a terrain into an environment index.
+
+    Args:
+        weather (int): WeatherEnum value
+        terrain (int): TerrainEnum value
+
+    Returns:
+        int: Environment index, [0, ENVIRONMENT_COUNT)
+    """
+    return (weather + 1) * TERRAIN_COUNT + terrain + 1
+
+
+def environment_weather(environment: int) -> int:
+    """Extracts the weather from an environment index.
+
+    Args:
+        environment (int): Environment index
+
+    Returns:
+        int: WeatherEnum value
+    """
+    return environment // TERRAIN_COUNT - 1
+
+
+def environment_terrain(environment: int) -> int:
+    """Extracts the terrain from an environment index.
+
+    Args:
+        environment (int): Environment index
+
+    Returns:
+        int: TerrainEnum value
+    """
+    return environment % TERRAIN_COUNT - 1
+
+
+# Damage multipliers by attacking element, only the elements that are changed are listed
+_WEATHER_DAMAGE = {
+    WeatherEnum.SUN: {CreatureTypeEnum.FIRE: 1.5, CreatureTypeEnum.WATER: 0.5},
+    WeatherEnum.RAIN: {CreatureTypeEnum.WATER: 1.5, CreatureTypeEnum.FIRE: 0.5},
+}
+_TERRAIN_DAMAGE = {
+    TerrainEnum.ELECTRIC_TERRAIN: {CreatureTypeEnum.ELECTRIC: 1.3},
+    TerrainEnum.GRASSY_TERRAIN: {CreatureTypeEnum.GRASS: 1.3},
+    TerrainEnum.MISTY_TERRAIN: {CreatureTypeEnum.DRAGON: 0.5},
+    TerrainEnum.PSYCHIC_TERRAIN: {CreatureTypeEnum.PSYCHIC: 1.3},
+}
+# Fraction of the max hp lost at the end of every turn, negative fractions heal, and the defending types that are immune to it
+_WEATHER_CHIP: anno.Dict[WeatherEnum, anno.Tuple[float, anno.Tuple[CreatureTypeEnum, ...]]] = {
+    WeatherEnum.HAIL: (1/16, (CreatureTypeEnum.ICE,)),
+    WeatherEnum.SANDSTORM: (1/16, (CreatureTypeEnum.ROCK, CreatureTypeEnum.GROUND, CreatureTypeEnum.STEEL)),
+}
+_TERRAIN_CHIP: anno.Dict[TerrainEnum, anno.Tuple[float, anno.Tuple[CreatureTypeEnum, ...]]] = {
+    TerrainEnum.GRASSY_TERRAIN: (-1/16, ()),
+}
+
+
+def _damage_modifier(weather: WeatherEnum, terrain: TerrainEnum, element: CreatureTypeEnum) -> float:
+    return _WEATHER_DAMAGE.get(weather, {}).get(element, 1.0) * _TERRAIN_DAMAGE.get(terrain, {}).get(element, 1.0)
+
+
+def _chip_terms(weather: WeatherEnum, terrain: TerrainEnum) -> anno.Tuple[anno.Tuple[float, anno.FrozenSet[int]], ...]:
+    terms = (_WEATHER_CHIP.get(weather, None), _TERRAIN_CHIP.get(terrain, None))
+    return tuple((fraction, frozenset(immune_type.value for immune_type in immune)) for fraction, immune in filter(None, terms))
+
+
+# Weather outer and terrain inner, so position n of the iteration is environment index n
+_ENVIRONMENTS = tuple((weather, terrain) for weather in WeatherEnum for terrain in TerrainEnum)
+
+# TABLE[ENVIRONMENT][ATTACK] => The modifier applied to the damage of an attack by the ATTACK element in the environment, stored as plain python floats
+# so calculate_damage applies the whole environment with a single lookup
+ENVIRONMENT_DAMAGE_MODIFIERS = tuple(tuple(_damage_modifier(weather, terrain, element) for element in CreatureTypeEnum) for weather, terrain in _ENVIRONMENTS)
+
+# MAP[TYPE_1][TYPE_2][ENVIRONMENT] => Fraction of the max hp a creature of types TYPE_1 and TYPE_2 loses at the end of every turn in the environment,
+# negative fractions heal. Single type creatures use the diagonal, like DEFENSIVE_TYPE_MODIFIERS, so the row can be looked up once on switch in
+_CHIP_TERMS = tuple(_chip_terms(weather, terrain) for weather, terrain in _ENVIRONMENTS)
+_CHIP_IMMUNE_TYPES = frozenset().union(*(immune for terms in _CHIP_TERMS for _, immune in terms))
+
+
+def _chip_row(immune_types: anno.FrozenSet[int]) -> anno.Tuple[float, ...]:
+    return tuple(sum((fraction for fraction, immune in terms if not immune & immune_types), 0.0) for terms in _CHIP_TERMS)
+
+
+# Only the types that are immune to some chip change a row, so every pair is built from the few distinct rows instead of once per pair
+_CHIP_ROWS = {immune_types: _chip_row(immune_types) for immune_types in {frozenset({type_1, type_2}) & _CHIP_IMMUNE_TYPES for type_1 in range(18) for type_2 in range(18)}}
+ENVIRONMENT_CHIP = tuple(tuple(_CHIP_ROWS[frozenset({type_1, type_2}) & _CHIP_IMMUNE_TYPES] for type_2 in range(18)) for type_1 in range(18))
+
+
+def __getattr__(name: str):
+    """Builds the NumPy versions of the environment tables on first access, so importing the tables does not import NumPy. Only the vectorized engine
+    uses them: ENVIRONMENT_DAMAGE_ARRAY[ENVIRONMENT, ATTACK] holds ENVIRONMENT_DAMAGE_MODIFIERS and ENVIRONMENT_CHIP_ARRAY[TYPE_1, TYPE_2, ENVIRONMENT]
+    holds ENVIRONMENT_CHIP.
+    """
+    if name == 'ENVIRONMENT_DAMAGE_ARRAY':
+        from numpy import array
+        value = array(ENVIRONMENT_DAMAGE_MODIFIERS)
+    elif name == 'ENVIRONMENT_CHIP_ARRAY':
+        from numpy import array
+        value = array(ENVIRONMENT_CHIP)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -0,0 +1,18 @@
+from creature_combat.utils.extended_enums import ExtendedEnum
+
+
+class WeatherEnum(ExtendedEnum):
+    NONE:int=-1
+    SUN:int=0
+    RAIN:int=1
+    FOG:int=2
+    HAIL:int=3
+    SANDSTORM:int=4
+
+
+class TerrainEnum(ExtendedEnum):
+    NONE:int=-1
+    ELECTRIC_TERRAIN:int=0
+    GRASSY_TERRAIN:int=1
+    MISTY_TERRAIN:int=2
+    PSYCHIC_TERRAIN:int=3
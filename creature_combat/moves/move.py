@@ -2,12 +2,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from json import load
 
+from creature_combat.moves.move_effects import compile_effects, compile_environment_effects
 from creature_combat.moves.move_types import MoveTypeEnum
 from creature_combat.creature.creature_types import CreatureTypeEnum
 from creature_combat.utils import annotations as anno
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Move:
     name: str
     move_type: MoveTypeEnum
@@ -20,6 +21,24 @@ class Move:
     self_effect: anno.List[str]=field(default_factory=list)
     opponent_effect: anno.List[str]=field(default_factory=list)
     environment_effect: anno.List[str]=field(default_factory=list)
+    # Effect programs compiled from the effect strings, these are what the engine runs
+    self_program: anno.EffectProgram=field(init=False, repr=False, compare=False)
+    opponent_program: anno.EffectProgram=field(init=False, repr=False, compare=False)
+    environment_program: anno.EffectProgram=field(init=False, repr=False, compare=False)
+    lifesteal: anno.Optional[anno.Effect]=field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        try:
+            self_program, lifesteal = compile_effects(self.self_effect, allow_lifesteal=True)
+            opponent_program, _ = compile_effects(self.opponent_effect, allow_lifesteal=False)
+            environment_program = compile_environment_effects(self.environment_effect)
+        except ValueError as e:
+            raise ValueError(f"Move {self.name} has an invalid effect: {e}") from e
+        # Moves are frozen, so the compiled programs are set through object.__setattr__
+        object.__setattr__(self, 'self_program', self_program)
+        object.__setattr__(self, 'lifesteal', lifesteal)
+        object.__setattr__(self, 'opponent_program', opponent_program)
+        object.__setattr__(self, 'environment_program', environment_program)
 
     @classmethod
     def from_dict(cls, config: anno.Config) -> anno.Self:
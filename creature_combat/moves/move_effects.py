@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from creature_combat.environment.environment_types import TerrainEnum, WeatherEnum
+from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+from creature_combat.statuses.volatile_statuses import VolatileStatusEnum
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.extended_enums import ExtendedEnum
+
+
+class EffectOpcodeEnum(ExtendedEnum):
+    STAT_STAGE:int=0
+    STATUS:int=1
+    HEAL_PERCENT:int=2
+    HEAL_FLAT:int=3
+    LIFESTEAL_PERCENT:int=4
+    LIFESTEAL_FLAT:int=5
+    WEATHER:int=6
+    VOLATILE_STATUS:int=7
+    TERRAIN:int=8
+
+
+# Plain int opcodes, so the engine compares ints instead of enum members
+OP_STAT_STAGE = EffectOpcodeEnum.STAT_STAGE.value
+OP_STATUS = EffectOpcodeEnum.STATUS.value
+OP_HEAL_PERCENT = EffectOpcodeEnum.HEAL_PERCENT.value
+OP_HEAL_FLAT = EffectOpcodeEnum.HEAL_FLAT.value
+OP_LIFESTEAL_PERCENT = EffectOpcodeEnum.LIFESTEAL_PERCENT.value
+OP_LIFESTEAL_FLAT = EffectOpcodeEnum.LIFESTEAL_FLAT.value
+OP_WEATHER = EffectOpcodeEnum.WEATHER.value
+OP_VOLATILE_STATUS = EffectOpcodeEnum.VOLATILE_STATUS.value
+OP_TERRAIN = EffectOpcodeEnum.TERRAIN.value
+
+# Stat stage indices, ordered the same as Participant.reset_stage
+STAT_INDEX = {"P_ATK": 0, "P_DEF": 1, "S_ATK": 2, "S_DEF": 3, "SPD": 4, "ACC": 5, "EVA": 6, "CRIT": 7}
+STAT_NAMES = tuple(STAT_INDEX.keys())
+CRIT_STAT_INDEX = STAT_INDEX["CRIT"]
+
+
+def compile_effect(effect: str) -> anno.Effect:
+    """Parses and validates a single move effect string into an (opcode, argument, amount) triple. The argument is the stat index, status value, volatile
+    status bit index, or weather value depending on the opcode. The supported formats are listed in move_data/README.md.
+
+    Args:
+        effect (str): Effect string, i.e. "P_ATK:-1", "HEAL%:50", "LIFESTEAL%:50", "BRN" or "CONFUSION"
+
+    Raises:
+        ValueError: If the effect does not follow one of the supported formats.
+
+    Returns:
+        Effect: (opcode, argument, amount) triple for the effect
+    """
+    if ":" not in effect:
+        if effect in VolatileStatusEnum.__members__:
+            return (OP_VOLATILE_STATUS, VolatileStatusEnum[effect].value, 0)
+        if effect not in NonVolatileStatusEnum.__members__ or effect == NonVolatileStatusEnum.NONE.name:
+            raise ValueError(f"Unable to parse effect {effect}, it is not a valid status effect.")
+        return (OP_STATUS, NonVolatileStatusEnum[effect].value, 0)
+    effect_type, _, amount = effect.partition(':')
+    try:
+        amount = int(amount)
+    except ValueError:
+        raise ValueError(f"Unable to parse the amount of effect {effect}, expected an integer.") from None
+    if effect_type in STAT_INDEX:
+        if not -6 <= amount <= 6:
+            raise ValueError(f"Stat stage changes must be between [-6, 6], effect was provided as {effect}.")
+        return (OP_STAT_STAGE, STAT_INDEX[effect_type], amount)
+    match effect_type:
+        case "HEAL%":
+            opcode = OP_HEAL_PERCENT
+        case "HEAL_FLAT":
+            opcode = OP_HEAL_FLAT
+        case "LIFESTEAL%":
+            opcode = OP_LIFESTEAL_PERCENT
+        case "LIFESTEAL_FLAT":
+            opcode = OP_LIFESTEAL_FLAT
+        case _:
+            raise ValueError(f"Unable to parse effect category {effect_type}, please provide a valid effect category.")
+    if opcode in (OP_HEAL_PERCENT, OP_LIFESTEAL_PERCENT) and not 0 <= amount <= 100:
+        raise ValueError(f"Percentage effects must be between [0, 100], effect was provided as {effect}.")
+    if amount < 0:
+        raise ValueError(f"Flat effects must be positive, effect was provided as {effect}.")
+    return (opcode, 0, amount)
+
+
+def compile_effects(effects: anno.Sequence[str], allow_lifesteal: bool) -> anno.Tuple[anno.EffectProgram, anno.Optional[anno.Effect]]:
+    """Compiles a list of move effect strings into an effect program, pulling out the lifesteal effect so it can be applied with the damage of the move.
+
+    Args:
+        effects (Sequence[str]): Effect strings in the order they should be applied
+        allow_lifesteal (bool): Whether a lifesteal effect is valid in this effect list
+
+    Raises:
+        ValueError: If an effect can not be parsed, or a lifesteal effect is not allowed or provided more than once.
+
+    Returns:
+        Tuple[EffectProgram, Optional[Effect]]: The effect program and the lifesteal effect if there was one
+    """
+    program = []
+    lifesteal = None
+    for effect in effects:
+        compiled = compile_effect(effect)
+        if compiled[0] in (OP_LIFESTEAL_PERCENT, OP_LIFESTEAL_FLAT):
+            if not allow_lifesteal:
+                raise ValueError(f"Lifesteal effect {effect} is only supported as a self effect.")
+            if lifesteal is not None:
+                raise ValueError(f"Only one lifesteal effect is supported per move, found a second effect {effect}.")
+            lifesteal = compiled
+        else:
+            program.append(compiled)
+    return tuple(program), lifesteal
+
+
+def compile_environment_effects(effects: anno.Sequence[str]) -> anno.EffectProgram:
+    """Compiles a list of environment effect strings into an effect program.
+
+    Args:
+        effects (Sequence[str]): Environment effect strings, i.e. "SUN", "RAIN" or "GRASSY_TERRAIN"
+
+    Raises:
+        ValueError: If an effect is not a valid weather or terrain.
+
+    Returns:
+        EffectProgram: The effect program for the environment effects
+    """
+    program = []
+    for effect in effects:
+        if effect == WeatherEnum.NONE.name:
+            raise ValueError(f"Unable to parse environment effect {effect}, it is not a valid weather or terrain.")
+        if effect in WeatherEnum.__members__:
+            program.append((OP_WEATHER, WeatherEnum[effect].value, 0))
+        elif effect in TerrainEnum.__members__:
+            program.append((OP_TERRAIN, TerrainEnum[effect].value, 0))
+        else:
+            raise ValueError(f"Unable to parse environment effect {effect}, it is not a valid weather or terrain.")
+    return tuple(program)
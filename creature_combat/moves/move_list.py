@@ -1,27 +1,70 @@
 from __future__ import annotations
-from os import listdir
+from dataclasses import dataclass
+from json import loads
 
 from creature_combat.moves.move import Move
 from creature_combat.utils import annotations as anno
+from creature_combat.utils.data_index import read_data_index
+from creature_combat.utils.parse_cache import load_cached
+
+
+@dataclass(frozen=True)
+class MoveListColumns:
+    """Columnar view of every move in a MoveList, element n of every array holds the move with ID n"""
+    power: anno.ndarray  # int16 power, 0 for moves without power
+    accuracy: anno.ndarray  # int16 accuracy, -1 for moves that always hit
+    move_type: anno.ndarray  # int8 MoveTypeEnum value
+    element: anno.ndarray  # int8 CreatureTypeEnum value
+    priority: anno.ndarray  # int8 priority
+    max_pp: anno.ndarray  # int16 maximum PP
+    high_crit: anno.ndarray  # int8, 1 for moves with a high critical chance
+
 
 class MoveList:
-    def __init__(self, data_path: anno.Path):
+    def __init__(self, data_path: anno.Path, lazy: bool=False, pack: anno.Optional[anno.DataPack]=None, cache_path: anno.Optional[anno.Path]=None):
+        """
+        Args:
+            data_path (Path): Path to the move data directory
+            lazy (bool, optional): Only read the name to file index up front and parse every move on its first get. Defaults to False, parsing every 
+                move immediately.
+            pack (Optional[DataPack], optional): Data pack compiled from data_path to read moves from instead of the JSON files, i.e. from 
+                open_data_pack. Defaults to None.
+            cache_path (Optional[Path], optional): On-disk cache of the parsed moves to load through, see parse_cache.load_cached. Every move is 
+                loaded up front when provided. Ignored when reading from a data pack. Defaults to None.
+        """
         assert data_path.exists(), f"Path to Move list data {data_path} is invalid"
         self.data_path = data_path
-        available_moves = [f for f in listdir(str(data_path)) if f.split('.')[0] != 'example' and f.split('.')[-1] == 'json']
-        self._moves = {am.split('.')[0]: Move.from_json(self.data_path / am) for am in available_moves}
+        self.lazy = lazy
+        self._pack = pack
+        # Maps every move name to its file name, or to its record in the data pack
+        self._index: anno.Dict[str, anno.Union[str, int]] = (read_data_index(data_path) if pack is None else 
+                                                             {key: record_id for record_id, key in enumerate(pack.move_keys())})
+        self._moves: anno.Dict[str, Move] = {}
+        if cache_path is not None and pack is None:
+            self._moves = load_cached(data_path, self._index, lambda content: Move.from_dict(loads(content)), cache_path)
+        elif not lazy:
+            for move_name in self._index:
+                self.get(move_name)
+        # Dense IDs are assigned in sorted name order, so they are stable for the same data set regardless of the directory listing order
+        self.names: anno.Tuple[str, ...] = tuple(sorted(self._index))
+        self.name_to_id: anno.Dict[str, int] = {name: move_id for move_id, name in enumerate(self.names)}
+        self._columns: anno.Optional[MoveListColumns] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
         
     @property
     def available_moves(self) -> anno.Set[str]:
-        """Lists the Moves that have been loaded into the MoveList
+        """Lists the Moves available in the MoveList, including the ones a lazy MoveList has not parsed yet
 
         Returns:
             Set[str]: Names of all of the Moves available in the MoveList
         """
-        return set(self._moves.keys())
+        return set(self._index.keys())
     
     def get(self, move_name: str) -> Move:
         """Accessor method for the _moves dictionary stored in the MoveList. Primarily wraps the dictionary .get() method to return a more explicit error when it errors out.
+        Moves that have not been parsed yet are parsed from their file and memoized.
 
         Args:
             move_name (str): Name of the move to get the Move for.
@@ -34,6 +77,66 @@ class MoveList:
         """
         move = self._moves.get(move_name, None)
         if move is None:
-            raise ValueError(f"Can not get data for move: {move_name} as it is not in the move list.")
+            source = self._index.get(move_name, None)
+            if source is None:
+                raise ValueError(f"Can not get data for move: {move_name} as it is not in the move list.")
+            move = Move.from_json(self.data_path / source) if self._pack is None else Move.from_dict(self._pack.move_config(source))
+            self._moves[move_name] = move
         return move
+
+    def id_of(self, move_name: str) -> int:
+        """Looks up the dense integer ID of a move.
+
+        Args:
+            move_name (str): Name of the move
+
+        Raises:
+            ValueError: If the move_name isn't in the MoveList
+
+        Returns:
+            int: ID of the move, [0, len(self))
+        """
+        move_id = self.name_to_id.get(move_name, None)
+        if move_id is None:
+            raise ValueError(f"Can not get the ID of move: {move_name} as it is not in the move list.")
+        return move_id
+
+    def get_by_id(self, move_id: int) -> Move:
+        """Accessor method for the Move with the provided dense integer ID.
+
+        Args:
+            move_id (int): ID of the move, [0, len(self))
+
+        Returns:
+            Move: Move instance for the requested move_id
+        """
+        return self.get(self.names[move_id])
+
+    def columns(self) -> MoveListColumns:
+        """Builds the columnar arrays of every move in the MoveList on the first call and returns the cached arrays after that. Element n of every 
+        array holds the move with ID n.
+
+        Returns:
+            MoveListColumns: Parallel arrays of the attributes of every move
+        """
+        # Imported here so that only callers of the vectorized columns import NumPy
+        from numpy import array, int8, int16, where
+        if self._columns is None and self._pack is not None:
+            # Pack records are stored in sorted name order, so the record fields are the columns. Only power needs converting, as the pack stores 
+            # moves without power as -1.
+            records = self._pack.moves
+            self._columns = MoveListColumns(power=where(records['power'] < 0, 0, records['power']).astype(int16), accuracy=records['accuracy'], 
+                                            move_type=records['move_type'], element=records['element'], priority=records['priority'], 
+                                            max_pp=records['max_pp'], high_crit=records['high_crit'].astype(int8))
+        if self._columns is None:
+            moves = [self.get(name) for name in self.names]
+            self._columns = MoveListColumns(
+                power=array([0 if move.power is None else move.power for move in moves], dtype=int16),
+                accuracy=array([-1 if move.accuracy is None else move.accuracy for move in moves], dtype=int16),
+                move_type=array([move.move_type.value for move in moves], dtype=int8),
+                element=array([move.element.value for move in moves], dtype=int8),
+                priority=array([move.priority for move in moves], dtype=int8),
+                max_pp=array([move.max_pp for move in moves], dtype=int16),
+                high_crit=array([int(move.high_crit_flag) for move in moves], dtype=int8))
+        return self._columns
     
\ No newline at end of file
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from creature_combat.engine.battle_events import EVENT_CONFUSED, EVENT_FLINCHED, EVENT_PARALYZED
+from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+from creature_combat.statuses.volatile_statuses import VolatileStatusEnum
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.rng import get_default_rng
+
+# Returned by before move handlers when the creature is able to move, otherwise they return the BattleEventEnum value explaining why it could not
+CAN_MOVE = -1
+
+_CONFUSION = VolatileStatusEnum.CONFUSION.value
+_FLINCH = VolatileStatusEnum.FLINCH.value
+_LEECH_SEED = VolatileStatusEnum.LEECH_SEED.value
+
+
+def _until_removed(rng: anno.Optional[anno.CombatRNG]) -> int:
+    return -1
+
+
+def _no_duration(rng: anno.Optional[anno.CombatRNG]) -> int:
+    return 0
+
+
+def _sleep_duration(rng: anno.Optional[anno.CombatRNG]) -> int:
+    return (get_default_rng() if rng is None else rng).randint(1, 4)
+
+
+def _paralysis_before_move(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> int:
+    return CAN_MOVE if rng.uniform() < 0.25 else EVENT_PARALYZED
+
+
+def _burn_end_turn(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> None:
+    participant.damage(int(participant.creature.max_hp * 1/8))
+
+
+def _freeze_end_turn(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> None:
+    if rng.uniform() < 0.2:
+        participant.remove_status_non_volatile()
+
+
+def _poison_end_turn(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> None:
+    participant.damage(int(participant.creature.max_hp * 1/8))
+
+
+def _bad_poison_end_turn(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> None:
+    participant.damage(int(participant.creature.max_hp * participant.bpsn_counter / 16))
+    participant._set_bpsn_counter(participant.bpsn_counter + 1)
+
+
+# Non-volatile status handlers keyed by status, a status without an entry in the before move or end turn table has no effect at that point. The on apply
+# handlers return the duration of the status, -1 for statuses that last until removed
+NON_VOLATILE_ON_APPLY: anno.Dict[NonVolatileStatusEnum, anno.Callable[[anno.Optional[anno.CombatRNG]], int]] = {
+    NonVolatileStatusEnum.NONE: _no_duration,
+    NonVolatileStatusEnum.BRN: _until_removed,
+    NonVolatileStatusEnum.FRZ: _until_removed,
+    NonVolatileStatusEnum.PAR: _until_removed,
+    NonVolatileStatusEnum.PSN: _until_removed,
+    NonVolatileStatusEnum.BPSN: _until_removed,
+    NonVolatileStatusEnum.SLP: _sleep_duration,
+}
+NON_VOLATILE_BEFORE_MOVE: anno.Dict[NonVolatileStatusEnum, anno.StatusHandler] = {
+    NonVolatileStatusEnum.PAR: _paralysis_before_move,
+}
+NON_VOLATILE_END_TURN: anno.Dict[NonVolatileStatusEnum, anno.StatusHandler] = {
+    NonVolatileStatusEnum.BRN: _burn_end_turn,
+    NonVolatileStatusEnum.FRZ: _freeze_end_turn,
+    NonVolatileStatusEnum.PSN: _poison_end_turn,
+    NonVolatileStatusEnum.BPSN: _bad_poison_end_turn,
+}
+
+
+def _confusion_on_apply(participant: anno.Participant, rng: anno.CombatRNG) -> int:
+    return rng.randint(2, 6)
+
+
+def _no_counter(participant: anno.Participant, rng: anno.CombatRNG) -> int:
+    return 0
+
+
+def _confusion_before_move(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> int:
+    """Counts down the confusion turns, snapping out of it when they run out. While still confused the creature has a 1 in 3 chance to hurt itself with a
+    typeless 40 power physical attack against its own defense instead of moving.
+    """
+    turns = participant.volatile_counters[_CONFUSION] - 1
+    if turns <= 0:
+        participant._remove_volatile(_CONFUSION)
+        return CAN_MOVE
+    participant._set_volatile_counter(_CONFUSION, turns)
+    if rng.uniform() < 1/3:
+        participant.damage(int(((2 * participant.lvl) / 5 + 2) * 40 * (participant.p_atk / participant.p_def) / 50 + 2))
+        return EVENT_CONFUSED
+    return CAN_MOVE
+
+
+def _flinch_before_move(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> int:
+    return EVENT_FLINCHED
+
+
+def _flinch_end_turn(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> None:
+    participant._remove_volatile(_FLINCH)
+
+
+def _leech_seed_end_turn(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> None:
+    drained = min(int(participant.creature.max_hp * 1/8), participant.creature.current_hp)
+    participant.damage(drained)
+    if opponent is not None and opponent.is_alive:
+        opponent.heal(drained)
+
+
+def _volatile_table(handlers: anno.Dict[VolatileStatusEnum, anno.Callable]) -> anno.Tuple[anno.Tuple[anno.Optional[anno.Callable], ...], int]:
+    """Lays out volatile status handlers by bit index.
+
+    Args:
+        handlers (Dict[VolatileStatusEnum, Callable]): Handler of every volatile status that has one
+
+    Returns:
+        Tuple[Tuple[Optional[Callable], ...], int]: Handler or None for every bit index, and the bitmask of the statuses that have a handler
+    """
+    table = tuple(handlers.get(status, None) for status in VolatileStatusEnum)
+    mask = 0
+    for status in handlers:
+        mask |= 1 << status.value
+    return table, mask
+
+
+# Volatile status handlers indexed by bit index. The masks are used to only visit the statuses that are set and have a handler, so a status only costs
+# time while it is active. The on apply handlers return the initial value of the turn counter of the status
+VOLATILE_ON_APPLY, _ = _volatile_table({
+    VolatileStatusEnum.CONFUSION: _confusion_on_apply,
+    VolatileStatusEnum.FLINCH: _no_counter,
+    VolatileStatusEnum.LEECH_SEED: _no_counter,
+})
+VOLATILE_BEFORE_MOVE, VOLATILE_BEFORE_MOVE_MASK = _volatile_table({
+    VolatileStatusEnum.CONFUSION: _confusion_before_move,
+    VolatileStatusEnum.FLINCH: _flinch_before_move,
+})
+VOLATILE_END_TURN, VOLATILE_END_TURN_MASK = _volatile_table({
+    VolatileStatusEnum.FLINCH: _flinch_end_turn,
+    VolatileStatusEnum.LEECH_SEED: _leech_seed_end_turn,
+})
+
+
+def volatile_before_move(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> int:
+    """Runs the before move handlers of the volatile statuses of the participant in bit order, stopping at the first one that prevents the move.
+
+    Args:
+        participant (Participant): Participant about to move
+        opponent (Optional[Participant]): Participant it is battling
+        rng (CombatRNG): Random number source for the handlers
+
+    Returns:
+        int: CAN_MOVE, or the BattleEventEnum value of the status that prevented the move
+    """
+    mask = participant.volatile_statuses & VOLATILE_BEFORE_MOVE_MASK
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        event = VOLATILE_BEFORE_MOVE[bit.bit_length() - 1](participant, opponent, rng)
+        if event != CAN_MOVE:
+            return event
+    return CAN_MOVE
+
+
+def volatile_end_turn(participant: anno.Participant, opponent: anno.Optional[anno.Participant], rng: anno.CombatRNG) -> None:
+    """Runs the end turn handlers of the volatile statuses of the participant in bit order.
+
+    Args:
+        participant (Participant): Participant at the end of the turn
+        opponent (Optional[Participant]): Participant it is battling
+        rng (CombatRNG): Random number source for the handlers
+    """
+    mask = participant.volatile_statuses & VOLATILE_END_TURN_MASK
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        VOLATILE_END_TURN[bit.bit_length() - 1](participant, opponent, rng)
@@ -0,0 +1,12 @@
+from creature_combat.utils.extended_enums import ExtendedEnum
+
+
+class VolatileStatusEnum(ExtendedEnum):
+    # Values are bit indices into Participant.volatile_statuses
+    CONFUSION:int=0
+    FLINCH:int=1
+    LEECH_SEED:int=2
+
+
+# Number of volatile statuses, Participant keeps one turn counter per status
+VOLATILE_STATUS_COUNT = len(VolatileStatusEnum)
@@ -3,20 +3,28 @@ import typing
 if typing.TYPE_CHECKING:
     # Package Imports
     from numpy import ndarray
+    from numpy.typing import ArrayLike
+    from numpy.random import Generator, SeedSequence
     from pathlib import Path
     from typing import *
     from typing_extensions import Self
     
     # Creature Imports
+    from creature_combat.creature.build_cache import CreatureBuildCache
     from creature_combat.creature.creature import Creature
     from creature_combat.creature.creature_base_stats import CreatureBaseStats
     from creature_combat.creature.creature_natures import CreatureNatureEnum
+    from creature_combat.creature.creature_stats import CreatureStats
     from creature_combat.creature.creature_types import CreatureTypeEnum
     from creature_combat.creature.creaturedex import CreatureDex, CreatureEntry
     from creature_combat.creature.effort_values import EffortValues
     from creature_combat.creature.individual_values import IndividualValues
     
     # Engine Imports
+    from creature_combat.engine.batch_combat_manager import BatchCombatManager
+    from creature_combat.engine.battle_events import EventSink
+    from creature_combat.engine.battle_state import BattleState
+    from creature_combat.engine.combat_hooks import CombatHookEnum, HookRecord
     from creature_combat.engine.combat_manager import CombatManager
     from creature_combat.engine.participant import Participant
     from creature_combat.engine.player import Player
@@ -30,12 +38,21 @@ if typing.TYPE_CHECKING:
     
     # Statuses Imports
     from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+    from creature_combat.statuses.volatile_statuses import VolatileStatusEnum
     
     # Utils Imports
+    from creature_combat.utils.data_pack import DataPack
     from creature_combat.utils.extended_enums import ExtendedEnum
+    from creature_combat.utils.rng import CombatRNG
     
     # Project Composite annotations
     Config = Dict[str, Any]
     Moves = Tuple[Move,Optional[Move],Optional[Move],Optional[Move]]
     Creatures = List[Creature]
-    Team = Dict[str, Creature]
\ No newline at end of file
+    Team = Dict[str, Creature]
+    Effect = Tuple[int, int, int]
+    EffectProgram = Tuple[Effect, ...]
+    # Status handler called with the participant, its opponent and the RNG
+    StatusHandler = Callable[[Participant, Optional[Participant], CombatRNG], Any]
+    # Combat hook called with the preallocated record of the event
+    HookCallback = Callable[[HookRecord], Any]
\ No newline at end of file
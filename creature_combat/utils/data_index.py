@@ -0,0 +1,54 @@
+from __future__ import annotations
+from json import dump, load
+from os import listdir
+
+from creature_combat.utils import annotations as anno
+
+# Name of the optional index file of a data directory, mapping every entry name to the file it is defined in
+DATA_INDEX_FILE = "index.json"
+
+
+def build_data_index(data_path: anno.Path) -> anno.Dict[str, str]:
+    """Lists the entry files of a data directory without parsing them. Every json file other than example.json and the index file is an entry, named by
+    its file name without the extension.
+
+    Args:
+        data_path (Path): Path to the data directory, i.e. creaturedex_data or move_data
+
+    Returns:
+        Dict[str, str]: Mapping of entry names to their file names
+    """
+    files = [f for f in listdir(str(data_path)) if f.split('.')[0] != 'example' and f.split('.')[-1] == 'json' and f != DATA_INDEX_FILE]
+    return {f.split('.')[0]: f for f in sorted(files)}
+
+
+def read_data_index(data_path: anno.Path) -> anno.Dict[str, str]:
+    """Reads the index file of a data directory if it has one, otherwise builds the index from the directory listing.
+
+    Args:
+        data_path (Path): Path to the data directory
+
+    Returns:
+        Dict[str, str]: Mapping of entry names to their file names
+    """
+    index_path = data_path / DATA_INDEX_FILE
+    if not index_path.exists():
+        return build_data_index(data_path)
+    with open(index_path, 'r') as infile:
+        return load(infile)
+
+
+def write_data_index(data_path: anno.Path) -> anno.Dict[str, str]:
+    """Builds the index of a data directory and writes it to the index file, so later loads read one small file instead of listing the directory. The
+    index must be rewritten whenever entry files are added, removed or renamed.
+
+    Args:
+        data_path (Path): Path to the data directory
+
+    Returns:
+        Dict[str, str]: Mapping of entry names to their file names
+    """
+    index = build_data_index(data_path)
+    with open(data_path / DATA_INDEX_FILE, 'w') as outfile:
+        dump(index, outfile, indent=4)
+    return index
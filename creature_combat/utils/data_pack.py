@@ -0,0 +1,258 @@
+from __future__ import annotations
+import os
+from hashlib import blake2b
+from json import load
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+
+from numpy import dtype, frombuffer
+
+from creature_combat.creature.creature_types import CreatureTypeEnum
+from creature_combat.moves.move_types import MoveTypeEnum
+from creature_combat.utils import annotations as anno
+from creature_combat.utils.data_index import build_data_index
+
+# Format version of the pack, packs written with a different version are rebuilt
+PACK_VERSION = 1
+_MAGIC = b"CCPK"
+# magic, version, source fingerprint, number of creatures, number of moves, size of the string table
+_HEADER = Struct("<4sIQIII")
+# Records start after the header padded to 64 bytes
+_HEADER_SIZE = 64
+
+# Strings are stored in the string table as utf-8 and referenced by (offset, length). Effect lists are joined with newlines.
+CREATURE_RECORD = dtype([('key', '<u4', (2,)), ('name', '<u4', (2,)), ('base_stats', 'u1', (6,)), ('elements', 'i1', (2,))])
+MOVE_RECORD = dtype([('key', '<u4', (2,)), ('name', '<u4', (2,)), ('power', '<i2'), ('accuracy', '<i2'), ('max_pp', '<i2'), ('priority', 'i1'),
+                     ('move_type', 'i1'), ('element', 'i1'), ('high_crit', 'u1'), ('self_effect', '<u4', (2,)), ('opponent_effect', '<u4', (2,)),
+                     ('environment_effect', '<u4', (2,))])
+_BASE_STAT_NAMES = ('health_points', 'physical_attack', 'physical_defense', 'special_attack', 'special_defense', 'speed')
+
+
+def source_fingerprint(creaturedex_path: anno.Path, move_list_path: anno.Path) -> int:
+    """Fingerprints the source JSON files of a pack by their names, sizes and modification times, without reading them.
+
+    Args:
+        creaturedex_path (Path): Path to the creature data directory
+        move_list_path (Path): Path to the move data directory
+
+    Returns:
+        int: 64 bit fingerprint that changes when a source file is added, removed or modified
+    """
+    digest = blake2b(digest_size=8)
+    digest.update(PACK_VERSION.to_bytes(4, 'little'))
+    for data_path in (creaturedex_path, move_list_path):
+        for key, file_name in build_data_index(data_path).items():
+            stat = os.stat(data_path / file_name)
+            digest.update(f"{key}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        digest.update(b"\1")
+    return int.from_bytes(digest.digest(), 'little')
+
+
+class _StringTable:
+    """Accumulates the strings of a pack being built."""
+    def __init__(self):
+        self.data = bytearray()
+
+    def add(self, value: str) -> anno.Tuple[int, int]:
+        encoded = value.encode()
+        offset = len(self.data)
+        self.data += encoded
+        return offset, len(encoded)
+
+
+def build_data_pack(creaturedex_path: anno.Path, move_list_path: anno.Path, pack_path: anno.Path) -> None:
+    """Compiles the creature and move JSON files into a single binary pack: a header, one fixed width record per creature and per move in sorted name
+    order, and a string table. The pack is written to a temporary file and moved into place, so processes opening it never see a partial pack.
+
+    Args:
+        creaturedex_path (Path): Path to the creature data directory
+        move_list_path (Path): Path to the move data directory
+        pack_path (Path): Path to write the pack to
+    """
+    fingerprint = source_fingerprint(creaturedex_path, move_list_path)
+    strings = _StringTable()
+    creature_index = build_data_index(creaturedex_path)
+    creatures = bytearray(CREATURE_RECORD.itemsize * len(creature_index))
+    creature_records = frombuffer(creatures, dtype=CREATURE_RECORD)
+    for n, (key, file_name) in enumerate(sorted(creature_index.items())):
+        with open(creaturedex_path / file_name, 'r') as infile:
+            config = load(infile)
+        record = creature_records[n]
+        record['key'] = strings.add(key)
+        record['name'] = strings.add(config['name'])
+        record['base_stats'] = [config['base_stats'][stat_name] for stat_name in _BASE_STAT_NAMES]
+        elements = list(config['elements']) + [None] * (2 - len(config['elements']))
+        record['elements'] = [-1 if element is None else CreatureTypeEnum[element].value for element in elements]
+    move_index = build_data_index(move_list_path)
+    moves = bytearray(MOVE_RECORD.itemsize * len(move_index))
+    move_records = frombuffer(moves, dtype=MOVE_RECORD)
+    for n, (key, file_name) in enumerate(sorted(move_index.items())):
+        with open(move_list_path / file_name, 'r') as infile:
+            config = load(infile)
+        record = move_records[n]
+        record['key'] = strings.add(key)
+        record['name'] = strings.add(config['name'])
+        record['power'] = -1 if config['power'] is None else config['power']
+        record['accuracy'] = -1 if config['accuracy'] is None else config['accuracy']
+        record['max_pp'] = config['max_pp']
+        record['priority'] = config.get('priority', 0)
+        record['move_type'] = MoveTypeEnum.init_from_key_or_value(config['move_type']).value
+        record['element'] = CreatureTypeEnum.init_from_key_or_value(config['element']).value
+        record['high_crit'] = config['high_crit_flag']
+        for field in ('self_effect', 'opponent_effect', 'environment_effect'):
+            record[field] = strings.add("\n".join(config.get(field, [])))
+    header = _HEADER.pack(_MAGIC, PACK_VERSION, fingerprint, len(creature_index), len(move_index), len(strings.data))
+    temporary_path = pack_path.with_name(f"{pack_path.name}.{os.getpid()}.tmp")
+    with open(temporary_path, 'wb') as outfile:
+        outfile.write(header.ljust(_HEADER_SIZE, b"\0"))
+        outfile.write(creatures)
+        outfile.write(moves)
+        outfile.write(strings.data)
+    os.replace(temporary_path, pack_path)
+
+
+class DataPack:
+    """Read only view of a binary data pack. The file is mapped once with mmap and the record arrays are NumPy views into the mapping, so processes that
+    open the same pack share its pages through the page cache. Entries are decoded into the same config dictionaries the JSON files hold, so
+    CreatureDex and MoveList build and validate them exactly as they would from JSON.
+    """
+    def __init__(self, pack_path: anno.Path):
+        self.path = pack_path
+        with open(pack_path, 'rb') as infile:
+            self._buffer = mmap(infile.fileno(), 0, access=ACCESS_READ)
+        try:
+            if len(self._buffer) < _HEADER_SIZE:
+                raise ValueError(f"{pack_path} is too short to be a creature combat data pack.")
+            magic, self.version, self.fingerprint, n_creatures, n_moves, string_size = _HEADER.unpack_from(self._buffer, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"{pack_path} is not a creature combat data pack.")
+            offset = _HEADER_SIZE
+            self.creatures: anno.ndarray = frombuffer(self._buffer, dtype=CREATURE_RECORD, count=n_creatures, offset=offset)
+            offset += CREATURE_RECORD.itemsize * n_creatures
+            self.moves: anno.ndarray = frombuffer(self._buffer, dtype=MOVE_RECORD, count=n_moves, offset=offset)
+            self._strings_offset = offset + MOVE_RECORD.itemsize * n_moves
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Unmaps the pack. The record arrays are views into the mapping, so they are dropped first and the pack can not be read afterwards.
+        """
+        self.creatures = None
+        self.moves = None
+        self._buffer.close()
+
+    def __reduce__(self):
+        # Memory maps can not be pickled, other processes map the pack again instead
+        return (DataPack, (self.path,))
+
+    def _string(self, reference: anno.ndarray) -> str:
+        """Reads a string from the string table.
+
+        Args:
+            reference (ndarray): (offset, length) of the string
+
+        Returns:
+            str: The string
+        """
+        start = self._strings_offset + int(reference[0])
+        return self._buffer[start:start + int(reference[1])].decode()
+
+    def _effects(self, reference: anno.ndarray) -> anno.List[str]:
+        """Reads an effect list from the string table.
+
+        Args:
+            reference (ndarray): (offset, length) of the newline joined effects
+
+        Returns:
+            List[str]: The effect strings
+        """
+        effects = self._string(reference)
+        return effects.split("\n") if effects else []
+
+    def creature_keys(self) -> anno.List[str]:
+        """Names of the creatures in the pack, in record order.
+
+        Returns:
+            List[str]: Name of the file each creature was compiled from, without the extension
+        """
+        return [self._string(key) for key in self.creatures['key']]
+
+    def move_keys(self) -> anno.List[str]:
+        """Names of the moves in the pack, in record order.
+
+        Returns:
+            List[str]: Name of the file each move was compiled from, without the extension
+        """
+        return [self._string(key) for key in self.moves['key']]
+
+    def creature_config(self, record_id: int) -> anno.Config:
+        """Decodes a creature record into the config dictionary of its JSON file.
+
+        Args:
+            record_id (int): Index of the creature record
+
+        Returns:
+            Config: Config accepted by CreatureEntry.from_dict
+        """
+        record = self.creatures[record_id]
+        return {'name': self._string(record['name']),
+                'elements': [None if element == -1 else CreatureTypeEnum(int(element)).name for element in record['elements']],
+                'base_stats': {stat_name: int(value) for stat_name, value in zip(_BASE_STAT_NAMES, record['base_stats'])}}
+
+    def move_config(self, record_id: int) -> anno.Config:
+        """Decodes a move record into the config dictionary of its JSON file.
+
+        Args:
+            record_id (int): Index of the move record
+
+        Returns:
+            Config: Config accepted by Move.from_dict
+        """
+        record = self.moves[record_id]
+        return {'name': self._string(record['name']),
+                'move_type': int(record['move_type']),
+                'element': int(record['element']),
+                'power': None if record['power'] == -1 else int(record['power']),
+                'accuracy': None if record['accuracy'] == -1 else int(record['accuracy']),
+                'high_crit_flag': bool(record['high_crit']),
+                'max_pp': int(record['max_pp']),
+                'priority': int(record['priority']),
+                'self_effect': self._effects(record['self_effect']),
+                'opponent_effect': self._effects(record['opponent_effect']),
+                'environment_effect': self._effects(record['environment_effect'])}
+
+
+def open_data_pack(creaturedex_path: anno.Path, move_list_path: anno.Path, pack_path: anno.Path) -> DataPack:
+    """Opens the data pack at pack_path, first rebuilding it if it is missing, was written by another format version, or is stale compared with the
+    source JSON files.
+
+    Args:
+        creaturedex_path (Path): Path to the creature data directory
+        move_list_path (Path): Path to the move data directory
+        pack_path (Path): Path of the pack
+
+    Returns:
+        DataPack: The opened pack
+    """
+    fingerprint = source_fingerprint(creaturedex_path, move_list_path)
+    if pack_path.exists():
+        try:
+            pack = DataPack(pack_path)
+        except ValueError:
+            # Empty, too short, not a pack, or truncated by a different format version
+            pack = None
+        if pack is not None:
+            if pack.version == PACK_VERSION and pack.fingerprint == fingerprint:
+                return pack
+            pack.close()
+    build_data_pack(creaturedex_path, move_list_path, pack_path)
+    return DataPack(pack_path)
+
+
+if __name__ == "__main__":
+    # Build step: python -m creature_combat.utils.data_pack [pack_path]
+    import sys
+    from pathlib import Path
+    from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _DATA_PACK_PATH, _MOVE_LIST_PATH
+    build_data_pack(_CREATUREDEX_PATH, _MOVE_LIST_PATH, Path(sys.argv[1]) if len(sys.argv) > 1 else _DATA_PACK_PATH)
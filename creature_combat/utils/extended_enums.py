@@ -1,10 +1,12 @@
+from __future__ import annotations
 from enum import Enum
-from typing import Union
-from typing_extensions import Self
+
+from creature_combat.utils import annotations as anno
+
 
 class ExtendedEnum(Enum):
     @classmethod
-    def init_from_key_or_value(cls, init_object: Union[str, int]) -> Self:
+    def init_from_key_or_value(cls, init_object: anno.Union[str, int]) -> anno.Self:
         if isinstance(init_object, str):
             return cls[init_object]
         elif isinstance(init_object, int):
@@ -1,57 +1,90 @@
-from numpy import array
-
-
 # ROWS: Element of the attack, [0-17] as defined by the CreatureTypeEnum
 # COLS: Element of the receiving creature, [0, 17] as defined by the CreatureTypeEnum
-# MAP[ROW, COL] => The modifier applied to the damage calculation for an attack by ROW_ELEMENT on COL_ELEMENT 
-DAMAGE_MAP = array([
-    [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5, 0.0, 1.0, 1.0, 0.5, 1.0],
-    [1.0, 0.5, 0.5, 1.0, 2.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 0.5, 1.0, 0.5, 1.0, 2.0, 1.0],
-    [1.0, 2.0, 0.5, 1.0, 0.5, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0, 1.0, 1.0],
-    [1.0, 1.0, 2.0, 0.5, 0.5, 1.0, 1.0, 1.0, 0.0, 2.0, 1.0, 1.0, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0],
-    [1.0, 0.5, 2.0, 1.0, 0.5, 1.0, 1.0, 0.5, 2.0, 0.5, 1.0, 0.5, 2.0, 1.0, 0.5, 1.0, 0.5, 1.0],
-    [1.0, 0.5, 0.5, 1.0, 2.0, 0.5, 1.0, 1.0, 2.0, 2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0],
-    [2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0, 0.5, 0.5, 0.5, 2.0, 0.0, 1.0, 2.0, 2.0, 0.5],
-    [1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 0.5, 0.5, 1.0, 1.0, 1.0, 0.5, 0.5, 1.0, 1.0, 0.0, 2.0],
-    [1.0, 2.0, 1.0, 2.0, 0.5, 1.0, 1.0, 2.0, 1.0, 0.0, 1.0, 0.5, 2.0, 1.0, 1.0, 1.0, 2.0, 1.0],
-    [1.0, 1.0, 1.0, 0.5, 2.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 0.5, 1.0, 1.0, 1.0, 0.5, 1.0],
-    [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0, 1.0, 0.0, 0.5, 1.0],
-    [1.0, 0.5, 1.0, 1.0, 2.0, 1.0, 0.5, 0.5, 1.0, 0.5, 2.0, 1.0, 1.0, 0.5, 1.0, 2.0, 0.5, 0.5],
-    [1.0, 2.0, 1.0, 1.0, 1.0, 2.0, 0.5, 1.0, 0.5, 2.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 0.5, 1.0],
-    [0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0, 1.0],
-    [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 0.5, 0.0],
-    [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0, 0.5],
-    [1.0, 0.5, 0.5, 0.5, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 0.5, 2.0],
-    [1.0, 0.5, 1.0, 1.0, 1.0, 1.0, 2.0, 0.5, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 0.5, 1.0]
-])
+# TABLE[ROW][COL] => The modifier applied to the damage calculation for an attack by ROW_ELEMENT on COL_ELEMENT
+# Stored as plain python tuples so the scalar engine does not need NumPy, DAMAGE_MAP is the same table as an array, see __getattr__
+DAMAGE_TABLE = (
+    (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5, 0.0, 1.0, 1.0, 0.5, 1.0),
+    (1.0, 0.5, 0.5, 1.0, 2.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 0.5, 1.0, 0.5, 1.0, 2.0, 1.0),
+    (1.0, 2.0, 0.5, 1.0, 0.5, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0, 1.0, 1.0),
+    (1.0, 1.0, 2.0, 0.5, 0.5, 1.0, 1.0, 1.0, 0.0, 2.0, 1.0, 1.0, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0),
+    (1.0, 0.5, 2.0, 1.0, 0.5, 1.0, 1.0, 0.5, 2.0, 0.5, 1.0, 0.5, 2.0, 1.0, 0.5, 1.0, 0.5, 1.0),
+    (1.0, 0.5, 0.5, 1.0, 2.0, 0.5, 1.0, 1.0, 2.0, 2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0),
+    (2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0, 0.5, 0.5, 0.5, 2.0, 0.0, 1.0, 2.0, 2.0, 0.5),
+    (1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 0.5, 0.5, 1.0, 1.0, 1.0, 0.5, 0.5, 1.0, 1.0, 0.0, 2.0),
+    (1.0, 2.0, 1.0, 2.0, 0.5, 1.0, 1.0, 2.0, 1.0, 0.0, 1.0, 0.5, 2.0, 1.0, 1.0, 1.0, 2.0, 1.0),
+    (1.0, 1.0, 1.0, 0.5, 2.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 0.5, 1.0, 1.0, 1.0, 0.5, 1.0),
+    (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0, 1.0, 0.0, 0.5, 1.0),
+    (1.0, 0.5, 1.0, 1.0, 2.0, 1.0, 0.5, 0.5, 1.0, 0.5, 2.0, 1.0, 1.0, 0.5, 1.0, 2.0, 0.5, 0.5),
+    (1.0, 2.0, 1.0, 1.0, 1.0, 2.0, 0.5, 1.0, 0.5, 2.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 0.5, 1.0),
+    (0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0, 1.0),
+    (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 0.5, 0.0),
+    (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 2.0, 1.0, 0.5, 1.0, 0.5),
+    (1.0, 0.5, 0.5, 0.5, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 0.5, 2.0),
+    (1.0, 0.5, 1.0, 1.0, 1.0, 1.0, 2.0, 0.5, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 0.5, 1.0)
+)
+
+
+# Precomputed modifier for every attacking element against every defending type pair, stored as plain python floats.
+# MAP[ATTACK][TYPE_1][TYPE_2] => The modifier applied to the damage calculation for an attack by ATTACK on a creature of types TYPE_1 and TYPE_2. Single
+# type creatures use the diagonal, TYPE_1 == TYPE_2, which holds the single type modifier.
+TYPE_PAIR_DAMAGE_MAP = tuple(
+    tuple(
+        tuple(DAMAGE_TABLE[attack][type_1] if type_1 == type_2 else DAMAGE_TABLE[attack][type_1] * DAMAGE_TABLE[attack][type_2] for type_2 in range(18))
+        for type_1 in range(18))
+    for attack in range(18))
 
+# MAP[TYPE_1][TYPE_2][ATTACK] => Same values as TYPE_PAIR_DAMAGE_MAP, laid out so the row for a defending type pair can be looked up once on switch in
+DEFENSIVE_TYPE_MODIFIERS = tuple(
+    tuple(tuple(TYPE_PAIR_DAMAGE_MAP[attack][type_1][type_2] for attack in range(18)) for type_2 in range(18))
+    for type_1 in range(18))
+
+
+# Multipliers for stat stages [-6, 6], indexed by stage + 6. Follows the equation for GEN2+: max(2, 2+stage)/max(2,2-stage) as described here:
+# https://www.dragonflycave.com/mechanics/stat-stages
+STAGE_MULTIPLIERS = tuple((2 + stage) / 2 if stage >= 0 else 2 / (2 - stage) for stage in range(-6, 7))
 
 # ELement of the list corresponds to the Nature of the creature as defined by the CreatureNatureEnum
-# The array contains the modifiers for each stat based on the nature 
+# The tuple contains the modifiers for each stat based on the nature 
 NATURE_MODIFIER = [
-    array([0.1, 0.0, -0.1, 0.0, 0.0]), #Adamant 
-    array([0.0, 0.0, 0.0, 0.0, 0.0]), #Bashful
-    array([-0.1, 0.1, 0.0, 0.0, 0.0]), #Bold
-    array([0.1, 0.0, 0.0, 0.0, -0.1]), #Brave
-    array([-0.1, 0.0, 0.0, 0.1, 0.0]), #Calm
-    array([0.0, 0.0, -0.1, 0.1, 0.0]), #Careful
-    array([0.0, 0.0, 0.0, 0.0, 0.0]), #Docile
-    array([0.0, -0.1, 0.0, 0.1, 0.0]), #Gentile
-    array([0.0, 0.0, 0.0, 0.0, 0.0]), #Hardy
-    array([0.0, -0.1, 0.0, 0.0, 0.1]), #Hasty
-    array([0.0, 0.1, -0.1, 0.0, 0.0]), #Impish
-    array([0.0, 0.0, -0.1, 0.0, 0.1]), #Jolly
-    array([0.0, 0.1, 0.0, -0.1, 0.0]), #Lax
-    array([0.1, -0.1, 0.0, 0.0, 0.0]), #Lonely
-    array([0.0, -0.1, 0.1, 0.0, 0.0]), #Mild
-    array([-0.1, 0.0, 0.1, 0.0, 0.0]), #Modest
-    array([0.0, 0.0, 0.0, -0.1, 0.1]), #Naive
-    array([0.1, 0.0, 0.0, -0.1, 0.0]), #Naughty
-    array([0.0, 0.0, 1.0, 0.0, -0.1]), #Quiet
-    array([0.0, 0.0, 0.0, 0.0, 0.0]), #Quirky
-    array([0.0, 0.0, 0.1, -0.1, 0.0]), #Rash
-    array([0.0, 0.1, 0.0, 0.0, -0.1]), #Relaxed
-    array([0.0, 0.0, 0.0, 0.1, -0.1]), #Sassy
-    array([0.0, 0.0, 0.0, 0.0, 0.0]), #Serious
-    array([-0.1, 0.0, 0.0, 0.0, 0.1]) #Timid
+    (0.1, 0.0, -0.1, 0.0, 0.0), #Adamant 
+    (0.0, 0.0, 0.0, 0.0, 0.0), #Bashful
+    (-0.1, 0.1, 0.0, 0.0, 0.0), #Bold
+    (0.1, 0.0, 0.0, 0.0, -0.1), #Brave
+    (-0.1, 0.0, 0.0, 0.1, 0.0), #Calm
+    (0.0, 0.0, -0.1, 0.1, 0.0), #Careful
+    (0.0, 0.0, 0.0, 0.0, 0.0), #Docile
+    (0.0, -0.1, 0.0, 0.1, 0.0), #Gentile
+    (0.0, 0.0, 0.0, 0.0, 0.0), #Hardy
+    (0.0, -0.1, 0.0, 0.0, 0.1), #Hasty
+    (0.0, 0.1, -0.1, 0.0, 0.0), #Impish
+    (0.0, 0.0, -0.1, 0.0, 0.1), #Jolly
+    (0.0, 0.1, 0.0, -0.1, 0.0), #Lax
+    (0.1, -0.1, 0.0, 0.0, 0.0), #Lonely
+    (0.0, -0.1, 0.1, 0.0, 0.0), #Mild
+    (-0.1, 0.0, 0.1, 0.0, 0.0), #Modest
+    (0.0, 0.0, 0.0, -0.1, 0.1), #Naive
+    (0.1, 0.0, 0.0, -0.1, 0.0), #Naughty
+    (0.0, 0.0, 1.0, 0.0, -0.1), #Quiet
+    (0.0, 0.0, 0.0, 0.0, 0.0), #Quirky
+    (0.0, 0.0, 0.1, -0.1, 0.0), #Rash
+    (0.0, 0.1, 0.0, 0.0, -0.1), #Relaxed
+    (0.0, 0.0, 0.0, 0.1, -0.1), #Sassy
+    (0.0, 0.0, 0.0, 0.0, 0.0), #Serious
+    (-0.1, 0.0, 0.0, 0.0, 0.1) #Timid
 ]
+
+
+def __getattr__(name: str):
+    """Builds the NumPy versions of the damage tables on first access, so importing the mappings does not import NumPy. Only the vectorized engine uses
+    them: DAMAGE_MAP[ROW, COL] holds DAMAGE_TABLE and TYPE_PAIR_DAMAGE_ARRAY[ATTACK, TYPE_1, TYPE_2] holds TYPE_PAIR_DAMAGE_MAP.
+    """
+    if name == 'DAMAGE_MAP':
+        from numpy import array
+        value = array(DAMAGE_TABLE)
+    elif name == 'TYPE_PAIR_DAMAGE_ARRAY':
+        from numpy import array
+        value = array(TYPE_PAIR_DAMAGE_MAP)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
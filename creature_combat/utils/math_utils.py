@@ -1,4 +1,6 @@
 from __future__ import annotations
+from math import exp, lgamma, log, log1p, sqrt
+
 from creature_combat.utils import annotations as anno
 
 
@@ -13,4 +15,132 @@ def clip(value: anno.Union[float, int], min_val: anno.Union[float, int], max_val
     Returns:
         Union[float, int]: Clipped value
     """
-    return max(min_val, min(value, max_val))
\ No newline at end of file
+    return max(min_val, min(value, max_val))
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    """Evaluates the continued fraction of the regularized incomplete beta function with the modified Lentz method.
+
+    Args:
+        a (float): First shape parameter
+        b (float): Second shape parameter
+        x (float): Point on the interval [0, 1] to evaluate at
+
+    Returns:
+        float: Value of the continued fraction
+    """
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 1000):
+        # Even step of the recurrence
+        numerator = m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m))
+        d = 1.0 + numerator * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + numerator / c
+        c = c if abs(c) > tiny else tiny
+        result *= d * c
+        # Odd step of the recurrence
+        numerator = -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))
+        d = 1.0 + numerator * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + numerator / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        result *= delta
+        if abs(delta - 1.0) < 1e-14:
+            break
+    return result
+
+
+def regularized_incomplete_beta(a: float, b: float, x: float) -> float:
+    """Computes the regularized incomplete beta function I_x(a, b), the CDF of a Beta(a, b) distribution at x.
+
+    Args:
+        a (float): First shape parameter, must be positive
+        b (float): Second shape parameter, must be positive
+        x (float): Point to evaluate at, clipped to [0, 1]
+
+    Returns:
+        float: P(X <= x) for X ~ Beta(a, b)
+    """
+    assert a > 0 and b > 0, f"Beta shape parameters must be positive, provided a={a} and b={b}"
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = lgamma(a + b) - lgamma(a) - lgamma(b) + a * log(x) + b * log1p(-x)
+    # The continued fraction converges quickly on this side of the mean, use the symmetry I_x(a, b) = 1 - I_(1-x)(b, a) otherwise
+    if x < (a + 1.0) / (a + b + 2.0):
+        return exp(log_front) * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - exp(log_front) * _beta_continued_fraction(b, a, 1.0 - x) / b
+
+
+def beta_quantile(q: float, a: float, b: float, tolerance: float=1e-10) -> float:
+    """Finds the q quantile of a Beta(a, b) distribution by bisecting the regularized incomplete beta function.
+
+    Args:
+        q (float): Quantile on the interval [0, 1]
+        a (float): First shape parameter, must be positive
+        b (float): Second shape parameter, must be positive
+        tolerance (float, optional): Width of the bracket to stop the bisection at. Defaults to 1e-10.
+
+    Returns:
+        float: x such that P(X <= x) = q for X ~ Beta(a, b)
+    """
+    assert 0.0 <= q <= 1.0, f"Quantile must be on the interval [0, 1], provided {q}"
+    low, high = 0.0, 1.0
+    while high - low > tolerance:
+        middle = 0.5 * (low + high)
+        if regularized_incomplete_beta(a, b, middle) < q:
+            low = middle
+        else:
+            high = middle
+    return 0.5 * (low + high)
+
+
+def wilson_interval(successes: int, trials: int, confidence: float=0.95) -> anno.Tuple[float, float]:
+    """Computes the Wilson score interval of a binomial proportion. Unlike the normal approximation it stays inside [0, 1] and keeps a sensible width
+    when every trial succeeded or failed.
+
+    Args:
+        successes (int): Number of successful trials
+        trials (int): Number of trials
+        confidence (float, optional): Confidence level of the interval. Defaults to 0.95.
+
+    Returns:
+        Tuple[float, float]: Lower and upper bound of the interval, (0, 1) when there are no trials
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    # statistics is only needed by the win probability estimates, so it is not imported with the rest of the engine
+    from statistics import NormalDist
+    z = NormalDist().inv_cdf(0.5 + 0.5 * confidence)
+    proportion = successes / trials
+    denominator = 1.0 + z * z / trials
+    center = (proportion + z * z / (2 * trials)) / denominator
+    margin = z * sqrt(proportion * (1.0 - proportion) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def beta_interval(successes: int, trials: int, confidence: float=0.95, prior: anno.Tuple[float, float]=(1.0, 1.0)) -> anno.Tuple[float, float]:
+    """Computes the equal tailed credible interval of a binomial proportion under a Beta prior. As in the Jeffreys interval, the bound is set to 0 when
+    there are no successes and to 1 when every trial succeeded, so the interval always contains the observed proportion.
+
+    Args:
+        successes (int): Number of successful trials
+        trials (int): Number of trials
+        confidence (float, optional): Probability mass inside the interval. Defaults to 0.95.
+        prior (Tuple[float, float], optional): Shape parameters of the Beta prior. Defaults to the uniform prior (1.0, 1.0).
+
+    Returns:
+        Tuple[float, float]: Lower and upper bound of the interval
+    """
+    a = prior[0] + successes
+    b = prior[1] + trials - successes
+    tail = 0.5 * (1.0 - confidence)
+    lower = 0.0 if successes == 0 else beta_quantile(tail, a, b)
+    upper = 1.0 if successes == trials else beta_quantile(1.0 - tail, a, b)
+    return lower, upper
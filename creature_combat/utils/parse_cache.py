@@ -0,0 +1,85 @@
+from __future__ import annotations
+import os
+import pickle
+
+from creature_combat.utils import annotations as anno
+
+# Format version of the cache file, caches written with a different version are discarded
+CACHE_VERSION = 1
+
+
+def _content_hash(content: bytes) -> bytes:
+    """Hashes the contents of a data file.
+
+    Args:
+        content (bytes): Contents of the file
+
+    Returns:
+        bytes: 128 bit digest of the contents
+    """
+    from hashlib import blake2b
+    return blake2b(content, digest_size=16).digest()
+
+
+def _read_cache(cache_path: anno.Path) -> anno.Dict[str, anno.Tuple[int, int, bytes, anno.Any]]:
+    """Reads the entries of a cache file, returning no entries if it is missing, unreadable or from another version.
+
+    Args:
+        cache_path (Path): Path to the cache file
+
+    Returns:
+        Dict[str, Tuple[int, int, bytes, Any]]: (mtime, size, content hash, parsed object) by file name
+    """
+    try:
+        with open(cache_path, 'rb') as infile:
+            version, entries = pickle.load(infile)
+    except Exception:
+        return {}
+    return entries if version == CACHE_VERSION else {}
+
+
+def load_cached(data_path: anno.Path, index: anno.Dict[str, str], parse: anno.Callable[[bytes], anno.Any], cache_path: anno.Path) -> anno.Dict[str, anno.Any]:
+    """Loads every file of a data directory index through an on-disk cache of the parsed objects. A cached object is reused when its file has the same
+    modification time and size as when it was parsed, or otherwise when the file contents hash to the same value. The remaining files are parsed in a
+    thread pool and the cache is rewritten if anything changed. The cache is a pickle file, so only point cache_path at files this process wrote.
+
+    Args:
+        data_path (Path): Path to the data directory
+        index (Dict[str, str]): Mapping of entry names to their file names, i.e. from read_data_index
+        parse (Callable[[bytes], Any]): Builds the object of an entry from the contents of its file
+        cache_path (Path): Path to the cache file, created if it does not exist
+
+    Returns:
+        Dict[str, Any]: Parsed object of every entry by name
+    """
+    cached = _read_cache(cache_path)
+    entries: anno.Dict[str, anno.Tuple[int, int, bytes, anno.Any]] = {}
+    stale: anno.List[anno.Tuple[str, int, int, bytes, bytes]] = []
+    changed = len(cached) != len(index)
+    for file_name in index.values():
+        stat = os.stat(data_path / file_name)
+        entry = cached.get(file_name, None)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            entries[file_name] = entry
+            continue
+        changed = True
+        with open(data_path / file_name, 'rb') as infile:
+            content = infile.read()
+        content_hash = _content_hash(content)
+        if entry is not None and entry[2] == content_hash:
+            entries[file_name] = (stat.st_mtime_ns, stat.st_size, content_hash, entry[3])
+        else:
+            stale.append((file_name, stat.st_mtime_ns, stat.st_size, content_hash, content))
+    if len(stale) > 0:
+        # Only imported when there is something to parse, a warm cache does not pay for it
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor() as executor:
+            parsed = list(executor.map(parse, [content for _, _, _, _, content in stale]))
+        for (file_name, mtime, size, content_hash, _), value in zip(stale, parsed):
+            entries[file_name] = (mtime, size, content_hash, value)
+    if changed:
+        temporary_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(temporary_path, 'wb') as outfile:
+            pickle.dump((CACHE_VERSION, entries), outfile, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    return {name: entries[file_name][3] for name, file_name in index.items()}
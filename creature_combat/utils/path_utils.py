@@ -4,4 +4,5 @@ _PATH_UTILS = Path(__file__).resolve()
 _ROOT = _PATH_UTILS.parent.parent
 _CREATUREDEX_PATH = _ROOT.parent / "creaturedex_data"
 
-_MOVE_LIST_PATH = _ROOT.parent / "move_data"
\ No newline at end of file
+_MOVE_LIST_PATH = _ROOT.parent / "move_data"
+_DATA_PACK_PATH = _ROOT.parent / "creature_combat.pack"
\ No newline at end of file
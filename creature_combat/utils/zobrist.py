@@ -0,0 +1,55 @@
+from __future__ import annotations
+from array import array
+from hashlib import shake_128
+from itertools import count
+
+from creature_combat.utils import annotations as anno
+
+_MASK = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_MIX_1 = 0xBF58476D1CE4E5B9
+_MIX_2 = 0x94D049BB133111EB
+
+# Source of per object salts, so every Creature and Participant gets its own keys
+_SALT_COUNTER = count(1)
+
+
+def splitmix64(value: int) -> int:
+    """Mixes a 64 bit integer with the SplitMix64 finalizer, turning consecutive inputs into uncorrelated 64 bit outputs.
+
+    Args:
+        value (int): Input, taken modulo 2^64
+
+    Returns:
+        int: Mixed 64 bit value
+    """
+    z = (value + _GOLDEN_GAMMA) & _MASK
+    z = ((z ^ (z >> 30)) * _MIX_1) & _MASK
+    z = ((z ^ (z >> 27)) * _MIX_2) & _MASK
+    return z ^ (z >> 31)
+
+
+def new_salt() -> int:
+    """Draws the salt for a new hashed object. Salts come from a counter, so they are the same for objects created in the same order.
+
+    Returns:
+        int: 64 bit salt
+    """
+    return splitmix64(next(_SALT_COUNTER))
+
+
+def zobrist_keys(salt: int, field: int, size: int) -> anno.Sequence[int]:
+    """Generates the Zobrist keys of one field of a hashed object, one key per value the field can take. The keys are the SHAKE-128 output stream of the
+    salt and field, so the whole block is generated by one call into C with or without NumPy, and the keys of the first n values do not depend on size.
+    Keys are returned as a packed array of unsigned 64 bit ints, which takes 8 bytes per key instead of the 44 bytes of a list of Python ints.
+
+    Args:
+        salt (int): Salt of the object
+        field (int): Index of the field within the object
+        size (int): Number of values the field can take
+
+    Returns:
+        Sequence[int]: Key for each value of the field
+    """
+    return array('Q', shake_128((salt & _MASK).to_bytes(8, 'little') + field.to_bytes(4, 'little')).digest(8 * size))
+
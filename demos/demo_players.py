@@ -13,21 +13,21 @@ class SuperEffectivePlayer(Player):
             if opponent is None:
                 return creature
             else:
-                if any([get_type_modifier(move, opponent) > 1.0 for move in creature._moves]):
+                if any([get_type_modifier(move, opponent) > 1.0 for move in creature._moves if move is not None]):
                     return creature
         else:
             return available_creature[0] if len(available_creature) > 0 else None
 
-    def select_move(self, opponent: Participant) -> str:
-        mutable_moves: List[Move] = list(self.participant.creature._moves)
-        mutable_moves = [mm for mm in mutable_moves if mm is not None]
-        mutable_moves.sort(key=lambda m: 0 if m.power is None else m.power, reverse=True)
-        for move in mutable_moves:
-            if self.participant.can_make_move(move.name):
-                if get_type_modifier(move, opponent) > 1.0:
-                    return move.name
+    def select_move(self, opponent: Participant) -> int:
+        moves: List[Optional[Move]] = self.participant.creature._moves
+        slots = [slot for slot, move in enumerate(moves) if move is not None]
+        slots.sort(key=lambda slot: 0 if moves[slot].power is None else moves[slot].power, reverse=True)
+        for slot in slots:
+            if self.participant.can_make_move_at(slot):
+                if get_type_modifier(moves[slot], opponent) > 1.0:
+                    return slot
         else:
-            return mutable_moves[0].name
+            return slots[0]
 
 
 class TextBasePlayer(Player):
@@ -51,10 +51,11 @@ class TextBasePlayer(Player):
                 choice = None
         return options[choice]
 
-    def select_move(self, opponent: Participant) -> str:
+    def select_move(self, opponent: Participant) -> int:
         msg = "Remaining PP:\n"
-        for move_name, remaining_pp in self.participant.creature._remaining_pp.items():
-            msg += f"{move_name}: {remaining_pp} / {self.participant.creature._move_map[move_name].max_pp}\n"
+        for slot, move in enumerate(self.participant.creature._moves):
+            if move is not None:
+                msg += f"{move.name}: {self.participant.creature.remaining_pp(slot)} / {move.max_pp}\n"
         print(msg)
         choice = None
         move_string = ""
@@ -70,11 +71,11 @@ class TextBasePlayer(Player):
                     print(f'Please enter an integer between [0-3]')
                     choice = None
                 else:
-                    can_make = self.participant.can_make_move(self.participant.creature._moves[choice].name)
+                    can_make = self.participant.can_make_move_at(choice)
                     if not can_make:
                         print(f"Choice: {self.participant.creature._moves[choice]} is not a valid move in {self.participant.creature.name}'s move list. Please pick a different option.")
                         choice = None
             except ValueError:
                 print(f'Please enter an integer between [0-3]')
                 choice = None
-        return self.participant.creature._moves[choice].name
+        return choice
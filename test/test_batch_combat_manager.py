@@ -0,0 +1,60 @@
+import unittest
+
+from numpy import array, zeros
+
+from creature_combat.engine.batch_combat_manager import BatchCombatManager, IN_PROGRESS, DRAW, PLAYER_1_WIN, PLAYER_2_WIN
+from creature_combat.creature.creaturedex import CreatureEntry
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move import Move
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+
+
+class TestBatchCombatManager(unittest.TestCase):
+    def setUp(self) -> None:
+        bulbasaur_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Bulbasaur.json")
+        squirtle_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Squirtle.json")
+        bulbasaur_moves = (Move.from_json(_MOVE_LIST_PATH / "Tackle.json"), Move.from_json(_MOVE_LIST_PATH / "Growl.json"), Move.from_json(_MOVE_LIST_PATH / "Vine Whip.json"), None)
+        squirtle_moves = (Move.from_json(_MOVE_LIST_PATH / "Tackle.json"), Move.from_json(_MOVE_LIST_PATH / "Tail Whip.json"), Move.from_json(_MOVE_LIST_PATH / "Water Gun.json"), None)
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        self.bulbasaur = bulbasaur_entry.make_creature(5, ivs, evs, CreatureNatureEnum.BASHFUL, bulbasaur_moves)
+        self.squirtle = squirtle_entry.make_creature(5, ivs, evs, CreatureNatureEnum.BASHFUL, squirtle_moves)
+
+    def test_initial_state(self):
+        batch = BatchCombatManager.from_matchup(self.bulbasaur, self.squirtle, 8, rng=0)
+        self.assertTrue((batch.hp[:, 0] == self.bulbasaur.max_hp).all(), "Player 1 HP was not loaded from the creature")
+        self.assertTrue((batch.hp[:, 1] == self.squirtle.max_hp).all(), "Player 2 HP was not loaded from the creature")
+        self.assertTrue((batch.winner == IN_PROGRESS).all(), "Battles should start in progress")
+        self.assertTrue((batch.pp[:, 0, 1] == 40).all(), "PP was not loaded from the creature")
+
+    def test_status_move_adjusts_stage(self):
+        batch = BatchCombatManager.from_matchup(self.bulbasaur, self.squirtle, 4, rng=0)
+        # Bulbasaur uses Growl, Squirtle uses Tail Whip
+        moves = zeros((4, 2), dtype=int)
+        moves[:, 0] = 1
+        moves[:, 1] = 1
+        batch.step_round(moves)
+        self.assertTrue((batch.stages[:, 1, 0] == -1).all(), "Growl did not lower the opponent's p-atk stage")
+        self.assertTrue((batch.stages[:, 0, 1] == -1).all(), "Tail Whip did not lower the opponent's p-def stage")
+        self.assertTrue((batch.pp[:, 0, 1] == 39).all(), "Using a move did not spend its PP")
+        self.assertTrue((batch.hp[:, 0] == self.bulbasaur.max_hp).all(), "Status moves should not deal damage")
+
+    def test_damage_within_bounds(self):
+        batch = BatchCombatManager.from_matchup(self.bulbasaur, self.squirtle, 256, rng=0)
+        moves = array([[0, 0]] * 256)
+        batch.step_round(moves)
+        damage = self.squirtle.max_hp - batch.hp[:, 1]
+        self.assertTrue((damage > 0).all(), "Tackle always hits at neutral accuracy and should always deal damage")
+        self.assertTrue((batch.hp >= 0).all() and (batch.hp <= batch.max_hp).all(), "HP left the range [0, max_hp]")
+
+    def test_run_is_reproducible(self):
+        results_1 = BatchCombatManager.from_matchup(self.bulbasaur, self.squirtle, 128, rng=7).run()
+        results_2 = BatchCombatManager.from_matchup(self.bulbasaur, self.squirtle, 128, rng=7).run()
+        self.assertTrue((results_1 == results_2).all(), "Batches with the same seed produced different results")
+        self.assertTrue(((results_1 == DRAW) | (results_1 == PLAYER_1_WIN) | (results_1 == PLAYER_2_WIN)).all(), "Every battle should be decided after run")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import io
+import unittest
+
+from creature_combat.engine.battle_events import EventLog, TextEventSink, EVENT_DAMAGE, EVENT_HP, EVENT_ROUND_END, EVENT_SWITCH
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.creature.creaturedex import CreatureEntry
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move import Move
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestEventLog(unittest.TestCase):
+    def test_ring_buffer_keeps_newest(self):
+        log = EventLog(capacity=4)
+        for n in range(10):
+            log.emit(EVENT_ROUND_END, 0, 0, n, 0)
+        self.assertEqual(len(log), 4, "Ring buffer should only hold capacity events")
+        self.assertEqual([event[3] for event in log.events()], [6, 7, 8, 9], "Ring buffer did not keep the newest events in order")
+
+    def test_render(self):
+        log = EventLog()
+        log.begin_battle(["Bulbasaur"], ["Charmander"])
+        log.emit(EVENT_DAMAGE, 1, 0, 0, 12)
+        log.emit(EVENT_HP, 0, 0, 8, 20)
+        log.emit(EVENT_SWITCH, 0, 0, 0, 0)
+        self.assertEqual(log.render(), ["Charmander dealt 12 to Bulbasaur!", "Bulbasaur HP: [ 008 / 020 ]"], "Events rendered to the wrong messages")
+
+
+class TestCombatEvents(unittest.TestCase):
+    def setUp(self) -> None:
+        bulbasaur_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Bulbasaur.json")
+        charmander_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Charmander.json")
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        self.bulbasaur = bulbasaur_entry.make_creature(5, ivs, evs, CreatureNatureEnum.BASHFUL, (Move.from_json(_MOVE_LIST_PATH / "Tackle.json"), None, None, None))
+        self.charmander = charmander_entry.make_creature(5, ivs, evs, CreatureNatureEnum.BASHFUL, (Move.from_json(_MOVE_LIST_PATH / "Ember.json"), None, None, None))
+
+    def _play(self, manager: CombatManager) -> int:
+        self.bulbasaur.reset_all()
+        self.charmander.reset_all()
+        return manager.run_battle(SuperEffectivePlayer([self.bulbasaur]), SuperEffectivePlayer([self.charmander]))
+
+    def test_headless_emits_nothing(self):
+        manager = CombatManager(rng=0)
+        self.assertIsNone(manager.event_sink, "Headless combat should not have an event sink")
+        self._play(manager)
+
+    def test_log_matches_text(self):
+        log = EventLog()
+        self._play(CombatManager(rng=4, event_sink=log))
+        stream = io.StringIO()
+        self._play(CombatManager(rng=4, event_sink=TextEventSink(stream)))
+        text_lines = [line for line in stream.getvalue().splitlines() if line != ""]
+        self.assertEqual(log.render(), text_lines, "The event log and text sink rendered different messages")
+        self.assertIn("Charmander dealt", text_lines[0], "Charmander should attack first")
+        self.assertEqual(text_lines[-1], f"Round: {sum(event[0] == EVENT_ROUND_END for event in log.events()):02d} completed!", "Last message should end the round")
+
+    def test_seeded_battle_unchanged_by_sink(self):
+        self.assertEqual(self._play(CombatManager(rng=9)), self._play(CombatManager(rng=9, event_sink=EventLog())), "Attaching a sink changed the battle")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from creature_combat.engine.battle_state import BattleState
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from creature_combat.utils.rng import CombatRNG
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestBattleState(unittest.TestCase):
+    def setUp(self) -> None:
+        creature_dex = CreatureDex(_CREATUREDEX_PATH)
+        move_list = MoveList(_MOVE_LIST_PATH)
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        def make(name, *move_names):
+            moves = tuple(move_list.get(move_name) for move_name in move_names) + (None,) * (4 - len(move_names))
+            return creature_dex.get(name).make_creature(8, ivs, evs, CreatureNatureEnum.BASHFUL, moves)
+        self.player_1 = SuperEffectivePlayer([make("Bulbasaur", "Tackle", "Growl"), make("Squirtle", "Tackle", "Water Gun")])
+        self.player_2 = SuperEffectivePlayer([make("Charmander", "Scratch", "Ember"), make("Squirtle", "Tail Whip", "Tackle")])
+        self.manager = CombatManager(rng=2)
+        self.manager.reset(self.player_1, self.player_2)
+
+    def _observe(self):
+        creatures = list(self.player_1.creature_team.values()) + list(self.player_2.creature_team.values())
+        return (self.manager.round_number, self.player_1.participant.creature, self.player_2.participant.creature, self.player_2.participant.p_atk_stage,
+                [(creature.current_hp, creature.status, creature.status_duration, tuple(creature._remaining_pp)) for creature in creatures])
+
+    def test_restore_round_trip(self):
+        self.manager.step_round(self.player_1, self.player_2)
+        state = self.manager.snapshot()
+        before = self._observe()
+        while len(self.player_1.alive_creature()) > 0 and len(self.player_2.alive_creature()) > 0:
+            self.manager.step_round(self.player_1, self.player_2)
+        self.assertNotEqual(self._observe(), before, "The battle should have changed after playing it out")
+        self.manager.restore(state)
+        self.assertEqual(self._observe(), before, "Restoring did not put the battle back")
+        self.assertEqual(self.manager.snapshot(), state, "A snapshot after restoring should match the restored state")
+
+    def test_rollouts_replay_with_same_rng(self):
+        state = self.manager.snapshot()
+        results = []
+        for _ in range(2):
+            self.manager.restore(state)
+            self.manager.rng = CombatRNG(5)
+            while len(self.player_1.alive_creature()) > 0 and len(self.player_2.alive_creature()) > 0:
+                self.manager.step_round(self.player_1, self.player_2)
+            results.append(self._observe())
+        self.assertEqual(results[0], results[1], "Rollouts from the same state and seed played out differently")
+
+    def test_clone_is_copy_on_write(self):
+        state = self.manager.snapshot()
+        clone = state.clone()
+        self.assertIs(clone.data, state.data, "Clones should share the array until written to")
+        self.manager.step_round(self.player_1, self.player_2)
+        self.manager.snapshot(clone)
+        self.assertIsNot(clone.data, state.data, "Writing to a clone should copy the array")
+        self.assertNotEqual(clone, state, "Writing to a clone changed the original state")
+        self.assertEqual(BattleState.from_bytes(clone.to_bytes()), clone, "State did not survive serialization")
+        data = state.data
+        self.manager.snapshot(state)
+        self.assertIs(state.data, data, "The last state using an array should write to it in place")
+
+    def test_restore_reuses_state_objects(self):
+        state = self.manager.snapshot()
+        participant = self.player_2.participant
+        participant.volatile_counters[0] = 3
+        counters = participant.volatile_counters
+        remaining_pp = self.player_2.participant.creature._remaining_pp
+        self.manager.restore(state)
+        self.assertIs(participant.volatile_counters, counters, "Restoring should write the volatile counters into the existing list")
+        self.assertIs(participant.creature._remaining_pp, remaining_pp, "Restoring should write the PP into the existing list")
+        self.assertEqual(participant.volatile_counters[0], 0, "Volatile counters were not restored")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import sys
+import tracemalloc
+import unittest
+from dataclasses import replace
+
+from creature_combat.creature.build_cache import CreatureBuildCache
+from creature_combat.creature.creature import Creature
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+
+
+class TestCreatureBuildCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.entry = CreatureDex(_CREATUREDEX_PATH).get("Squirtle")
+        move_list = MoveList(_MOVE_LIST_PATH)
+        self.moves = (move_list.get("Tackle"), move_list.get("Water Gun"), None, None)
+        self.ivs = IndividualValues(31, 20, 10, 0, 5, 31)
+        self.evs = EffortValues(4, 0, 0, 80, 0, 80)
+
+    def test_hits_share_stats(self):
+        cache = CreatureBuildCache(8)
+        creature_1 = self.entry.make_creature(50, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        creature_2 = self.entry.make_creature(50, IndividualValues(31, 20, 10, 0, 5, 31), self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1), "Second build should hit the cache")
+        self.assertIs(creature_1._stats, creature_2._stats, "Creatures of the same build should share their stats")
+        self.assertIsNot(creature_1._remaining_pp, creature_2._remaining_pp, "Creatures should not share battle state")
+        uncached = Creature(self.entry.name, 50, self.entry.base_stats, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.entry.elements, self.moves)
+        self.assertEqual(creature_1._stats, uncached._stats, "Cached stats differ from computed stats")
+        self.entry.make_creature(51, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        self.entry.make_creature(50, self.ivs, self.evs, CreatureNatureEnum.TIMID, self.moves, cache)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 3, 3), "Different levels and natures are different builds")
+
+    def test_hits_only_allocate_battle_state(self):
+        cache = CreatureBuildCache(8)
+        self.entry.make_creature(50, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        creatures = [None] * 200
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for idx in range(len(creatures)):
+            creatures[idx] = self.entry.make_creature(50, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        allocated = (tracemalloc.get_traced_memory()[0] - before) / len(creatures)
+        tracemalloc.stop()
+        creature = creatures[0]
+        self.assertIsNone(creature._hp_keys, "Zobrist keys should not be generated before the creature is hashed")
+        # HP, status and duration are shared ints and enum members, so the slotted creature and its remaining PP list are all a hit allocates
+        self.assertLessEqual(allocated, sys.getsizeof(creature) + sys.getsizeof(creature._remaining_pp), "A cache hit allocated more than battle state")
+
+    def test_base_stats_are_part_of_the_key(self):
+        cache = CreatureBuildCache(8)
+        modified = replace(self.entry, base_stats=replace(self.entry.base_stats, speed=self.entry.base_stats.speed + 20))
+        fast = modified.make_creature(50, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        slow = self.entry.make_creature(50, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        self.assertGreater(fast.spd, slow.spd, "Entries with different base stats shared cached stats")
+
+    def test_least_recently_used_is_evicted(self):
+        cache = CreatureBuildCache(2)
+        for level in (10, 20, 10, 30):
+            self.entry.make_creature(level, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        self.assertEqual(len(cache), 2, "Cache grew past its size")
+        self.entry.make_creature(10, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        self.assertEqual(cache.hits, 2, "Recently used build should have been kept")
+        self.entry.make_creature(20, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        self.assertEqual(cache.misses, 4, "Least recently used build should have been evicted")
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0), "Clearing should empty the cache and reset the counters")
+
+    def test_disabled_cache(self):
+        cache = CreatureBuildCache(0)
+        for _ in range(3):
+            self.entry.make_creature(50, self.ivs, self.evs, CreatureNatureEnum.MODEST, self.moves, cache)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 3, 0), "A cache of size 0 should never store builds")
+
+
+if __name__ == "__main__":
+    unittest.main()
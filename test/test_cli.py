@@ -0,0 +1,100 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from creature_combat.cli import main
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.team_definitions import make_teams
+from creature_combat.engine.greedy_player import GreedyPlayer
+from creature_combat.engine.participant import Participant
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+
+TEAMS = {
+    "grass": [{"species": "Bulbasaur", "level": 12, "nature": "MILD", "ivs": [31, 31, 31, 31, 31, 31], "moves": ["Tackle", "Vine Whip", "Growl"]}],
+    "fire": [{"species": "Charmander", "level": 12, "evs": {"health_point": 10, "physical_attack": 0, "physical_defense": 0, "special_attack": 20,
+                                                             "special_defense": 0, "speed": 0}, "moves": ["Scratch", "Ember"]}],
+    "water": [{"species": "Squirtle", "level": 12, "moves": ["Tackle", "Water Gun", "Tail Whip"]}],
+}
+
+
+class TestTeamDefinitions(unittest.TestCase):
+    def setUp(self) -> None:
+        self.creature_dex = CreatureDex(_CREATUREDEX_PATH, lazy=True)
+        self.move_list = MoveList(_MOVE_LIST_PATH, lazy=True)
+
+    def test_make_teams(self):
+        teams = make_teams(TEAMS, self.creature_dex, self.move_list)
+        self.assertEqual(list(teams), ["grass", "fire", "water"], "Teams should keep the order of the file")
+        bulbasaur, charmander = teams["grass"][0], teams["fire"][0]
+        self.assertEqual((bulbasaur.name, bulbasaur.level, bulbasaur._nature), ("Bulbasaur", 12, CreatureNatureEnum.MILD), "Definition fields were not applied")
+        self.assertEqual(charmander._nature, CreatureNatureEnum.BASHFUL, "Left out natures should use the default")
+        self.assertEqual([move.name for move in bulbasaur._moves if move is not None], ["Tackle", "Vine Whip", "Growl"], "Moves were not resolved")
+        with self.assertRaises(AssertionError):
+            make_teams({"doubles": TEAMS["grass"] * 2}, self.creature_dex, self.move_list)
+        with self.assertRaises(AssertionError):
+            make_teams(list(TEAMS.values()), self.creature_dex, self.move_list)
+        with self.assertRaises(AssertionError):
+            make_teams({"grass": TEAMS["grass"][0]}, self.creature_dex, self.move_list)
+
+    def test_greedy_player_prefers_super_effective(self):
+        teams = make_teams(TEAMS, self.creature_dex, self.move_list)
+        player = GreedyPlayer(teams["fire"])
+        player.swap_creature(None)
+        opponent = Participant()
+        opponent.add_creature(teams["grass"][0])
+        self.assertEqual(player.participant.creature._moves[player.select_move(opponent)].name, "Ember", "Greedy player should use the super effective move")
+
+
+class TestSimulateCommand(unittest.TestCase):
+    def test_results_streamed_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            teams_path = Path(directory) / "teams.json"
+            output_path = Path(directory) / "results.jsonl"
+            teams_path.write_text(json.dumps(TEAMS))
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                exit_code = main(["simulate", str(teams_path), "-n", "6", "-w", "1", "--chunk-size", "4", "--seed", "0", "-o", str(output_path)])
+            self.assertEqual(exit_code, 0, "Simulate should succeed")
+            lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+        self.assertEqual(len(lines), 6, "Every chunk should be written as one line")
+        self.assertEqual(sum(line["games"] for line in lines), 18, "Every pairing should play 6 games")
+        for line in lines:
+            self.assertEqual(line["team_1_wins"] + line["team_2_wins"] + line["draws"], line["games"], "Chunk results do not add up")
+            self.assertGreaterEqual(line["rounds"], line["games"], "Every game plays at least one round")
+        self.assertIn("battles/s", stderr.getvalue(), "Throughput was not reported")
+        self.assertEqual(len(stdout.getvalue().splitlines()), 3, "Every team should get a summary line")
+
+    def test_invalid_team_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            teams_path = Path(directory) / "teams.json"
+            teams_path.write_text(json.dumps({"grass": [{"species": "Missingno", "moves": ["Tackle"]}], "fire": TEAMS["fire"]}))
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(main(["simulate", str(teams_path), "-w", "1", "-o", str(Path(directory) / "results.jsonl")]), 2,
+                                 "Unknown species should fail with a usage error")
+
+    def test_missing_team_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                exit_code = main(["simulate", str(Path(directory) / "missing.json"), "-w", "1", "-o", str(Path(directory) / "results.jsonl")])
+        self.assertEqual(exit_code, 2, "A missing team file should fail with a usage error")
+        self.assertIn("cannot read team file", stderr.getvalue(), "The missing file was not reported")
+
+    def test_team_file_not_an_object(self):
+        with tempfile.TemporaryDirectory() as directory:
+            teams_path = Path(directory) / "teams.json"
+            teams_path.write_text(json.dumps(list(TEAMS.values())))
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                exit_code = main(["simulate", str(teams_path), "-w", "1", "-o", str(Path(directory) / "results.jsonl")])
+        self.assertEqual(exit_code, 2, "A team file that is not a JSON object should fail with a usage error")
+        self.assertIn("invalid team file", stderr.getvalue(), "The invalid file was not reported")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from creature_combat.engine.combat_functions import get_defensive_type_modifiers, damage_distribution, damage_distributions, calculate_damage, does_hit
+from creature_combat.engine.participant import Participant
+from creature_combat.creature.creaturedex import CreatureEntry
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.creature_types import CreatureTypeEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move import Move
+from creature_combat.utils.mappings import DAMAGE_MAP
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from creature_combat.utils.rng import CombatRNG
+
+
+class TestTypeModifiers(unittest.TestCase):
+    def test_single_type_modifiers(self):
+        for defending in CreatureTypeEnum:
+            with self.subTest(defending=defending):
+                modifiers = get_defensive_type_modifiers((defending, None))
+                for attacking in CreatureTypeEnum:
+                    self.assertEqual(modifiers[attacking.value], DAMAGE_MAP[attacking.value, defending.value], "Single type modifier did not match the damage map")
+
+    def test_dual_type_modifiers(self):
+        for type_1 in CreatureTypeEnum:
+            for type_2 in CreatureTypeEnum:
+                if type_1 == type_2:
+                    continue
+                modifiers = get_defensive_type_modifiers((type_1, type_2))
+                for attacking in CreatureTypeEnum:
+                    truth = DAMAGE_MAP[attacking.value, type_1.value] * DAMAGE_MAP[attacking.value, type_2.value]
+                    self.assertEqual(modifiers[attacking.value], truth, f"Dual type modifier for {attacking} on {type_1}/{type_2} did not match the damage map")
+                    self.assertIsInstance(modifiers[attacking.value], float, "Cached modifiers should be plain floats")
+
+
+class TestDamageDistribution(unittest.TestCase):
+    def setUp(self) -> None:
+        charmander_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Charmander.json")
+        bulbasaur_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Bulbasaur.json")
+        self.ember = Move.from_json(_MOVE_LIST_PATH / "Ember.json")
+        self.growl = Move.from_json(_MOVE_LIST_PATH / "Growl.json")
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        self.attacker = Participant()
+        self.attacker.add_creature(charmander_entry.make_creature(12, ivs, evs, CreatureNatureEnum.BASHFUL, (self.ember, self.growl, None, None)))
+        self.defender = Participant()
+        self.defender.add_creature(bulbasaur_entry.make_creature(12, ivs, evs, CreatureNatureEnum.BASHFUL, (self.growl, None, None, None)))
+        self.defender.adjust_eva_stage(1)
+
+    def test_distribution_covers_samples(self):
+        distribution = damage_distribution(self.ember, self.attacker, self.defender)
+        self.assertAlmostEqual(distribution.probabilities.sum(), 1.0, msg="Damage probabilities do not sum to 1")
+        values, _ = distribution.pmf()
+        rng = CombatRNG(0)
+        for _ in range(500):
+            damage = calculate_damage(self.ember, self.attacker, self.defender, rng) if does_hit(self.ember, self.attacker, self.defender, rng) else 0
+            self.assertIn(damage, values, "Sampled damage is not in the support of the distribution")
+
+    def test_ko_probability(self):
+        distribution = damage_distribution(self.ember, self.attacker, self.defender)
+        miss_chance = distribution.probabilities[0]
+        self.assertAlmostEqual(float(distribution.ko_probability(1, hp=1)), 1.0 - miss_chance, msg="Any hit should KO a defender with 1 HP")
+        self.assertEqual(float(distribution.ko_probability(1, hp=10_000)), 0.0, "A single hit can not KO a defender with this much HP")
+        self.assertLessEqual(float(distribution.ko_probability(2)), float(distribution.ko_probability(3)), "KO chance should not drop with more hits")
+
+    def test_vectorized_distributions(self):
+        distributions = damage_distributions([self.ember, self.growl], [self.attacker, self.attacker], [self.defender, self.defender])
+        self.assertEqual(distributions.damages.shape, (2, 33), "Distributions should have one row per triple")
+        self.assertTrue((distributions.damages[1] == 0).all(), "Status moves should never deal damage")
+        self.assertEqual(distributions.ko_probability(2).shape, (2,), "KO probabilities should have one value per triple")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from creature_combat.engine.battle_events import EventLog, EVENT_DAMAGE, EVENT_FAINTED, EVENT_ROUND_END
+from creature_combat.engine.combat_hooks import CombatHookEnum, HookDispatcher
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_effects import OP_VOLATILE_STATUS
+from creature_combat.moves.move_list import MoveList
+from creature_combat.statuses.volatile_statuses import VolatileStatusEnum
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestCombatHooks(unittest.TestCase):
+    def setUp(self) -> None:
+        self.creature_dex = CreatureDex(_CREATUREDEX_PATH)
+        self.move_list = MoveList(_MOVE_LIST_PATH)
+
+    def _players(self):
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        def make(name, move_name):
+            return self.creature_dex.get(name).make_creature(10, ivs, evs, CreatureNatureEnum.BASHFUL, (self.move_list.get(move_name), None, None, None))
+        return SuperEffectivePlayer([make("Bulbasaur", "Tackle")]), SuperEffectivePlayer([make("Charmander", "Ember")])
+
+    def test_no_hooks_keeps_sink(self):
+        manager = CombatManager(rng=0)
+        callback = lambda record: None
+        manager.add_hook(CombatHookEnum.ON_DAMAGE, callback)
+        self.assertIsInstance(manager._sink, HookDispatcher, "Registering a hook should install the dispatcher")
+        self.assertIsNone(manager.event_sink, "The attached sink should not change when hooks are registered")
+        manager.remove_hook(CombatHookEnum.ON_DAMAGE, callback)
+        self.assertIsNone(manager._sink, "Removing the last hook should restore headless combat")
+        with self.assertRaises(ValueError):
+            manager.remove_hook(CombatHookEnum.ON_DAMAGE, callback)
+
+    def test_hooks_match_event_log(self):
+        records = []
+        log = EventLog()
+        hooked = CombatManager(rng=5, event_sink=log)
+        for hook in (CombatHookEnum.ON_DAMAGE, CombatHookEnum.ON_FAINT, CombatHookEnum.ON_ROUND_END):
+            hooked.add_hook(hook, lambda record: records.append(record.as_tuple()))
+        result = hooked.run_battle(*self._players())
+        self.assertEqual(result, CombatManager(rng=5).run_battle(*self._players()), "Hooks changed the battle")
+        expected = [event for event in log.events() if event[0] in (EVENT_DAMAGE, EVENT_FAINTED, EVENT_ROUND_END)]
+        self.assertEqual(records, expected, "Hooks should receive the events of their hook in order")
+        self.assertIn(EVENT_FAINTED, [record[0] for record in records], "The faint hook was not called")
+
+    def test_record_is_reused(self):
+        manager = CombatManager(rng=1)
+        records = set()
+        manager.add_hook(CombatHookEnum.ON_ROUND_END, lambda record: records.add(id(record)))
+        manager.run_battle(*self._players())
+        self.assertEqual(len(records), 1, "Every event should reuse the same record")
+
+    def test_status_hook(self):
+        player_1, player_2 = self._players()
+        manager = CombatManager(rng=2)
+        manager.reset(player_1, player_2)
+        statuses = []
+        manager.add_hook(CombatHookEnum.ON_STATUS, lambda record: statuses.append((record.participant, record.value_1, record.value_2)))
+        program = ((OP_VOLATILE_STATUS, VolatileStatusEnum.FLINCH.value, 0),)
+        manager._apply_effects(program, player_2.participant)
+        manager._apply_effects(program, player_2.participant)
+        self.assertEqual(statuses, [(player_2.participant, VolatileStatusEnum.FLINCH.value, 1)], "Only a newly applied status should call the hook")
+
+
+if __name__ == "__main__":
+    unittest.main()
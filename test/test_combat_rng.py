@@ -0,0 +1,58 @@
+import unittest
+
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.creature.creaturedex import CreatureEntry
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move import Move
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from creature_combat.utils.rng import CombatRNG
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestCombatRNG(unittest.TestCase):
+    def test_same_seed_same_draws(self):
+        rng_1 = CombatRNG(3, block_size=16)
+        rng_2 = CombatRNG(3, block_size=16)
+        draws_1 = [rng_1.uniform() for _ in range(100)]
+        draws_2 = [rng_2.uniform() for _ in range(100)]
+        self.assertEqual(draws_1, draws_2, "RNGs with the same seed produced different draws")
+        self.assertTrue(all(0.0 <= d < 1.0 for d in draws_1), "Uniform draws left the range [0, 1)")
+
+    def test_randint_bounds(self):
+        rng = CombatRNG(0, block_size=32)
+        draws = [rng.randint(85, 101) for _ in range(2000)]
+        self.assertEqual(min(draws), 85, "randint never drew its lower bound")
+        self.assertEqual(max(draws), 100, "randint drew outside of [low, high)")
+
+    def test_numpy_backed_draws(self):
+        from numpy.random import SeedSequence
+        rng_1 = CombatRNG(SeedSequence(3), block_size=16)
+        rng_2 = CombatRNG(SeedSequence(3), block_size=16)
+        self.assertEqual([rng_1.uniform() for _ in range(100)], [rng_2.uniform() for _ in range(100)], "NumPy backed RNGs with the same seed differ")
+        self.assertEqual(CombatRNG(4).generator.random(), CombatRNG(4).generator.random(), "Generators of seeded RNGs should be reproducible")
+
+    def _play(self, seed: int) -> list:
+        bulbasaur_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Bulbasaur.json")
+        charmander_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Charmander.json")
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        bulbasaur = bulbasaur_entry.make_creature(5, ivs, evs, CreatureNatureEnum.BASHFUL, (Move.from_json(_MOVE_LIST_PATH / "Tackle.json"), None, None, None))
+        charmander = charmander_entry.make_creature(5, ivs, evs, CreatureNatureEnum.BASHFUL, (Move.from_json(_MOVE_LIST_PATH / "Ember.json"), None, None, None))
+        player_1 = SuperEffectivePlayer([bulbasaur])
+        player_2 = SuperEffectivePlayer([charmander])
+        manager = CombatManager(rng=seed)
+        manager.reset(player_1, player_2)
+        history = []
+        while len(player_1.alive_creature()) > 0 and len(player_2.alive_creature()) > 0:
+            manager.step_round(player_1, player_2)
+            history.append((bulbasaur.current_hp, charmander.current_hp, bulbasaur.status))
+        return history
+
+    def test_seeded_battles_are_reproducible(self):
+        self.assertEqual(self._play(11), self._play(11), "Battles with the same seed played out differently")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+
+
+class TestMakeCreatures(unittest.TestCase):
+    def setUp(self) -> None:
+        self.entry = CreatureDex(_CREATUREDEX_PATH).get("Charmander")
+        move_list = MoveList(_MOVE_LIST_PATH)
+        self.moves = (move_list.get("Scratch"), move_list.get("Ember"), None, None)
+
+    def _stats(self, creature):
+        return (creature.max_hp, creature.p_atk, creature.p_def, creature.s_atk, creature.s_def, creature.spd)
+
+    def test_matches_make_creature(self):
+        creatures = self.entry.make_creatures(300, self.moves, levels=list(range(1, 101)) * 3, rng=7)
+        for creature in creatures:
+            single = self.entry.make_creature(creature.level, creature._individual_values, creature._effort_values, creature._nature, self.moves)
+            self.assertEqual(self._stats(creature), self._stats(single), "Bulk and single creature stats differ")
+            self.assertEqual(type(creature._individual_values), IndividualValues, "IVs should be IndividualValues instances")
+            self.assertEqual(creature._individual_values, IndividualValues(*(getattr(creature._individual_values, f) for f in IndividualValues.__slots__)),
+                             "Unchecked IVs do not compare equal to checked IVs")
+            self.assertEqual(creature.zobrist_hash, creature._compute_zobrist_hash(), "Bulk Zobrist hash does not match its keys")
+            self.assertEqual(len(creature._hp_keys), creature.max_hp + 1, "Bulk creature got the wrong number of hp keys")
+
+    def test_provided_values(self):
+        ivs = (31, 0, 15, 7, 3, 1)
+        evs = (4, 80, 0, 252 - 1, 8, 0)
+        creatures = self.entry.make_creatures(3, self.moves, levels=(5, 50, 100), natures=CreatureNatureEnum.TIMID, individual_values=ivs, effort_values=evs)
+        for creature in creatures:
+            single = self.entry.make_creature(creature.level, IndividualValues(*ivs), EffortValues(*evs), CreatureNatureEnum.TIMID, self.moves)
+            self.assertEqual(self._stats(creature), self._stats(single), "Bulk and single creature stats differ for provided values")
+            self.assertEqual(creature._effort_values, EffortValues(*evs), "Provided EVs were not used")
+        with self.assertRaises(AssertionError):
+            self.entry.make_creatures(2, self.moves, individual_values=(32, 0, 0, 0, 0, 0))
+        with self.assertRaises(AssertionError):
+            self.entry.make_creatures(2, self.moves, effort_values=(200, 200, 200, 0, 0, 0))
+
+    def test_seeded_builds_are_reproducible(self):
+        builds_1 = [(c._individual_values, c._effort_values, c._nature) for c in self.entry.make_creatures(50, self.moves, rng=3)]
+        builds_2 = [(c._individual_values, c._effort_values, c._nature) for c in self.entry.make_creatures(50, self.moves, rng=3)]
+        self.assertEqual(builds_1, builds_2, "Bulk creatures with the same seed differ")
+
+
+if __name__ == "__main__":
+    unittest.main()
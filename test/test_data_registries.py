@@ -0,0 +1,187 @@
+import os
+import shutil
+import tempfile
+import unittest
+from json import loads
+from pathlib import Path
+
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.moves.move import Move
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.data_index import DATA_INDEX_FILE, read_data_index, write_data_index
+from creature_combat.utils.data_pack import open_data_pack
+from creature_combat.utils.parse_cache import load_cached
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+
+
+class TestCreatureDexIds(unittest.TestCase):
+    def setUp(self) -> None:
+        self.creature_dex = CreatureDex(_CREATUREDEX_PATH)
+
+    def test_dense_ids(self):
+        self.assertEqual(list(self.creature_dex.names), sorted(self.creature_dex.available_creature), "IDs should follow the sorted creature names")
+        for name in self.creature_dex.available_creature:
+            creature_id = self.creature_dex.id_of(name)
+            self.assertEqual(self.creature_dex.names[creature_id], name, "Name and ID maps do not agree")
+            self.assertIs(self.creature_dex.get_by_id(creature_id), self.creature_dex.get(name), "Lookup by ID and by name returned different entries")
+        with self.assertRaises(ValueError):
+            self.creature_dex.id_of("Missingno")
+
+    def test_columns(self):
+        columns = self.creature_dex.columns()
+        self.assertEqual(columns.base_stats.shape, (len(self.creature_dex), 6), "Base stats should have one row per creature")
+        self.assertEqual(columns.elements.shape, (len(self.creature_dex), 2), "Elements should have one row per creature")
+        bulbasaur = self.creature_dex.get("Bulbasaur")
+        row = self.creature_dex.id_of("Bulbasaur")
+        self.assertEqual(columns.base_stats[row, 0], bulbasaur.base_stats.health_points, "Base stat column does not match the entry")
+        self.assertEqual(columns.base_stats[row, 5], bulbasaur.base_stats.speed, "Base stat column does not match the entry")
+        self.assertEqual(tuple(columns.elements[row]), tuple(element.value for element in bulbasaur.elements), "Element columns do not match the entry")
+        self.assertIs(self.creature_dex.columns(), columns, "Columns should be cached")
+
+
+class TestMoveListIds(unittest.TestCase):
+    def setUp(self) -> None:
+        self.move_list = MoveList(_MOVE_LIST_PATH)
+
+    def test_dense_ids(self):
+        self.assertEqual(len(self.move_list), len(self.move_list.available_moves), "Every move should have an ID")
+        for name in self.move_list.available_moves:
+            self.assertIs(self.move_list.get_by_id(self.move_list.id_of(name)), self.move_list.get(name), "Lookup by ID and by name returned different moves")
+        with self.assertRaises(ValueError):
+            self.move_list.id_of("Splash")
+
+    def test_columns(self):
+        columns = self.move_list.columns()
+        for move_id, name in enumerate(self.move_list.names):
+            move = self.move_list.get(name)
+            with self.subTest(move=name):
+                self.assertEqual(columns.power[move_id], 0 if move.power is None else move.power, "Power column does not match the move")
+                self.assertEqual(columns.accuracy[move_id], -1 if move.accuracy is None else move.accuracy, "Accuracy column does not match the move")
+                self.assertEqual(columns.move_type[move_id], move.move_type.value, "Move type column does not match the move")
+                self.assertEqual(columns.element[move_id], move.element.value, "Element column does not match the move")
+                self.assertEqual(columns.priority[move_id], move.priority, "Priority column does not match the move")
+                self.assertEqual(columns.max_pp[move_id], move.max_pp, "PP column does not match the move")
+
+
+class TestLazyLoading(unittest.TestCase):
+    def test_lazy_creature_dex(self):
+        eager = CreatureDex(_CREATUREDEX_PATH)
+        lazy = CreatureDex(_CREATUREDEX_PATH, lazy=True)
+        self.assertEqual(lazy.available_creature, eager.available_creature, "Lazy and eager dex should list the same creatures")
+        self.assertEqual(lazy.names, eager.names, "Lazy and eager dex should assign the same IDs")
+        self.assertEqual(len(lazy._creature), 0, "Listing a lazy dex should not parse any entry")
+        entry = lazy.get("Squirtle")
+        self.assertEqual(entry, eager.get("Squirtle"), "Lazy dex parsed a different entry")
+        self.assertIs(lazy.get("Squirtle"), entry, "Lazy dex should memoize parsed entries")
+        self.assertEqual(len(lazy._creature), 1, "Lazy dex should only parse the entries that were requested")
+        with self.assertRaises(ValueError):
+            lazy.get("Missingno")
+
+    def test_lazy_move_list(self):
+        lazy = MoveList(_MOVE_LIST_PATH, lazy=True)
+        self.assertEqual(lazy.available_moves, MoveList(_MOVE_LIST_PATH).available_moves, "Lazy and eager move lists should list the same moves")
+        self.assertEqual(len(lazy._moves), 0, "Listing a lazy move list should not parse any move")
+        self.assertEqual(lazy.get("Tail Whip").name, "Tail Whip", "Lazy move list parsed the wrong move")
+        self.assertEqual(lazy.columns().max_pp.shape, (len(lazy),), "Columns of a lazy move list should cover every move")
+
+    def test_index_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            data_path = Path(tmp) / "move_data"
+            shutil.copytree(_MOVE_LIST_PATH, data_path)
+            index = write_data_index(data_path)
+            self.assertTrue((data_path / DATA_INDEX_FILE).exists(), "Index file was not written")
+            self.assertNotIn(DATA_INDEX_FILE.split('.')[0], index, "The index file should not index itself")
+            self.assertEqual(read_data_index(data_path), index, "Reading the index file did not return the written index")
+            self.assertEqual(MoveList(data_path).available_moves, set(index), "Move list did not use the index file")
+
+
+class TestDataPack(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.creaturedex_path = Path(self._tmp.name) / "creaturedex_data"
+        self.move_list_path = Path(self._tmp.name) / "move_data"
+        shutil.copytree(_CREATUREDEX_PATH, self.creaturedex_path)
+        shutil.copytree(_MOVE_LIST_PATH, self.move_list_path)
+        self.pack_path = Path(self._tmp.name) / "data.pack"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_pack_matches_json(self):
+        pack = open_data_pack(self.creaturedex_path, self.move_list_path, self.pack_path)
+        creature_dex = CreatureDex(self.creaturedex_path, pack=pack)
+        move_list = MoveList(self.move_list_path, pack=pack)
+        json_dex = CreatureDex(self.creaturedex_path)
+        json_moves = MoveList(self.move_list_path)
+        self.assertEqual(creature_dex.names, json_dex.names, "Pack and JSON should hold the same creatures")
+        for name in json_dex.names:
+            self.assertEqual(creature_dex.get(name), json_dex.get(name), f"Creature {name} differs between the pack and JSON")
+        for name in json_moves.names:
+            self.assertEqual(move_list.get(name), json_moves.get(name), f"Move {name} differs between the pack and JSON")
+        self.assertTrue((creature_dex.columns().base_stats == json_dex.columns().base_stats).all(), "Pack base stat columns differ from JSON")
+        self.assertTrue((move_list.columns().power == json_moves.columns().power).all(), "Pack power column differs from JSON")
+
+    def test_stale_pack_is_rebuilt(self):
+        pack = open_data_pack(self.creaturedex_path, self.move_list_path, self.pack_path)
+        self.assertEqual(open_data_pack(self.creaturedex_path, self.move_list_path, self.pack_path).fingerprint, pack.fingerprint, 
+                         "An up to date pack should be reused")
+        source = self.move_list_path / "Tackle.json"
+        source.write_text(source.read_text().replace('"power": 40', '"power": 45'))
+        rebuilt = open_data_pack(self.creaturedex_path, self.move_list_path, self.pack_path)
+        self.assertNotEqual(rebuilt.fingerprint, pack.fingerprint, "Modifying a source file should rebuild the pack")
+        self.assertEqual(MoveList(self.move_list_path, pack=rebuilt).get("Tackle").power, 45, "Rebuilt pack did not pick up the modified move")
+
+    def test_corrupt_pack_is_rebuilt(self):
+        for content in (b"", b"CCPK\0\0\0\0\0\0", b"NOTAPACK" * 16):
+            with self.subTest(size=len(content)):
+                self.pack_path.write_bytes(content)
+                pack = open_data_pack(self.creaturedex_path, self.move_list_path, self.pack_path)
+                self.assertEqual(CreatureDex(self.creaturedex_path, pack=pack).names, CreatureDex(self.creaturedex_path, lazy=True).names,
+                                 "A corrupt pack should be rebuilt")
+                pack.close()
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_path = Path(self._tmp.name) / "move_data"
+        shutil.copytree(_MOVE_LIST_PATH, self.data_path)
+        self.cache_path = Path(self._tmp.name) / "moves.cache"
+        self.index = read_data_index(self.data_path)
+        self.parsed = []
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _parse(self, content: bytes) -> Move:
+        self.parsed.append(content)
+        return Move.from_dict(loads(content))
+
+    def _load(self):
+        self.parsed.clear()
+        return load_cached(self.data_path, self.index, self._parse, self.cache_path)
+
+    def test_cache_reuse_and_invalidation(self):
+        moves = self._load()
+        self.assertEqual(len(self.parsed), len(self.index), "A cold cache should parse every file")
+        self.assertEqual(moves, self._load(), "Cached moves differ from the parsed moves")
+        self.assertEqual(len(self.parsed), 0, "A warm cache should not parse any file")
+        source = self.data_path / "Tackle.json"
+        os.utime(source, ns=(0, 0))
+        self._load()
+        self.assertEqual(len(self.parsed), 0, "Touching a file without changing it should fall back to the content hash")
+        source.write_text(source.read_text().replace('"power": 40', '"power": 45'))
+        moves = self._load()
+        self.assertEqual(len(self.parsed), 1, "Only the modified file should be parsed again")
+        self.assertEqual(moves["Tackle"].power, 45, "Cache returned the stale move")
+
+    def test_cached_registry(self):
+        move_list = MoveList(self.data_path, cache_path=self.cache_path)
+        self.assertTrue(self.cache_path.exists(), "Loading through the cache should write the cache")
+        cached = MoveList(self.data_path, cache_path=self.cache_path)
+        for name in move_list.names:
+            self.assertEqual(cached.get(name), move_list.get(name), f"Cached move {name} differs from the parsed move")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+
+from numpy import zeros
+
+from creature_combat.creature.creaturedex import CreatureEntry
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.creature_types import CreatureTypeEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.engine.batch_combat_manager import BatchCombatManager
+from creature_combat.engine.combat_functions import calculate_damage, damage_distribution, does_hit
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.engine.participant import Participant
+from creature_combat.environment.environment_tables import (ENVIRONMENT_COUNT, ENVIRONMENT_DAMAGE_MODIFIERS, ENVIRONMENT_DURATION, NO_ENVIRONMENT,
+                                                            environment_index, environment_terrain, environment_weather)
+from creature_combat.environment.environment_types import TerrainEnum, WeatherEnum
+from creature_combat.moves.move import Move
+from creature_combat.moves.move_effects import OP_TERRAIN, OP_WEATHER, compile_environment_effects
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from creature_combat.utils.rng import CombatRNG
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestEnvironmentTables(unittest.TestCase):
+    def test_index_round_trip(self):
+        self.assertEqual(environment_index(WeatherEnum.NONE.value, TerrainEnum.NONE.value), NO_ENVIRONMENT, "No weather and terrain should be index 0")
+        for weather in WeatherEnum:
+            for terrain in TerrainEnum:
+                environment = environment_index(weather.value, terrain.value)
+                self.assertTrue(0 <= environment < ENVIRONMENT_COUNT, "Environment index out of range")
+                self.assertEqual((environment_weather(environment), environment_terrain(environment)), (weather.value, terrain.value),
+                                 "Environment index did not round trip")
+
+    def test_damage_modifiers(self):
+        self.assertEqual(ENVIRONMENT_DAMAGE_MODIFIERS[NO_ENVIRONMENT], (1.0,) * 18, "No environment should not modify damage")
+        sunny_grass = ENVIRONMENT_DAMAGE_MODIFIERS[environment_index(WeatherEnum.SUN.value, TerrainEnum.GRASSY_TERRAIN.value)]
+        self.assertEqual(sunny_grass[CreatureTypeEnum.FIRE.value], 1.5, "Sun should boost fire moves")
+        self.assertEqual(sunny_grass[CreatureTypeEnum.WATER.value], 0.5, "Sun should weaken water moves")
+        self.assertEqual(sunny_grass[CreatureTypeEnum.GRASS.value], 1.3, "Grassy terrain should boost grass moves")
+
+    def test_compile_environment_effects(self):
+        self.assertEqual(compile_environment_effects(["RAIN", "MISTY_TERRAIN"]),
+                         ((OP_WEATHER, WeatherEnum.RAIN.value, 0), (OP_TERRAIN, TerrainEnum.MISTY_TERRAIN.value, 0)), "Environment effects compiled incorrectly")
+        for effect in ("NONE", "SNOW"):
+            with self.assertRaises(ValueError):
+                compile_environment_effects([effect])
+
+
+class TestEnvironmentDamage(unittest.TestCase):
+    def setUp(self) -> None:
+        charmander_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Charmander.json")
+        bulbasaur_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Bulbasaur.json")
+        self.ember = Move.from_json(_MOVE_LIST_PATH / "Ember.json")
+        self.growl = Move.from_json(_MOVE_LIST_PATH / "Growl.json")
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        self.attacker = Participant()
+        self.attacker.add_creature(charmander_entry.make_creature(12, ivs, evs, CreatureNatureEnum.BASHFUL, (self.ember, self.growl, None, None)))
+        self.defender = Participant()
+        self.defender.add_creature(bulbasaur_entry.make_creature(12, ivs, evs, CreatureNatureEnum.BASHFUL, (self.growl, None, None, None)))
+        self.sun = environment_index(WeatherEnum.SUN.value, TerrainEnum.NONE.value)
+
+    def test_distribution_covers_samples(self):
+        distribution = damage_distribution(self.ember, self.attacker, self.defender, self.sun)
+        self.assertGreater(distribution.expected_damage, damage_distribution(self.ember, self.attacker, self.defender).expected_damage,
+                           "Sun should increase the damage of fire moves")
+        values, _ = distribution.pmf()
+        rng = CombatRNG(0)
+        for _ in range(200):
+            hit = does_hit(self.ember, self.attacker, self.defender, rng)
+            damage = calculate_damage(self.ember, self.attacker, self.defender, rng, self.sun) if hit else 0
+            self.assertIn(damage, values, "Sampled damage is not in the support of the distribution")
+
+    def test_end_turn_chip(self):
+        sandstorm = environment_index(WeatherEnum.SANDSTORM.value, TerrainEnum.NONE.value)
+        self.defender.apply_environment_end_turn(sandstorm)
+        lost = int(self.defender.max_hp / 16)
+        self.assertEqual(self.defender.current_hp, self.defender.max_hp - lost, "Sandstorm should chip 1/16 of the max hp")
+        self.defender.apply_environment_end_turn(environment_index(WeatherEnum.NONE.value, TerrainEnum.GRASSY_TERRAIN.value))
+        self.assertEqual(self.defender.current_hp, self.defender.max_hp, "Grassy terrain should heal 1/16 of the max hp")
+
+
+class TestCombatEnvironment(unittest.TestCase):
+    def setUp(self) -> None:
+        bulbasaur_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Bulbasaur.json")
+        squirtle_entry = CreatureEntry.from_json(_CREATUREDEX_PATH / "Squirtle.json")
+        self.growl = Move.from_json(_MOVE_LIST_PATH / "Growl.json")
+        self.tail_whip = Move.from_json(_MOVE_LIST_PATH / "Tail Whip.json")
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        self.bulbasaur = bulbasaur_entry.make_creature(20, ivs, evs, CreatureNatureEnum.BASHFUL, (self.growl, None, None, None))
+        self.squirtle = squirtle_entry.make_creature(20, ivs, evs, CreatureNatureEnum.BASHFUL, (self.tail_whip, None, None, None))
+
+    def test_weather_expires(self):
+        player_1, player_2 = SuperEffectivePlayer([self.bulbasaur]), SuperEffectivePlayer([self.squirtle])
+        manager = CombatManager(rng=0)
+        manager.reset(player_1, player_2)
+        state = manager.snapshot()
+        state_hash = manager.state_hash()
+        manager.set_weather(WeatherEnum.SANDSTORM)
+        self.assertNotEqual(manager.state_hash(), state_hash, "Setting the weather should change the hash")
+        for _ in range(ENVIRONMENT_DURATION):
+            self.assertEqual(manager.weather, WeatherEnum.SANDSTORM, "Weather ended early")
+            manager.step_round(player_1, player_2)
+        self.assertEqual((manager.weather, manager.environment), (WeatherEnum.NONE, NO_ENVIRONMENT), "Weather should end after its turns run out")
+        chip = int(self.bulbasaur.max_hp / 16)
+        self.assertEqual(self.bulbasaur.current_hp, self.bulbasaur.max_hp - ENVIRONMENT_DURATION * chip, "Sandstorm chip was not applied every turn")
+        manager.restore(state)
+        self.assertEqual((manager.environment, manager.state_hash()), (NO_ENVIRONMENT, state_hash), "Restoring should restore the environment")
+
+    def test_batch_matches_scalar_chip(self):
+        environment = environment_index(WeatherEnum.HAIL.value, TerrainEnum.GRASSY_TERRAIN.value)
+        # The batch copies the creatures, so it is built before the scalar battle changes them
+        batch = BatchCombatManager.from_matchup(self.bulbasaur, self.squirtle, 4, rng=0)
+        batch.environment[:] = environment
+        batch.weather_turns[:] = 1
+        batch.terrain_turns[:] = -1
+        batch.step_round(zeros((4, 2), dtype=int))
+        player_1, player_2 = SuperEffectivePlayer([self.bulbasaur]), SuperEffectivePlayer([self.squirtle])
+        manager = CombatManager(rng=0)
+        manager.reset(player_1, player_2)
+        manager.set_weather(WeatherEnum.HAIL, 1)
+        manager.set_terrain(TerrainEnum.GRASSY_TERRAIN, -1)
+        self.assertEqual(manager.environment, environment, "Scalar and batch battles should start in the same environment")
+        manager.step_round(player_1, player_2)
+        self.assertEqual(self.bulbasaur.current_hp, self.bulbasaur.max_hp, "Hail and grassy terrain chip and heal should cancel out")
+        self.assertTrue((batch.hp[:, 0] == self.bulbasaur.current_hp).all(), "Batch chip differs from the scalar engine")
+        self.assertTrue((batch.hp[:, 1] == self.squirtle.current_hp).all(), "Batch chip differs from the scalar engine")
+        self.assertEqual(manager.environment, environment_index(WeatherEnum.NONE.value, TerrainEnum.GRASSY_TERRAIN.value), 
+                         "Weather should end after its turns run out")
+        self.assertTrue((batch.environment == manager.environment).all(), "Batch environment differs from the scalar engine")
+        self.assertTrue(((batch.weather_turns == manager.weather_turns) & (batch.terrain_turns == manager.terrain_turns)).all(),
+                        "Batch turn counters differ from the scalar engine")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from creature_combat.utils.zobrist import zobrist_keys
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestLazyImports(unittest.TestCase):
+    def _run(self, code: str) -> str:
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.strip()
+
+    def test_scalar_battle_does_not_import_numpy(self):
+        sys.path.insert(0, str(ROOT / "benchmarks"))
+        try:
+            from import_time import BATTLE
+        finally:
+            sys.path.pop(0)
+        self.assertEqual(self._run(f"import sys\n{BATTLE}\nprint('numpy' in sys.modules)"), "False", "Playing a scalar battle imported NumPy")
+
+    def test_zobrist_keys_deterministic_across_processes(self):
+        salt = 0xFFFFFFFFFFFFFF00
+        keys = self._run(f"import sys\nfrom creature_combat.utils.zobrist import zobrist_keys\nkeys = list(zobrist_keys({salt}, 3, 64))\n"
+                         f"print('numpy' in sys.modules, keys)")
+        self.assertEqual(keys, f"False {list(zobrist_keys(salt, 3, 64))}",
+                         "Generating Zobrist keys imported NumPy or gave different keys in a fresh process")
+
+    def test_vectorized_names_are_forwarded(self):
+        from creature_combat.engine import combat_functions, distributions
+        from creature_combat.utils import mappings
+        self.assertIs(combat_functions.damage_distributions, distributions.damage_distributions, "Distributions were not forwarded")
+        self.assertEqual(mappings.DAMAGE_MAP.tolist(), [list(row) for row in mappings.DAMAGE_TABLE], "Damage map does not match the damage table")
+        with self.assertRaises(AttributeError):
+            combat_functions.not_a_function
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+
+from creature_combat.engine.combat_manager import CombatManager, DRAW, PLAYER_1_WIN, PLAYER_2_WIN
+from creature_combat.engine.mcts_player import MCTSPlayer, legal_move_slots
+from creature_combat.engine.tournament import play_games
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.environment.environment_types import TerrainEnum, WeatherEnum
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestMCTSPlayer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.creature_dex = CreatureDex(_CREATUREDEX_PATH)
+        self.move_list = MoveList(_MOVE_LIST_PATH)
+
+    def _make_team(self):
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        team = []
+        for name, move_names in (("Charmander", ("Scratch", "Ember", "Growl")), ("Squirtle", ("Tackle", "Water Gun", "Tail Whip")), 
+                                 ("Bulbasaur", ("Tackle", "Growl", "Vine Whip"))):
+            moves = tuple(self.move_list.get(move_name) for move_name in move_names) + (None,)
+            team.append(self.creature_dex.get(name).make_creature(5, ivs, evs, CreatureNatureEnum.BASHFUL, moves))
+        return team
+
+    def test_search_leaves_battle_unchanged(self):
+        player_1 = MCTSPlayer(self._make_team(), iterations=30, rng=0)
+        player_2 = SuperEffectivePlayer(self._make_team())
+        manager = CombatManager(rng=0)
+        manager.reset(player_1, player_2)
+        manager.step_round(player_1, player_2)
+        before = manager.snapshot()
+        slot = player_1.select_move(player_2.participant)
+        self.assertEqual(manager.snapshot(), before, "Searching changed the state of the battle")
+        self.assertIn(slot, legal_move_slots(player_1.participant.creature), "Search picked an illegal move")
+
+    def test_search_sees_battle_environment(self):
+        player_1 = MCTSPlayer(self._make_team(), iterations=10, rng=0)
+        player_2 = SuperEffectivePlayer(self._make_team())
+        manager = CombatManager(rng=0)
+        manager.reset(player_1, player_2)
+        manager.set_weather(WeatherEnum.SANDSTORM, 3)
+        manager.set_terrain(TerrainEnum.GRASSY_TERRAIN)
+        manager.step_round(player_1, player_2)
+        searched = []
+        search = player_1._search
+        def recorded_search(state, root, iterations, time_limit):
+            searched.append(tuple(state.data[:4]))
+            return search(state, root, iterations, time_limit)
+        player_1._search = recorded_search
+        player_1.select_move(player_2.participant)
+        player_1.choose_next_creature(player_2.participant)
+        expected = (manager.round_number, manager.environment, manager.weather_turns, manager.terrain_turns)
+        self.assertGreater(len(searched), 1, "Both decisions should search")
+        for header in searched:
+            self.assertEqual(header, expected, "Search did not start from the environment of the battle")
+
+    def test_full_battle(self):
+        for is_player_1 in (True, False):
+            with self.subTest(is_player_1=is_player_1):
+                mcts = MCTSPlayer(self._make_team(), iterations=20, rng=1)
+                greedy = SuperEffectivePlayer(self._make_team())
+                players = (mcts, greedy) if is_player_1 else (greedy, mcts)
+                result = CombatManager(rng=1).run_battle(*players)
+                self.assertIn(result, (DRAW, PLAYER_1_WIN, PLAYER_2_WIN), "Battle did not finish")
+
+    def test_reused_root_follows_played_moves(self):
+        class RecordingPlayer(SuperEffectivePlayer):
+            def select_move(self, opponent):
+                slot = super().select_move(opponent)
+                self.slots.append(slot)
+                return slot
+        for is_player_1 in (True, False):
+            with self.subTest(is_player_1=is_player_1):
+                mcts = MCTSPlayer(self._make_team(), iterations=30, rng=4)
+                greedy = RecordingPlayer(self._make_team())
+                greedy.slots = []
+                mcts_slots = []
+                reused = []
+                reused_root = mcts._reused_root
+                def checked_reused_root():
+                    node = reused_root()
+                    if node is not None:
+                        # The opponent has already moved this round when the searching player is player 2
+                        other_slot = greedy.slots[len(mcts_slots) - 1]
+                        reused.append(node is mcts._root.children.get((mcts_slots[-1], other_slot)))
+                    return node
+                mcts._reused_root = checked_reused_root
+                select_move = mcts.select_move
+                def recorded_select_move(opponent):
+                    slot = select_move(opponent)
+                    mcts_slots.append(slot)
+                    return slot
+                mcts.select_move = recorded_select_move
+                players = (mcts, greedy) if is_player_1 else (greedy, mcts)
+                CombatManager(rng=5).run_battle(*players)
+                self.assertGreater(len(reused), 0, "No subtree was reused")
+                self.assertTrue(all(reused), "A reused subtree did not match the moves played")
+
+    def test_beats_greedy_player(self):
+        team_1 = self._make_team()
+        team_2 = self._make_team()
+        def make_player(team):
+            return MCTSPlayer(team, iterations=40, rng=2) if team is team_1 else SuperEffectivePlayer(team)
+        mcts_wins, greedy_wins, _ = play_games(team_1, team_2, make_player, 6, rng=3)
+        self.assertGreater(mcts_wins, greedy_wins, "Search should beat the greedy player with the same team")
+
+    def test_root_parallel_search(self):
+        player_1 = MCTSPlayer(self._make_team(), iterations=10, workers=2, rng=0)
+        player_2 = SuperEffectivePlayer(self._make_team())
+        manager = CombatManager(rng=0)
+        manager.reset(player_1, player_2)
+        try:
+            slot = player_1.select_move(player_2.participant)
+        finally:
+            player_1.close()
+        self.assertIn(slot, legal_move_slots(player_1.participant.creature), "Search picked an illegal move")
+
+    def test_pool_closed_when_side_changes(self):
+        player_2 = SuperEffectivePlayer(self._make_team())
+        with MCTSPlayer(self._make_team(), iterations=10, workers=2, rng=0) as player_1:
+            if player_1.workers == 1:
+                self.skipTest("Root parallel search needs the fork start method")
+            manager = CombatManager(rng=0)
+            manager.reset(player_1, player_2)
+            player_1.select_move(player_2.participant)
+            self.assertIsNotNone(player_1._pool, "Searching with workers should start the pool")
+            manager.reset(player_1, player_2)
+            self.assertIsNotNone(player_1._pool, "Replaying the same opponent from the same side should keep the pool")
+            manager.reset(player_2, player_1)
+            self.assertIsNone(player_1._pool, "Workers forked as player 1 should not search as player 2")
+            player_1.select_move(player_2.participant)
+        self.assertIsNone(player_1._pool, "Leaving the with block should shut the pool down")
+
+
+if __name__ == "__main__":
+    unittest.main()
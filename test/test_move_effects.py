@@ -0,0 +1,37 @@
+import unittest
+
+from creature_combat.moves.move import Move
+from creature_combat.moves.move_effects import compile_effect, OP_STAT_STAGE, OP_STATUS, OP_HEAL_PERCENT, OP_LIFESTEAL_FLAT, STAT_INDEX
+from creature_combat.moves.move_types import MoveTypeEnum
+from creature_combat.creature.creature_types import CreatureTypeEnum
+from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+
+
+class TestMoveEffects(unittest.TestCase):
+    def _make_move(self, self_effect=None, opponent_effect=None, environment_effect=None) -> Move:
+        return Move("Test", MoveTypeEnum.PHYSICAL, CreatureTypeEnum.NORMAL, 40, 100, False, 10, 0, self_effect or [], opponent_effect or [], environment_effect or [])
+
+    def test_compile_effect(self):
+        self.assertEqual(compile_effect("P_ATK:-1"), (OP_STAT_STAGE, STAT_INDEX["P_ATK"], -1), "Stat stage effect compiled incorrectly")
+        self.assertEqual(compile_effect("CRIT:2"), (OP_STAT_STAGE, STAT_INDEX["CRIT"], 2), "Crit stage effect compiled incorrectly")
+        self.assertEqual(compile_effect("BRN"), (OP_STATUS, NonVolatileStatusEnum.BRN.value, 0), "Status effect compiled incorrectly")
+        self.assertEqual(compile_effect("HEAL%:50"), (OP_HEAL_PERCENT, 0, 50), "Heal effect compiled incorrectly")
+
+    def test_invalid_effects_fail_at_load(self):
+        for effect in ["P_ATK", "P_ATK:x", "HP:1", "HEAL:5", "HEAL%:150", "NONE", "BURN", "LIFESTEAL%:-5"]:
+            with self.subTest(effect=effect):
+                with self.assertRaises(ValueError):
+                    self._make_move(self_effect=[effect])
+        with self.assertRaises(ValueError):
+            self._make_move(opponent_effect=["LIFESTEAL%:50"])
+        with self.assertRaises(ValueError):
+            self._make_move(environment_effect=["TORNADO"])
+
+    def test_lifesteal_is_extracted(self):
+        move = self._make_move(self_effect=["SPD:1", "LIFESTEAL_FLAT:5", "HEAL%:10"])
+        self.assertEqual(move.lifesteal, (OP_LIFESTEAL_FLAT, 0, 5), "Lifesteal effect was not extracted")
+        self.assertEqual(move.self_program, ((OP_STAT_STAGE, STAT_INDEX["SPD"], 1), (OP_HEAL_PERCENT, 0, 10)), "Self program should keep the remaining effects in order")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
+from dataclasses import FrozenInstanceError
 
-from creature_combat.engine.participant import Participant
+from creature_combat.engine.participant import Participant, PARTICIPANT_STATE_SIZE
 from creature_combat.creature.creaturedex import CreatureEntry
 from creature_combat.creature.creature_natures import CreatureNatureEnum
 from creature_combat.creature.effort_values import EffortValues
@@ -384,6 +385,50 @@ class TestParticipant(unittest.TestCase):
                     case NonVolatileStatusEnum.BPSN:
                         self.assertEqual(self.participant.current_hp, self.participant.max_hp - int(self.participant.max_hp * 1/16), "Poison status did not properly apply damage")
         
+    def test_make_move_uses_slot_pp(self):
+        self.participant.make_move("Growl")
+        self.assertEqual(self.participant.last_move_slot, 1, "Make move did not record the slot of the move")
+        self.assertEqual(self.creature.remaining_pp(1), self.creature._moves[1].max_pp - 1, "Make move did not use PP of the move's slot")
+        self.assertEqual(self.creature.remaining_pp(3), 0, "Empty move slots should have no PP")
+        self.creature._set_pp(1, 0)
+        self.assertFalse(self.participant.can_make_move("Growl"), "Moves without PP should not be usable")
+        self.assertFalse(self.participant.can_make_move("Ember"), "Moves the creature does not know should not be usable")
+        self.creature.reset_all()
+        self.assertEqual(self.creature.remaining_pp(1), self.creature._moves[1].max_pp, "Reset did not restore the PP of the slot")
+        with self.assertRaises(FrozenInstanceError):
+            self.creature._moves[0].power = 100
+        with self.assertRaises(AttributeError):
+            self.creature.nickname = "Bulby"
+
+    def test_legal_move_mask(self):
+        self.assertEqual(self.participant.legal_move_mask, 0b0111, "Every move with PP should be legal and empty slots illegal")
+        for _ in range(self.creature._moves[2].max_pp):
+            self.assertEqual(self.participant.make_move_at(2), self.creature._moves[2], "Make move at did not return the move in the slot")
+        self.assertEqual(self.participant.legal_move_mask, 0b0011, "Slots should become illegal once their PP runs out")
+        self.assertFalse(self.participant.can_make_move_at(2), "Slot without PP should not be usable")
+        state = [0] * 7
+        self.creature.write_state(state, 0)
+        self.creature.reset_all()
+        self.assertEqual(self.participant.legal_move_mask, 0b0111, "Reset did not restore the legal moves")
+        self.creature.read_state(state, 0)
+        self.assertEqual(self.participant.legal_move_mask, 0b0011, "Restoring did not restore the legal moves")
+
+    def test_cached_stats_follow_creature(self):
+        self.participant.adjust_p_atk_stage(2)
+        self.participant.adjust_spd_stage(-3)
+        self.participant.remove_creature()
+        self.assertEqual((self.participant.p_atk, self.participant.spd), (0, 0), "Effective stats should be 0 without a creature")
+        self.participant.add_creature(self.creature)
+        self.assertEqual(self.participant.p_atk, self.creature.p_atk, "Effective stats were not refreshed when the creature was added")
+        self.assertEqual(self.participant.spd, self.creature.spd, "Removing the creature should have reset the stages")
+        state = [0] * PARTICIPANT_STATE_SIZE
+        self.participant.adjust_s_def_stage(-2)
+        self.participant.write_state(state, 0)
+        self.participant.reset_stage()
+        self.assertEqual(self.participant.s_def, self.creature.s_def, "Effective stats were not refreshed when the stages were reset")
+        self.participant.read_state(state, 0)
+        self.assertEqual(self.participant.s_def, int(self.creature.s_def * 2 / 4), "Effective stats were not refreshed when the stages were restored")
+        
         
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,114 @@
+import unittest
+
+from creature_combat.engine.battle_events import EventLog, EVENT_CONFUSED, EVENT_FLINCHED
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_effects import OP_VOLATILE_STATUS, compile_effect
+from creature_combat.moves.move_list import MoveList
+from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+from creature_combat.statuses.status_handlers import CAN_MOVE
+from creature_combat.statuses.volatile_statuses import VolatileStatusEnum
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from creature_combat.utils.rng import CombatRNG
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestStatuses(unittest.TestCase):
+    def setUp(self) -> None:
+        creature_dex = CreatureDex(_CREATUREDEX_PATH)
+        move_list = MoveList(_MOVE_LIST_PATH)
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        def make(name, *move_names):
+            moves = tuple(move_list.get(move_name) for move_name in move_names) + (None,) * (4 - len(move_names))
+            return creature_dex.get(name).make_creature(20, ivs, evs, CreatureNatureEnum.BASHFUL, moves)
+        self.player_1 = SuperEffectivePlayer([make("Bulbasaur", "Tackle"), make("Squirtle", "Tackle")])
+        self.player_2 = SuperEffectivePlayer([make("Charmander", "Growl")])
+        self.log = EventLog()
+        self.manager = CombatManager(rng=3, event_sink=self.log)
+        self.manager.reset(self.player_1, self.player_2)
+        self.participant = self.player_1.participant
+        self.opponent = self.player_2.participant
+
+    def _assert_hash_consistent(self):
+        self.assertEqual(self.participant.zobrist_hash, self.participant._compute_zobrist_hash(), "Participant hash drifted from its state")
+
+    def test_non_volatile_durations(self):
+        creature = self.participant.creature
+        creature.set_status(NonVolatileStatusEnum.SLP, CombatRNG(0))
+        self.assertIn(creature.status_duration, range(1, 4), "Sleep should last 1 to 3 turns")
+        creature.set_status(NonVolatileStatusEnum.BRN)
+        self.assertEqual(creature.status, NonVolatileStatusEnum.SLP, "A second status should not replace the first")
+        self.participant.remove_status_non_volatile()
+        creature.set_status(NonVolatileStatusEnum.BRN)
+        self.assertEqual((creature.status, creature.status_duration), (NonVolatileStatusEnum.BRN, -1), "Burn should last until removed")
+
+    def test_volatile_bitmask(self):
+        self.assertEqual(self.participant.volatile_statuses, 0, "A new participant should have no volatile statuses")
+        self.participant.apply_status_volatile(VolatileStatusEnum.LEECH_SEED)
+        self.participant.apply_status_volatile(VolatileStatusEnum.CONFUSION, CombatRNG(0))
+        self.assertEqual(self.participant.volatile_statuses, (1 << VolatileStatusEnum.CONFUSION.value) | (1 << VolatileStatusEnum.LEECH_SEED.value), 
+                         "Volatile statuses should be stored as bits")
+        self.assertIn(self.participant.volatile_counters[VolatileStatusEnum.CONFUSION.value], range(2, 6), "Confusion should last 2 to 5 turns")
+        self.assertTrue(self.participant.has_status_volatile(VolatileStatusEnum.CONFUSION), "Confusion was not applied")
+        self.assertFalse(self.participant.has_status_volatile(VolatileStatusEnum.FLINCH), "Flinch was never applied")
+        self._assert_hash_consistent()
+        self.participant.remove_status_volatile(VolatileStatusEnum.CONFUSION)
+        self.assertEqual(self.participant.volatile_statuses, 1 << VolatileStatusEnum.LEECH_SEED.value, "Removing a status should only clear its bit")
+        self._assert_hash_consistent()
+        self.player_1.swap_creature(self.opponent)
+        self.assertEqual(self.participant.volatile_statuses, 0, "Volatile statuses should be cleared when the creature leaves battle")
+        self._assert_hash_consistent()
+
+    def test_snapshot_restores_volatile_statuses(self):
+        state = self.manager.snapshot()
+        state_hash = self.manager.state_hash()
+        self.participant.apply_status_volatile(VolatileStatusEnum.CONFUSION, CombatRNG(0))
+        self.assertNotEqual(self.manager.state_hash(), state_hash, "Applying a volatile status should change the hash")
+        confused = self.manager.snapshot()
+        self.manager.restore(state)
+        self.assertEqual((self.participant.volatile_statuses, self.manager.state_hash()), (0, state_hash), "Restoring should clear the status")
+        self.manager.restore(confused)
+        self.assertTrue(self.participant.has_status_volatile(VolatileStatusEnum.CONFUSION), "Restoring should bring the status back")
+        self._assert_hash_consistent()
+
+    def test_flinch(self):
+        self.participant.apply_status_volatile(VolatileStatusEnum.FLINCH)
+        self.assertEqual(self.participant.before_move(self.opponent, CombatRNG(0)), EVENT_FLINCHED, "A flinched creature should not move")
+        self.participant.apply_end_turn_effects(CombatRNG(0), self.opponent)
+        self.assertEqual(self.participant.volatile_statuses, 0, "Flinch should only last until the end of the turn")
+        self.assertEqual(self.participant.before_move(self.opponent, CombatRNG(0)), CAN_MOVE, "A creature without statuses should move")
+        self.participant.apply_status_volatile(VolatileStatusEnum.FLINCH)
+        self.manager.step_round(self.player_1, self.player_2)
+        self.assertIn(EVENT_FLINCHED, [event[0] for event in self.log.events()], "The flinch was not emitted")
+        self.assertEqual(self.opponent.current_hp, self.opponent.max_hp, "A flinched creature should not have attacked")
+
+    def test_leech_seed(self):
+        self.opponent.damage(10)
+        self.participant.apply_status_volatile(VolatileStatusEnum.LEECH_SEED)
+        self.participant.apply_end_turn_effects(CombatRNG(0), self.opponent)
+        drained = int(self.participant.max_hp / 8)
+        self.assertEqual(self.participant.current_hp, self.participant.max_hp - drained, "Leech seed should drain 1/8 of the max hp")
+        self.assertEqual(self.opponent.current_hp, self.opponent.max_hp - 10 + drained, "Leech seed should heal the opponent by the drained hp")
+        self.assertTrue(self.participant.has_status_volatile(VolatileStatusEnum.LEECH_SEED), "Leech seed should last until the creature leaves battle")
+
+    def test_confusion_wears_off(self):
+        rng = CombatRNG(1)
+        self.participant.apply_status_volatile(VolatileStatusEnum.CONFUSION, rng)
+        turns = self.participant.volatile_counters[VolatileStatusEnum.CONFUSION.value]
+        events = [self.participant.before_move(self.opponent, rng) for _ in range(turns)]
+        self.assertEqual(events[-1], CAN_MOVE, "A creature should move on the turn it snaps out of confusion")
+        self.assertTrue(set(events) <= {CAN_MOVE, EVENT_CONFUSED}, "Confusion can only prevent a move by hurting the creature")
+        self.assertEqual(self.participant.current_hp < self.participant.max_hp, EVENT_CONFUSED in events, "Only hurting itself should deal damage")
+        self.assertEqual(self.participant.volatile_statuses, 0, "Confusion should wear off once its turns run out")
+        self._assert_hash_consistent()
+
+    def test_compile_volatile_effect(self):
+        self.assertEqual(compile_effect("FLINCH"), (OP_VOLATILE_STATUS, VolatileStatusEnum.FLINCH.value, 0), "Volatile statuses should compile to their bit")
+
+
+if __name__ == "__main__":
+    unittest.main()
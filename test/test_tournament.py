@@ -0,0 +1,64 @@
+import unittest
+
+from creature_combat.engine.combat_manager import CombatManager, DRAW, PLAYER_1_WIN, PLAYER_2_WIN
+from creature_combat.engine.tournament import Tournament, play_games
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestTournament(unittest.TestCase):
+    def setUp(self) -> None:
+        self.creature_dex = CreatureDex(_CREATUREDEX_PATH)
+        self.move_list = MoveList(_MOVE_LIST_PATH)
+
+    def _make_teams(self):
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        teams = []
+        for name, move_name in (("Bulbasaur", "Vine Whip"), ("Charmander", "Ember"), ("Squirtle", "Water Gun")):
+            moves = (self.move_list.get("Tackle"), self.move_list.get(move_name), self.move_list.get("Growl"), None)
+            teams.append([self.creature_dex.get(name).make_creature(5, ivs, evs, CreatureNatureEnum.BASHFUL, moves)])
+        return teams
+
+    def test_run_battle(self):
+        teams = self._make_teams()
+        result = CombatManager(rng=0).run_battle(SuperEffectivePlayer(teams[0]), SuperEffectivePlayer(teams[1]))
+        self.assertIn(result, (DRAW, PLAYER_1_WIN, PLAYER_2_WIN), "run_battle returned an unknown result")
+        self.assertEqual(result, PLAYER_2_WIN, "Charmander should beat Bulbasaur with super effective moves")
+
+    def test_results_are_aggregated(self):
+        result = Tournament(self._make_teams(), SuperEffectivePlayer, 10, workers=1, chunk_size=3, seed=0).run()
+        games = result.games
+        for i in range(3):
+            for j in range(3):
+                self.assertEqual(games[i, j], 0 if i == j else 10, f"Teams {i} and {j} played the wrong number of games")
+        self.assertTrue((result.losses == result.wins.T).all(), "Losses should mirror wins")
+
+    def test_workers_match_in_process(self):
+        in_process = Tournament(self._make_teams(), SuperEffectivePlayer, 8, workers=1, chunk_size=4, seed=5).run()
+        pooled = Tournament(self._make_teams(), SuperEffectivePlayer, 8, workers=2, chunk_size=4, seed=5).run()
+        self.assertTrue((in_process.wins == pooled.wins).all(), "Results changed with the number of workers")
+        self.assertTrue((in_process.draws == pooled.draws).all(), "Draws changed with the number of workers")
+
+    def test_players_closed_after_every_game(self):
+        closed = []
+        class ClosingPlayer(SuperEffectivePlayer):
+            def close(self):
+                closed.append(self)
+        teams = self._make_teams()
+        play_games(teams[0], teams[1], ClosingPlayer, 3, rng=0)
+        self.assertEqual(len(closed), 6, "Both players of every game should be closed")
+
+    def test_shared_creatures_rejected(self):
+        teams = self._make_teams()
+        with self.assertRaises(AssertionError):
+            Tournament([teams[0], teams[0]], SuperEffectivePlayer, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
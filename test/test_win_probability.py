@@ -0,0 +1,64 @@
+import unittest
+
+from creature_combat.engine.win_probability import estimate_win_probability, win_probability_interval
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.utils.math_utils import beta_quantile, regularized_incomplete_beta
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestIntervals(unittest.TestCase):
+    def test_incomplete_beta(self):
+        # Beta(1, 1) is uniform and Beta(2, 1) has CDF x^2
+        for x in (0.1, 0.5, 0.9):
+            self.assertAlmostEqual(regularized_incomplete_beta(1.0, 1.0, x), x, msg="Uniform CDF was wrong")
+            self.assertAlmostEqual(regularized_incomplete_beta(2.0, 1.0, x), x * x, msg="Beta(2, 1) CDF was wrong")
+        self.assertAlmostEqual(beta_quantile(0.25, 2.0, 1.0), 0.5, msg="Beta(2, 1) quantile was wrong")
+
+    def test_intervals_contain_proportion(self):
+        for method in ("WILSON", "BETA"):
+            for wins, games in ((0, 50), (25, 50), (50, 50)):
+                with self.subTest(method=method, wins=wins):
+                    lower, upper = win_probability_interval(wins, games, 0.95, method)
+                    self.assertTrue(0.0 <= lower <= wins / games <= upper <= 1.0, "Interval does not contain the observed proportion")
+
+    def test_more_games_narrow_interval(self):
+        small = win_probability_interval(30, 100)
+        large = win_probability_interval(300, 1000)
+        self.assertLess(large[1] - large[0], small[1] - small[0], "More games should narrow the interval")
+
+
+class TestEstimateWinProbability(unittest.TestCase):
+    def setUp(self) -> None:
+        self.creature_dex = CreatureDex(_CREATUREDEX_PATH)
+        self.move_list = MoveList(_MOVE_LIST_PATH)
+
+    def _make_team(self, name: str, move_name: str):
+        moves = (self.move_list.get(move_name), None, None, None)
+        return [self.creature_dex.get(name).make_creature(5, IndividualValues.make_zero(), EffortValues.make_zero(), CreatureNatureEnum.BASHFUL, moves)]
+
+    def test_lopsided_matchup_stops_early(self):
+        estimate = estimate_win_probability(self._make_team("Charmander", "Ember"), self._make_team("Bulbasaur", "Tackle"), SuperEffectivePlayer, seed=0)
+        self.assertTrue(estimate.converged, "A lopsided matchup should converge")
+        self.assertLessEqual(estimate.games, 500, "A lopsided matchup should stop after a few hundred games")
+        self.assertGreater(estimate.lower, 0.9, "Ember should almost always beat Bulbasaur")
+
+    def test_close_matchup_meets_half_width(self):
+        team_1 = self._make_team("Bulbasaur", "Tackle")
+        team_2 = self._make_team("Squirtle", "Tackle")
+        estimate = estimate_win_probability(team_1, team_2, SuperEffectivePlayer, half_width=0.05, seed=0)
+        self.assertTrue(estimate.converged, "The estimate did not converge")
+        self.assertLessEqual(estimate.half_width, 0.05, "The interval is wider than requested")
+        self.assertLessEqual(estimate.lower, estimate.probability, "The interval does not contain the estimate")
+        self.assertLessEqual(estimate.probability, estimate.upper, "The interval does not contain the estimate")
+        capped = estimate_win_probability(team_1, team_2, SuperEffectivePlayer, half_width=0.001, max_games=200, seed=0)
+        self.assertFalse(capped.converged, "The estimate should not converge within max_games")
+        self.assertEqual(capped.games, 200, "The estimate played more than max_games")
+
+
+if __name__ == "__main__":
+    unittest.main()
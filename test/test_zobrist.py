@@ -0,0 +1,103 @@
+import unittest
+
+from creature_combat.engine.combat_manager import CombatManager
+from creature_combat.engine.transposition_table import TranspositionTable
+from creature_combat.creature.creaturedex import CreatureDex
+from creature_combat.creature.creature_natures import CreatureNatureEnum
+from creature_combat.creature.effort_values import EffortValues
+from creature_combat.creature.individual_values import IndividualValues
+from creature_combat.moves.move_list import MoveList
+from creature_combat.statuses.non_volatile_statuses import NonVolatileStatusEnum
+from creature_combat.utils.path_utils import _CREATUREDEX_PATH, _MOVE_LIST_PATH
+from creature_combat.utils.rng import CombatRNG
+from demos.demo_players import SuperEffectivePlayer
+
+
+class TestZobristHash(unittest.TestCase):
+    def setUp(self) -> None:
+        creature_dex = CreatureDex(_CREATUREDEX_PATH)
+        move_list = MoveList(_MOVE_LIST_PATH)
+        ivs = IndividualValues.make_zero()
+        evs = EffortValues.make_zero()
+        def make(name, *move_names):
+            moves = tuple(move_list.get(move_name) for move_name in move_names) + (None,) * (4 - len(move_names))
+            return creature_dex.get(name).make_creature(8, ivs, evs, CreatureNatureEnum.BASHFUL, moves)
+        self.player_1 = SuperEffectivePlayer([make("Bulbasaur", "Tackle", "Growl"), make("Squirtle", "Tackle", "Water Gun")])
+        self.player_2 = SuperEffectivePlayer([make("Charmander", "Scratch", "Ember"), make("Squirtle", "Tail Whip", "Tackle")])
+        self.manager = CombatManager(rng=6)
+        self.manager.reset(self.player_1, self.player_2)
+
+    def _assert_consistent(self):
+        for player in (self.player_1, self.player_2):
+            self.assertEqual(player.participant.zobrist_hash, player.participant._compute_zobrist_hash(), "Participant hash drifted from its state")
+            for creature in player.creature_team.values():
+                self.assertEqual(creature.zobrist_hash, creature._compute_zobrist_hash(), "Creature hash drifted from its state")
+
+    def test_incremental_matches_full(self):
+        # Starts hashing before anything changes, so every change below goes through the incremental updates
+        self.manager.state_hash()
+        self.player_2.participant.apply_status_non_volatile(NonVolatileStatusEnum.BPSN)
+        self.player_1.participant.apply_status_non_volatile(NonVolatileStatusEnum.SLP, CombatRNG(0))
+        while len(self.player_1.alive_creature()) > 0 and len(self.player_2.alive_creature()) > 0:
+            self.manager.step_round(self.player_1, self.player_2)
+            self._assert_consistent()
+
+    def test_keys_generated_on_first_use(self):
+        creatures = [creature for player in (self.player_1, self.player_2) for creature in player.creature_team.values()]
+        participants = [self.player_1.participant, self.player_2.participant]
+        self.assertTrue(all(creature._hp_keys is None for creature in creatures), "Creatures should not generate keys before they are hashed")
+        self.assertTrue(all(participant._stage_keys is None for participant in participants), "Participants should not generate keys before they are hashed")
+        for _ in range(3):
+            self.manager.step_round(self.player_1, self.player_2)
+        self.assertTrue(all(creature._hp_keys is None for creature in creatures), "Playing without hashing should not generate keys")
+        self.manager.state_hash()
+        self.assertTrue(all(creature._hp_keys is not None for creature in creatures), "Hashing the battle should generate the keys")
+        self._assert_consistent()
+        self.manager.step_round(self.player_1, self.player_2)
+        self._assert_consistent()
+
+    def test_restore_restores_hash(self):
+        state = self.manager.snapshot()
+        state_hash = self.manager.state_hash()
+        self.manager.step_round(self.player_1, self.player_2)
+        self.assertNotEqual(self.manager.state_hash(), state_hash, "Playing a round should change the hash")
+        self.manager.restore(state)
+        self.assertEqual(self.manager.state_hash(), state_hash, "Restoring should restore the hash")
+        self._assert_consistent()
+
+    def test_transpositions_hash_the_same(self):
+        participant = self.player_2.participant
+        state = self.manager.snapshot()
+        participant.adjust_stage(0, -1)
+        participant.adjust_stage(1, -2)
+        participant.damage(3)
+        first_order = self.manager.state_hash()
+        self.manager.restore(state)
+        participant.damage(3)
+        participant.adjust_stage(1, -2)
+        participant.adjust_stage(0, -1)
+        self.assertEqual(self.manager.state_hash(), first_order, "The same state reached in a different order hashed differently")
+        participant.adjust_stage(0, 1)
+        self.assertNotEqual(self.manager.state_hash(), first_order, "A different stage should hash differently")
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_store_and_get(self):
+        table = TranspositionTable(size_log2=4)
+        table.store(0x1234, "a")
+        self.assertEqual(table.get(0x1234), "a", "Stored value was not returned")
+        self.assertIsNone(table.get(0x1235), "A missing hash should return the default")
+        self.assertEqual((table.hits, table.misses), (1, 1), "Hits and misses were not counted")
+
+    def test_depth_preferred_replacement(self):
+        table = TranspositionTable(size_log2=4)
+        # Both hashes map to slot 1 of the 16 slots
+        self.assertTrue(table.store(0x11, "deep", depth=5))
+        self.assertFalse(table.store(0x21, "shallow", depth=1), "A shallower entry should not replace a deeper one")
+        self.assertTrue(table.store(0x21, "deeper", depth=6), "A deeper entry should replace a shallower one")
+        self.assertNotIn(0x11, table, "The replaced hash should be gone")
+        self.assertEqual(len(table), 1, "Replacing should not grow the table")
+
+
+if __name__ == "__main__":
+    unittest.main()